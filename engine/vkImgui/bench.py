@@ -0,0 +1,181 @@
+# benchmarks for the binding generators.
+#
+# runs functions.py, structs.py and enumtool.py over the vendored headers and
+# times every stage separately: parse (cheader), translate (the generator
+# itself, with cold type tables) and emit (writing the zig file through
+# sink.Sink). Peak memory is measured in a separate traced run so tracemalloc
+# doesn't skew the timings, indexLoad is the time to get the same
+# declarations from a warm declindex file instead of parsing. Results are
+# written as json, pass an earlier result as --baseline to fail on
+# regressions.
+#
+#   python bench.py -o bench.json
+#   python bench.py --baseline bench.json --threshold 0.25
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, 'cimgui', 'imgui'))
+
+import cheader
+import declindex
+import enumtool
+import functions
+import sink
+import structs
+
+# header, function prefix, header whose enums it refers to
+defaultHeaders = [
+    ('cimgui/imgui/cimgui.h', 'ig', None),
+    ('cimgui/imgui/cimgui2.h', 'ig', None),
+    ('cimplot/cimplot.h', 'ImPlot_', 'cimgui/imgui/cimgui.h'),
+]
+
+generators = ['functions', 'structs', 'enums']
+
+
+def resetState():
+    # the type tables are module level memos, every run starts cold
+    functions.types.table.clear()
+    structs.types.table.clear()
+    structs.opaqueStructs.clear()
+
+
+def translate(generator, header, prefix, known):
+    # returns (generated declarations, number of input declarations)
+    if generator == 'functions':
+        generated = functions.generateFunctions(header, prefix=prefix)
+        return generated, len(generated)
+    if generator == 'structs':
+        return structs.generateStructs(header), len(header.structs)
+    generated, _ = enumtool.generateEnums(header, known)
+    return generated, len(header.enums)
+
+
+def runOnce(generator, path, prefix, known, outPath):
+    resetState()
+    start = time.perf_counter()
+    header = cheader.parseHeaderFile(path)
+    parsed = time.perf_counter()
+    generated, decls = translate(generator, header, prefix, known)
+    translated = time.perf_counter()
+    with sink.Sink(outPath) as out:
+        out.write('\n\n'.join(generated), '\n')
+    emitted = time.perf_counter()
+    return {
+        'parse': parsed - start,
+        'translate': translated - parsed,
+        'emit': emitted - translated,
+        'decls': decls,
+        'bytes': out.bytesWritten,
+    }
+
+
+def peakMemory(generator, path, prefix, known, outPath):
+    tracemalloc.start()
+    try:
+        runOnce(generator, path, prefix, known, outPath)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def indexLoad(path, repeat, outDir):
+    indexDir = os.path.join(outDir, 'index')
+    declindex.load(path, indexDir)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        declindex.load(path, indexDir)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def summarize(samples):
+    return {'best': min(samples), 'median': statistics.median(samples)}
+
+
+def benchmark(generator, path, prefix, known, repeat, outDir):
+    outPath = os.path.join(outDir, f'{generator}.zig')
+    runs = [runOnce(generator, path, prefix, known, outPath) for _ in range(repeat)]
+    stages = {stage: summarize([r[stage] for r in runs]) for stage in ('parse', 'translate', 'emit')}
+    total = summarize([r['parse'] + r['translate'] + r['emit'] for r in runs])
+    decls = runs[0]['decls']
+    return {
+        'header': os.path.relpath(path, here),
+        'generator': generator,
+        'decls': decls,
+        'bytes': runs[0]['bytes'],
+        **stages,
+        'total': total,
+        'declsPerSecond': decls / total['median'] if total['median'] > 0 else None,
+        'peakMemory': peakMemory(generator, path, prefix, known, outPath),
+        'indexLoad': indexLoad(path, repeat, outDir),
+    }
+
+
+def compare(results, baseline, threshold):
+    # regressions in median total time beyond threshold, as report lines
+    old = {(r['header'], r['generator']): r for r in baseline['results']}
+    lines = []
+    for r in results:
+        b = old.get((r['header'], r['generator']))
+        if b is None:
+            continue
+        ratio = r['total']['median'] / b['total']['median']
+        if ratio > 1 + threshold:
+            lines.append(f"{r['header']} {r['generator']}: {b['total']['median'] * 1000:.1f}ms -> "
+                         f"{r['total']['median'] * 1000:.1f}ms ({(ratio - 1) * 100:+.0f}%)")
+    return lines
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='times the binding generators over the vendored headers')
+    parser.add_argument('--output', '-o', help='write the json results here instead of stdout')
+    parser.add_argument('--repeat', '-n', type=int, default=5, help='timed runs per header and generator')
+    parser.add_argument('--generator', '-g', action='append', choices=generators, help='only run this generator, can be given multiple times')
+    parser.add_argument('--baseline', help='earlier json results to compare against, exits with 1 on a regression')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown against the baseline, 0.2 is 20%%')
+    args = parser.parse_args(argv[1:])
+
+    results = []
+    with tempfile.TemporaryDirectory() as outDir:
+        for header, prefix, base in defaultHeaders:
+            path = os.path.join(here, header)
+            known = enumtool.enumValues(cheader.parseHeaderFile(os.path.join(here, base))) if base else None
+            for generator in args.generator or generators:
+                r = benchmark(generator, path, prefix, known, args.repeat, outDir)
+                results.append(r)
+                print(f"{r['header']} {generator}: parse {r['parse']['median'] * 1000:.1f}ms, "
+                      f"translate {r['translate']['median'] * 1000:.1f}ms, emit {r['emit']['median'] * 1000:.1f}ms, "
+                      f"index load {r['indexLoad']['median'] * 1000:.1f}ms, {r['declsPerSecond']:.0f} decls/s, "
+                      f"peak {r['peakMemory'] / 1024 / 1024:.1f}MiB", file=sys.stderr)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+    with sink.Sink(args.output) as out:
+        out.write(json.dumps(report, indent=4), '\n')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print('regression: ' + line, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
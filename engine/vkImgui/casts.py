@@ -0,0 +1,80 @@
+# cast classification for generated wrappers.
+#
+# built once per run from the rule lists in functions.py. Exact rules
+# (bitcast, enum, singleton) are frozenset lookups, the substring based
+# ptrcast rules are folded into one precompiled regex. Every hit is counted so
+# duplicated and never used rules can be reported.
+
+import collections
+import re
+
+
+class CastClassifier:
+    def __init__(self, bitcasts, ptrcasts, enumcasts, singletons=()):
+        self.rules = {
+            'bitcast': list(bitcasts),
+            'ptrcast': list(ptrcasts),
+            'enum': list(enumcasts),
+            'singleton': list(singletons),
+        }
+        self.bitcasts = frozenset(bitcasts)
+        self.enumcasts = frozenset(enumcasts)
+        self.singletons = frozenset(singletons)
+        self.ptrcastMatcher = None
+        if ptrcasts:
+            # longest first so the reported rule is the most specific one
+            alternatives = sorted(set(ptrcasts), key=len, reverse=True)
+            self.ptrcastMatcher = re.compile('|'.join(re.escape(p) for p in alternatives))
+        self.used = collections.Counter()
+
+    def classify(self, t):
+        # same precedence as the original linear scans: exact bitcast, then
+        # ptrcast substrings, then exact enum
+        if t in self.bitcasts:
+            self.used['bitcast', t] += 1
+            return 'bitcast'
+        if self.ptrcastMatcher is not None:
+            m = self.ptrcastMatcher.search(t)
+            if m is not None:
+                self.used['ptrcast', m.group()] += 1
+                return 'ptrcast'
+        if t in self.enumcasts:
+            self.used['enum', t] += 1
+            return 'enum'
+        return None
+
+    def isSingleton(self, name):
+        if name in self.singletons:
+            self.used['singleton', name] += 1
+            return True
+        return False
+
+    def duplicates(self):
+        rv = []
+        for kind, names in self.rules.items():
+            for name, count in collections.Counter(names).items():
+                if count > 1:
+                    rv.append((kind, name, count))
+        return rv
+
+    def shadowed(self):
+        # exact enum rules that can never fire because a bitcast rule wins
+        return sorted(self.bitcasts & self.enumcasts)
+
+    def unused(self):
+        rv = []
+        for kind, names in self.rules.items():
+            for name in dict.fromkeys(names):
+                if self.used[kind, name] == 0:
+                    rv.append((kind, name))
+        return rv
+
+    def report(self):
+        lines = []
+        for kind, name, count in self.duplicates():
+            lines.append(f'duplicate {kind} rule: {name} (listed {count} times)')
+        for name in self.shadowed():
+            lines.append(f'shadowed enum rule: {name} (also a bitcast rule)')
+        for kind, name in self.unused():
+            lines.append(f'unused {kind} rule: {name}')
+        return lines
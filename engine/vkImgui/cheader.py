@@ -0,0 +1,471 @@
+# single pass lexer and declaration parser for the cimgui family of headers
+# (cimgui.h, cimgui2.h, cimplot.h).
+#
+# tokenize() walks the header text exactly once with a single master regex and
+# evaluates the simple #if/#ifdef/#ifndef/#else/#endif blocks cimgui uses while
+# it goes, so the token stream only ever contains code from active branches.
+# parseHeader() then walks that token stream once and builds the declaration
+# AST that functions.py, structs.py and enumtool.py all consume.
+
+import re
+from dataclasses import dataclass, field
+
+DEFAULT_DEFINES = frozenset(['CIMGUI_DEFINE_ENUMS_AND_STRUCTS'])
+
+TOKEN_SPEC = [
+    ('nl', r'\n'),
+    ('ws', r'[ \t\r\f\v]+'),
+    ('comment', r'//[^\n]*|/\*.*?\*/'),
+    ('pp', r'\#(?:[^\n\\]|\\.)*'),
+    ('ellipsis', r'\.\.\.'),
+    ('string', r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\''),
+    ('ident', r'[A-Za-z_][A-Za-z0-9_]*'),
+    ('number', r'0[xX][0-9a-fA-F]+[uUlL]*|[0-9]+(?:\.[0-9]*)?(?:[eE][+-]?[0-9]+)?[uUlLfF]*|\.[0-9]+[fF]?'),
+    ('op', r'<<|>>|::|->|&&|\|\||[{}()\[\];,*=|<>&~:.+\-/!?%^]'),
+    ('other', r'.'),
+]
+
+scanner = re.compile('|'.join(f'(?P<{name}>{rx})' for name, rx in TOKEN_SPEC), re.S)
+
+ppDirective = re.compile(r'#\s*(\w+)\s*(.*)', re.S)
+ppDefined = re.compile(r'defined\s*\(?\s*(\w+)\s*\)?')
+
+
+class HeaderParseError(Exception):
+    pass
+
+
+def evalCondition(expr, defines):
+    # only handles what cimgui emits: defined X, !defined X, && / || chains and
+    # literal numbers. Unknown identifiers evaluate to 0 like they would in cpp.
+    expr = ppDefined.sub(lambda m: '1' if m.group(1) in defines else '0', expr)
+    expr = expr.replace('&&', ' and ').replace('||', ' or ')
+    expr = re.sub(r'!(?!=)', ' not ', expr)
+    expr = re.sub(r'[A-Za-z_]\w*', lambda m: m.group(0) if m.group(0) in ('and', 'or', 'not') else '0', expr)
+    try:
+        return bool(eval(expr, {'__builtins__': {}}))
+    except Exception:
+        return False
+
+
+def tokenize(text, defines=DEFAULT_DEFINES):
+    # returns one flat token stream for the file: a list of (kind, text, line)
+    defines = set(defines)
+    tokens = []
+    append = tokens.append
+    # each entry is [currentlyActive, anyBranchTaken, parentActive]
+    stack = []
+    active = True
+    line = 1
+    for m in scanner.finditer(text):
+        kind = m.lastgroup
+        if kind == 'nl':
+            line += 1
+            continue
+        if kind == 'ws':
+            continue
+        value = m.group()
+        if kind == 'comment':
+            line += value.count('\n')
+            continue
+        if kind == 'pp':
+            line += value.count('\n')
+            d = ppDirective.match(value.replace('\\\n', ' '))
+            if d is None:
+                continue
+            directive, rest = d.group(1), d.group(2).strip()
+            if directive in ('ifdef', 'ifndef', 'if'):
+                if directive == 'ifdef':
+                    cond = rest.split()[0] in defines if rest else False
+                elif directive == 'ifndef':
+                    cond = rest.split()[0] not in defines if rest else False
+                else:
+                    cond = evalCondition(rest, defines)
+                stack.append([active and cond, cond, active])
+                active = active and cond
+            elif directive == 'elif':
+                if not stack:
+                    raise HeaderParseError(f'line {line}: #elif without #if')
+                top = stack[-1]
+                cond = not top[1] and evalCondition(rest, defines)
+                top[0] = top[2] and cond
+                top[1] = top[1] or cond
+                active = top[0]
+            elif directive == 'else':
+                if not stack:
+                    raise HeaderParseError(f'line {line}: #else without #if')
+                top = stack[-1]
+                top[0] = top[2] and not top[1]
+                top[1] = True
+                active = top[0]
+            elif directive == 'endif':
+                if not stack:
+                    raise HeaderParseError(f'line {line}: #endif without #if')
+                active = stack.pop()[2]
+            elif directive == 'define' and active and rest:
+                defines.add(re.split(r'[\s(]', rest, 1)[0])
+            elif directive == 'undef' and active and rest:
+                defines.discard(rest.split()[0])
+            continue
+        if active:
+            append((kind, value, line))
+    return tokens
+
+
+@dataclass
+class CType:
+    base: str
+    const: bool = False
+    # one entry per pointer level, True when that pointer itself is const
+    pointers: list = field(default_factory=list)
+    array: list = field(default_factory=list)
+    funcPtr: 'FuncPtr' = None
+
+    @property
+    def spelling(self):
+        # the normalized C spelling the original string based converters
+        # expect, e.g. 'const char*' or 'ImVec2*'
+        if self.funcPtr is not None:
+            return self.funcPtr.spelling
+        s = ('const ' if self.const else '') + self.base
+        for isConst in self.pointers:
+            s += '* const' if isConst else '*'
+        return s
+
+    def decayed(self):
+        # array parameters decay to pointers like they do in C
+        if not self.array:
+            return self
+        return CType(self.base, self.const, self.pointers + [False] * len(self.array), [], self.funcPtr)
+
+
+@dataclass
+class Param:
+    type: CType
+    name: str
+
+
+@dataclass
+class FuncPtr:
+    returnType: CType
+    args: list
+    variadic: bool = False
+
+    @property
+    def spelling(self):
+        args = ','.join(a.type.spelling + (' ' + a.name if a.name else '') for a in self.args)
+        if self.variadic:
+            args += ',...' if args else '...'
+        return f'{self.returnType.spelling}(*)({args})'
+
+
+@dataclass
+class Function:
+    name: str
+    returnType: CType
+    args: list
+    variadic: bool = False
+    line: int = 0
+
+    @property
+    def spelling(self):
+        # normalized declaration text, stable across whitespace-only changes
+        args = ','.join(a.type.spelling + (' ' + a.name if a.name else '') + ''.join(f'[{d}]' for d in a.type.array) for a in self.args)
+        if self.variadic:
+            args += ',...' if args else '...'
+        return f'{self.returnType.spelling} {self.name}({args})'
+
+
+@dataclass
+class Field:
+    type: CType
+    name: str
+    bits: int = None
+    # set for anonymous unions / structs nested inside a struct body
+    nested: 'Struct' = None
+
+
+@dataclass
+class Struct:
+    name: str
+    fields: list
+    kind: str = 'struct'
+    line: int = 0
+
+    @property
+    def isVector(self):
+        return self.name.startswith('ImVector_')
+
+
+@dataclass
+class Enum:
+    name: str
+    # list of (name, valueText or None)
+    values: list
+    line: int = 0
+
+
+@dataclass
+class Typedef:
+    name: str
+    type: CType
+    line: int = 0
+
+
+@dataclass
+class Header:
+    functions: list = field(default_factory=list)
+    structs: list = field(default_factory=list)
+    enums: list = field(default_factory=list)
+    typedefs: list = field(default_factory=list)
+
+
+QUALIFIERS = frozenset(['const', 'volatile', 'struct', 'union', 'enum'])
+MULTIWORD = frozenset(['unsigned', 'long', 'short', 'signed', 'int', 'char', 'double'])
+
+
+class Parser:
+    def __init__(self, tokens, apiMacro='CIMGUI_API'):
+        self.tokens = tokens
+        self.pos = 0
+        self.apiMacro = apiMacro
+        self.header = Header()
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        if i < len(self.tokens):
+            return self.tokens[i][1]
+        return None
+
+    def next(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok[1]
+
+    def line(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][2]
+        return 0
+
+    def expect(self, value):
+        got = self.next()
+        if got != value:
+            raise HeaderParseError(f'line {self.tokens[self.pos - 1][2]}: expected {value!r} got {got!r}')
+
+    def skipStatement(self):
+        depth = 0
+        while self.pos < len(self.tokens):
+            t = self.next()
+            if t in ('{', '(', '['):
+                depth += 1
+            elif t in ('}', ')', ']'):
+                depth -= 1
+            elif t == ';' and depth <= 0:
+                return
+
+    def parse(self):
+        while self.pos < len(self.tokens):
+            t = self.peek()
+            if t == self.apiMacro:
+                self.next()
+                self.parseFunction()
+            elif t == 'typedef':
+                self.next()
+                self.parseTypedef()
+            elif t in ('struct', 'union') and self.peek(2) == '{':
+                kind = self.next()
+                line = self.line()
+                name = self.next()
+                self.header.structs.append(Struct(name, self.parseBody(), kind, line))
+                self.expect(';')
+            else:
+                self.skipStatement()
+        return self.header
+
+    def parseBaseType(self):
+        const = False
+        words = []
+        while True:
+            t = self.peek()
+            if t == 'const':
+                const = True
+                self.next()
+            elif t in QUALIFIERS:
+                self.next()
+            elif t in MULTIWORD and (not words or words[-1] in MULTIWORD):
+                words.append(self.next())
+            elif not words and t is not None and (t[0].isalpha() or t[0] == '_'):
+                words.append(self.next())
+                # C++ qualified names only show up in inactive branches but be lenient
+                while self.peek() == '::':
+                    self.next()
+                    words[-1] += '::' + self.next()
+            else:
+                break
+        return CType(' '.join(words), const)
+
+    def parsePointers(self, ctype):
+        while self.peek() in ('*', 'const'):
+            if self.next() == '*':
+                ctype.pointers.append(False)
+            elif ctype.pointers:
+                ctype.pointers[-1] = True
+        return ctype
+
+    def parseArrayDims(self, ctype):
+        while self.peek() == '[':
+            self.next()
+            dim = []
+            depth = 0
+            while self.peek() != ']' or depth:
+                t = self.next()
+                depth += t == '['
+                depth -= t == ']'
+                dim.append(t)
+            self.next()
+            ctype.array.append(''.join(dim))
+        return ctype
+
+    def parseParams(self):
+        # assumes the opening paren was consumed, consumes the closing one
+        args = []
+        variadic = False
+        while self.peek() != ')':
+            if self.peek() == '...':
+                self.next()
+                variadic = True
+            else:
+                ctype = self.parsePointers(self.parseBaseType())
+                name = ''
+                if self.peek() == '(':
+                    ctype, name = self.parseFuncPtrDeclarator(ctype)
+                elif self.tokens[self.pos][0] == 'ident':
+                    name = self.next()
+                self.parseArrayDims(ctype)
+                if not (ctype.base == 'void' and not ctype.pointers and not name):
+                    args.append(Param(ctype, name))
+            if self.peek() == ',':
+                self.next()
+        self.expect(')')
+        return args, variadic
+
+    def parseFuncPtrDeclarator(self, returnType):
+        # parses '(*name)(args)' following an already parsed return type
+        self.expect('(')
+        self.expect('*')
+        name = ''
+        if self.peek() != ')':
+            name = self.next()
+        self.expect(')')
+        self.expect('(')
+        args, variadic = self.parseParams()
+        return CType('', funcPtr=FuncPtr(returnType, args, variadic)), name
+
+    def parseFunction(self):
+        line = self.line()
+        returnType = self.parsePointers(self.parseBaseType())
+        name = self.next()
+        self.expect('(')
+        args, variadic = self.parseParams()
+        self.skipStatement()
+        self.header.functions.append(Function(name, returnType, args, variadic, line))
+
+    def parseBody(self):
+        self.expect('{')
+        fields = []
+        while self.peek() != '}':
+            if self.peek() in ('union', 'struct') and (self.peek(1) == '{' or self.peek(2) == '{'):
+                kind = self.next()
+                line = self.line()
+                name = '' if self.peek() == '{' else self.next()
+                nested = Struct(name, self.parseBody(), kind, line)
+                fieldName = ''
+                if self.peek() != ';':
+                    fieldName = self.next()
+                self.expect(';')
+                fields.append(Field(None, fieldName, nested=nested))
+                continue
+            base = self.parseBaseType()
+            while True:
+                ctype = self.parsePointers(CType(base.base, base.const))
+                if self.peek() == '(':
+                    ctype, name = self.parseFuncPtrDeclarator(ctype)
+                else:
+                    name = self.next()
+                self.parseArrayDims(ctype)
+                bits = None
+                if self.peek() == ':':
+                    self.next()
+                    bits = int(self.next(), 0)
+                fields.append(Field(ctype, name, bits))
+                if self.peek() != ',':
+                    break
+                self.next()
+            self.expect(';')
+        self.expect('}')
+        return fields
+
+    def parseTypedef(self):
+        line = self.line()
+        t = self.peek()
+        if t == 'enum' and (self.peek(1) == '{' or self.peek(2) == '{'):
+            self.next()
+            if self.peek() != '{':
+                self.next()
+            values = self.parseEnumBody()
+            name = self.next()
+            self.expect(';')
+            self.header.enums.append(Enum(name, values, line))
+            return
+        if t in ('struct', 'union') and (self.peek(1) == '{' or self.peek(2) == '{'):
+            kind = self.next()
+            if self.peek() != '{':
+                self.next()
+            fields = self.parseBody()
+            name = self.next()
+            self.expect(';')
+            self.header.structs.append(Struct(name, fields, kind, line))
+            return
+        if t not in ('struct', 'union') and self.peek(1) == '<':
+            # C++ template typedefs, nothing to translate
+            self.skipStatement()
+            return
+        ctype = self.parsePointers(self.parseBaseType())
+        if self.peek() == '(':
+            ctype, name = self.parseFuncPtrDeclarator(ctype)
+        else:
+            name = self.next()
+        self.parseArrayDims(ctype)
+        self.expect(';')
+        self.header.typedefs.append(Typedef(name, ctype, line))
+
+    def parseEnumBody(self):
+        self.expect('{')
+        values = []
+        while self.peek() != '}':
+            name = self.next()
+            value = None
+            if self.peek() == '=':
+                self.next()
+                parts = []
+                depth = 0
+                while depth or self.peek() not in (',', '}'):
+                    tok = self.next()
+                    depth += tok == '('
+                    depth -= tok == ')'
+                    parts.append(tok)
+                value = ' '.join(parts)
+            values.append((name, value))
+            if self.peek() == ',':
+                self.next()
+        self.expect('}')
+        return values
+
+
+def parseHeader(text, defines=DEFAULT_DEFINES, apiMacro='CIMGUI_API'):
+    return Parser(tokenize(text, defines), apiMacro).parse()
+
+
+def parseHeaderFile(path, defines=DEFAULT_DEFINES, apiMacro='CIMGUI_API'):
+    with open(path) as f:
+        return parseHeader(f.read(), defines, apiMacro)
@@ -1,144 +1,187 @@
-import re
-inp3 = """
-"""
-
-enumLists = []
-for s in inp3.split("typedef enum {"):
-    raw = s.strip('\n ')
-    linesSplit = []
-    for l in raw.split('\n'):
-        if '}' in l:
-            continue
-        linesSplit.append(l.strip(' \n'))
-
-    x = '\n'.join(linesSplit)
-    enumLists.append(x)
-
-inp4 = """
-    ImGuiPlotType_Lines,
-    ImGuiPlotType_Histogram
-"""
-
-# these are normal-ass enums
-inp5 = """
-    ImGuiContextHookType_NewFramePre,
-    ImGuiContextHookType_NewFramePost,
-    ImGuiContextHookType_EndFramePre,
-    ImGuiContextHookType_EndFramePost,
-    ImGuiContextHookType_RenderPre,
-    ImGuiContextHookType_RenderPost,
-    ImGuiContextHookType_Shutdown,
-    ImGuiContextHookType_PendingRemoval_
-"""
-
-x = inp5.split('line')
-preamble = ''
-for l in x:
-    line = l.strip(' ')
-    if len(line) > 0:
-        s = line.split('_')
-        preamble = s[0] + '_'
-        preamble = preamble.lstrip('\n ')
-        break
-print('   ', inp5.replace(preamble, '').replace('_', '').strip('\n ') + ',')
-print('    _,')
-
-
-def convertName(name):
-    ostr = ""
-    first = True
-    for c in name:
-        if c.isupper():
-            if first:
-                first = False
-            else:
-                ostr += '_'
-        ostr += c.lower()
-    return ostr
-
-def convertFlagName(x):
-    if "COUNT" in x:
-        return "count"
-    flagName = x.split('_')[1].split('=')[0]
-    flagNameZig = convertName(flagName)
-    return flagNameZig
-
-def convertSingle(line):
-    s = line.split(' ')
-    flagNameZig = convertFlagName(s[0])
-    if flagNameZig != 'none':
-        return flagNameZig + f': bool = false, // {line}'
-
-
-def convertCompositeFlag(convert):
-    left, right = convert.split('=')
-    right = right.strip(' ')
-    left = left.strip(' ')
-    constName = convertFlagName(left)
-    rhsFlagsRaw = right.split('|')
-    rhsFlags = []
-
-    for r in rhsFlagsRaw:
-        rhsFlags.append(convertFlagName(r.strip(' ,')))
-
-    ostr = f"pub const {constName} = ." + '{ '
-    for r in rhsFlags:
-        ostr += f'.{r} = true, '
-    ostr = ostr[0:-2]
-    ostr += '};'
-    return ostr
-
-def convertFlags(inputString):
-    #print("input: ", inputString)
-    if len(inputString.strip(' ')) <= 0:
-        return
-    singles = []
-    composites = []
-    firstLine = None
-    for l in inputString.split('\n'):
-        line = l.strip(' ')
-        if len(line) <= 0:
-            continue
-        firstLine = line
-        if '=' in line:
-            left, right = line.split('=')
-            if "_" in right:
-                composites.append(convertCompositeFlag(line))
-            else:
-                singles.append(convertSingle(line))
-        else:
-            singles.append(convertFlagName(line.strip(' ,')) + ': bool = false, // ' + line)# this is a single flag
-
-    structName = firstLine.split('_')[0][5:]
-    print(f'pub const {structName} = packed struct(c_int)' + '{')
-
-    count = 0
-    for s in singles:
-        if s is not None:
-            count += 1
-            print('    ' + s)
-
-    if count != 32:
-        print(f"    reserved: u{32 - count} = 0, // reserved, don't use")
-
-    if len(composites):
-        print('')
-
-    for x in composites:
-        print('    ' + x)
-
-    print('};')
-
-for e in enumLists:
-    convertFlags(e)
-
-def convertEnum(enumStr):
-    name = None
-    for l in enumStr.split('\n'):
-        line = l.strip(' ,')
-        if 'typedef enum {' in line:
-            continue
-        if len(line) == 0:
-            continue
-        name = convertFlagName(line)
-        print(name)
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+import cheader
+import declindex
+import naming
+import prune
+import sink
+
+
+# batch mode: every enum in the header is evaluated in one pass. The
+# ImGuiXxxFlagsPrivate_ enums extend ImGuiXxxFlags_ and are merged into the
+# same packed struct, like ImGuiDataTypePrivate_ extends ImGuiDataType_.
+
+def evalEnumValue(text, known):
+    expr = ''
+    for kind, tok, _ in cheader.tokenize(text):
+        if kind == 'ident':
+            if tok not in known:
+                raise ValueError(f'unknown enum value {tok} in "{text}"')
+            expr += f'({known[tok]})'
+        elif kind == 'number':
+            expr += tok.rstrip('uUlL')
+        elif kind == 'op' and tok in ('<<', '>>', '|', '&', '~', '+', '-', '*', '(', ')'):
+            expr += tok
+        else:
+            raise ValueError(f'unsupported enum expression "{text}"')
+    value = eval(expr, {'__builtins__': {}})
+    # wrap into c_int, 1 << 31 and masks like it are negative in C
+    value &= 0xFFFFFFFF
+    if value >= 1 << 31:
+        value -= 1 << 32
+    return value
+
+def evaluateEnums(header, known=None):
+    # returns [(enum, [(name, value, text)])] with implicit values filled in.
+    # known holds values of other headers' enums, cimplot refers to ImGuiCond_
+    known = dict(known or {})
+    rv = []
+    for enum in header.enums:
+        values = []
+        nextValue = 0
+        for name, text in enum.values:
+            value = nextValue if text is None else evalEnumValue(text, known)
+            known[name] = value
+            values.append((name, value, text))
+            nextValue = value + 1
+        rv.append((enum, values))
+    return rv
+
+def memberPrefix(enum):
+    # ImGuiInputTextFlagsPrivate_ holds ImGuiInputTextFlags_ members
+    first = enum.values[0][0]
+    for i, c in enumerate(first):
+        if c == '_':
+            return first[:i + 1]
+    return enum.name
+
+def isFlags(enum, values):
+    if 'Flags' in enum.name:
+        return True
+    # ImGuiCond_ is a flag set without saying so
+    shifted = [text for _, value, text in values if value != 0]
+    return len(shifted) > 0 and all(text is not None and '<<' in text for text in shifted)
+
+def zigEnumName(prefix):
+    name = prefix.rstrip('_')
+    if name.startswith('ImGui'):
+        return name[5:]
+    if name.startswith('Im'):
+        return name[2:]
+    return name
+
+def zigTagName(name):
+    if not (name[0].isalpha() or name[0] == '_'):
+        return '@"' + name + '"'
+    return name
+
+def generateFlags(zigName, cname, members):
+    fields = {}
+    consts = []
+    for name, value, text in members:
+        memberName = name[name.index('_') + 1:].rstrip('_')
+        comment = name if text is None else f'{name} = {text}'
+        if value > 0 and value & (value - 1) == 0 and value.bit_length() - 1 not in fields:
+            fields[value.bit_length() - 1] = (naming.convertVarName(memberName), comment)
+        elif memberName != 'None':
+            consts.append((naming.convertVarName(memberName), value))
+
+    lines = [f'pub const {zigName} = packed struct(c_int) {{ // {cname}']
+    bit = 0
+    for fieldBit in sorted(fields):
+        if fieldBit > bit:
+            lines.append(f'    _reserved{bit}: u{fieldBit - bit} = 0,')
+        lines.append(f'    {fields[fieldBit][0]}: bool = false, // {fields[fieldBit][1]}')
+        bit = fieldBit + 1
+    if bit < 32:
+        lines.append(f"    reserved: u{32 - bit} = 0, // reserved, don't use")
+
+    if consts:
+        lines.append('')
+    for name, value in consts:
+        bits = [b for b in range(32) if (value & 0xFFFFFFFF) >> b & 1]
+        if all(b in fields for b in bits):
+            inits = ', '.join(f'.{fields[b][0]} = true' for b in bits)
+            lines.append(f'    pub const {name}: @This() = .{{' + (f' {inits} ' if inits else '') + '};')
+        else:
+            lines.append(f'    pub const {name}: @This() = @bitCast(@as(c_int, {value}));')
+    lines.append('};')
+    return '\n'.join(lines)
+
+def generateEnum(zigName, cname, members, prefix):
+    tags = {}
+    aliases = []
+    lines = [f'pub const {zigName} = enum(c_int) {{ // {cname}']
+    for name, value, _ in members:
+        tag = name[len(prefix):] if name.startswith(prefix) else name
+        if tag.rstrip('_') and tag.rstrip('_') not in tags.values():
+            tag = tag.rstrip('_')
+        tag = zigTagName(tag)
+        # zig enums can't repeat a value, later spellings become aliases
+        if value in tags:
+            aliases.append((tag, tags[value]))
+            continue
+        tags[value] = tag
+        lines.append(f'    {tag} = {value},')
+    lines.append('    _,')
+    if aliases:
+        lines.append('')
+    for tag, target in aliases:
+        lines.append(f'    pub const {tag}: {zigName} = .{target};')
+    lines.append('};')
+    return '\n'.join(lines)
+
+def enumValues(header, known=None):
+    rv = dict(known or {})
+    for _, values in evaluateEnums(header, rv):
+        for name, value, _ in values:
+            rv[name] = value
+    return rv
+
+def generateEnums(header, known=None, only=None):
+    # one scan over every enum, grouped by member prefix so private
+    # extensions land in their base type
+    groups = {}
+    for enum, values in evaluateEnums(header, known):
+        if not values or (only is not None and enum.name not in only):
+            continue
+        prefix = memberPrefix(enum)
+        if prefix not in groups:
+            groups[prefix] = [enum, isFlags(enum, values), []]
+        groups[prefix][2].extend(values)
+
+    out = []
+    flagCount = 0
+    for prefix, (enum, flags, members) in groups.items():
+        if flags:
+            flagCount += 1
+            out.append(generateFlags(zigEnumName(prefix), enum.name, members))
+        else:
+            out.append(generateEnum(zigEnumName(prefix), enum.name, members, prefix))
+    return out, flagCount
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='generates zig packed structs and enums from cimgui enums')
+    parser.add_argument('input', nargs='?', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cimgui.h'))
+    parser.add_argument('--output', '-o', help='write to this file (atomically replaced) instead of stdout')
+    parser.add_argument('--no-index', action='store_true', help='reparse the header instead of loading it from the declaration index')
+    parser.add_argument('--deps', help='only emit the enums listed in a functions.py --prune --deps file')
+    parser.add_argument('--base', action='append', default=[], help='header whose enum values the input refers to, e.g. cimgui.h for cimplot.h')
+    args = parser.parse_args(argv[1:])
+
+    indexDir = None if args.no_index else declindex.defaultDir
+    known = {}
+    for base in args.base:
+        known = enumValues(declindex.load(base, indexDir), known)
+    header = declindex.load(args.input, indexDir)
+    only = set(prune.readDeps(args.deps)['enums']) if args.deps else None
+    generated, flagCount = generateEnums(header, known, only)
+    with sink.Sink(args.output) as out:
+        out.write('\n\n'.join(generated), '\n')
+    print(f'{len(header.enums)} enums -> {flagCount} flag structs, {len(generated) - flagCount} enums', file=sys.stderr)
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -1,217 +1,253 @@
-inp = """
-struct ImDrawListSplitter
-{
-    int _Current;
-    int _Count;
-    ImVector_ImDrawChannel _Channels;
-};
-"""
-
-'''
-struct ImGuiInputEvent
-{
-    ImGuiInputEventType Type;
-    ImGuiInputSource Source;
-    union
-    {
-        ImGuiInputEventMousePos MousePos;
-        ImGuiInputEventMouseWheel MouseWheel;
-        ImGuiInputEventMouseButton MouseButton;
-        ImGuiInputEventMouseViewport MouseViewport;
-        ImGuiInputEventKey Key;
-        ImGuiInputEventText Text;
-        ImGuiInputEventAppFocused AppFocused;
-    };
-    bool AddedByTestEngine;
-};
-'''
-
-def parseFunction(line):
-    line = line.strip(' \n;')
-    line = line.replace(')', '')
-    s = line.split('(')
-    returnType = convertTypeName(s[0].strip(' '))
-    funcName = convertVarName(s[1].strip('* '))
-    funcName = funcName.replace('__', '_')
-    argsRaw = s[2].split(',')
-    args = []
-    for a in argsRaw:
-        if len(a) >= 1:
-            args.append(a)
-
-    argList = []
-    for a in args:
-        a = a.strip(' ')
-        tname, vname = splitTypeAndLabel(a)
-        argList.append([convertTypeName(tname), convertVarName(vname)])
-
-    return (returnType, funcName, argList)
-
-def convertVarName(name):
-    ostr = ""
-    first = True
-    for c in name:
-        if c.isupper():
-            if first:
-                first = False
-            else:
-                ostr += '_'
-        ostr += c.lower()
-    return ostr
-
-def convertTypeName(entry):
-    if 'void*' == entry:
-        return '?*anyopaque'
-    if 'void' == entry:
-        return 'void'
-
-    isVector = False
-    if entry[:8] == 'ImVector':
-        isVector = True
-
-    typeName = entry
-    const = False
-    pointer = False
-    if '*' in typeName:
-        pointer = True;
-        typeName = typeName.strip('*')
-
-    if typeName[:5] == 'const':
-        const = True
-        typeName = typeName[5:]
-        typeName = typeName.strip(' ')
-
-    if '_' in typeName:
-        x = typeName.split('_')
-        typeName = x[-1]
-    rv = convertInner(typeName)
-
-    if const:
-        rv = 'const ' + rv
-
-    if pointer:
-        rv = '[*c]' + rv
-
-    if isVector:
-        rv += 'Vector'
-
-    return rv
-
-def convertInner(typeName):
-    if 'float' == typeName:
-        return 'f32'
-    if 'char' == typeName:
-        return 'u8'
-    if 'int' == typeName:
-        return 'c_int'
-    if 'short' == typeName:
-        return 'c_short'
-    if 'unsigned int' == typeName:
-        return 'c_uint'
-    if 'unsigned short' == typeName:
-        return 'c_ushort'
-    if 'unsigned long' == typeName:
-        return 'c_ulong'
-    if 'long' == typeName:
-        return 'c_long'
-    if 'longlong' == typeName:
-        return 'c_longlong'
-    if 'ImGui' == typeName[0:5]:
-        return typeName[5:]
-    if 'Im' == typeName[0:2]:
-        return typeName[2:]
-    return typeName
-
-def splitTypeAndLabel(line):
-    spaceIndex = line.rindex(' ')
-    left = line[:spaceIndex]
-    right = line[spaceIndex + 1:]
-    return left, right
-
-def generateStruct(inp):
-    inp = inp.strip('\n ')
-    defs = []
-    name = ''
-    nameLine = ''
-
-    for l in inp.split('\n'):
-        line = l.strip(' {')
-        if len(line) < 1:
-            continue
-        if 'struct' in line:
-            name = line.split(' ')[1]
-            nameLine = line
-            continue
-        if '{' in line:
-            continue
-        if '}' in line:
-            continue
-
-        if '(*' not in line:
-            typeName, varName = splitTypeAndLabel(line)
-            varName = varName.strip(';')
-            arraySpec = None
-            if '[' in varName:
-                varName, rhs = varName.split('[')
-                arraySpec = rhs.strip(']')
-            varName =  convertVarName(varName)
-            if arraySpec is not None:
-                arraySpec = arraySpec.replace('ImGui', '')
-                arraySpec = arraySpec.replace('_', '.')
-                # varName += '[' + arraySpec + ']'
-            typeName = convertTypeName(typeName)
-            defs.append([typeName, varName, arraySpec])
-        else:
-            returnType, funcName, argList = parseFunction(line)
-            ostr = funcName + ': *const fn ('
-            first = True
-            for arg in argList:
-                if first:
-                    first = False
-                else:
-                    ostr += ', '
-                ostr += arg[0]
-            ostr += ') ' + returnType + ','
-            defs.append([None, None, None, ostr])
-
-    print(f'pub const {convertTypeName(name)} = extern struct ' + '{ // ' + nameLine)
-    for d in defs:
-        if d[0] is not None:
-            typedef = d[0]
-            if d[2] is not None:
-                typedef = f"[{d[2]}]" + d[0]
-            print(f"    {d[1]}: {typedef},")
-        elif d[3] is not None:
-            print('   ', d[3])
-
-    print('};')
-
-generateStruct(inp)
-
-
-structs = """
-ImDrawCmd {int Size;int Capacity;ImDrawCmd* Data;} ImVector_ImDrawCmd;
-ImDrawIdx {int Size;int Capacity;ImDrawIdx* Data;} ImVector_ImDrawIdx;
-"""
-
-"""
-unsigned_char {int Size;int Capacity;unsigned char* Data;} ImVector_unsigned_char;
-typedef struct ImPool_ImGuiTable {ImVector_ImGuiTable Buf;ImGuiStorage Map;ImPoolIdx FreeIdx;ImPoolIdx AliveCount;} ImPool_ImGuiTable;
-typedef struct ImPool_ImGuiTabBar {ImVector_ImGuiTabBar Buf;ImGuiStorage Map;ImPoolIdx FreeIdx;ImPoolIdx AliveCount;} ImPool_ImGuiTabBar;
-typedef struct ImChunkStream_ImGuiWindowSettings {ImVector_char Buf;} ImChunkStream_ImGuiWindowSettings;
-typedef struct ImChunkStream_ImGuiTableSettings {ImVector_char Buf;} ImChunkStream_ImGuiTableSettings;
-"""
-
-for i in structs.split('\n'):
-    sname = i.split(' ')[0]
-    tname = convertTypeName(sname)
-    # print(sname, tname)
-    o = f"""
-pub const {tname}Vector = extern struct {{ // struct ImVector_{sname}
-    size: c_int,
-    capacity: c_int,
-    data: [*c]{tname},
-}};
-    """
-    print(o)
-
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+import cheader
+import declindex
+import naming
+import prune
+import sink
+import typetable
+
+# walks every struct (and every typedef struct ImVector_*, ImPool_*, ...) in
+# the header in one pass and emits a zig extern struct for each, followed by
+# comptime layout checks against the translate-c version of the same struct.
+# The output expects `std` and the cImport as `c` in scope, like src/cimgui.zig.
+
+layoutCheckPrelude = '''fn checkLayout(comptime T: type, comptime C: type, comptime fields: []const [2][]const u8) void {
+    if (@sizeOf(T) != @sizeOf(C))
+        @compileError(std.fmt.comptimePrint("{s}: size {d} != {d} in C", .{ @typeName(T), @sizeOf(T), @sizeOf(C) }));
+    inline for (fields) |f| {
+        if (@offsetOf(T, f[0]) != @offsetOf(C, f[1]))
+            @compileError(std.fmt.comptimePrint("{s}.{s}: offset {d} != {d} in C", .{ @typeName(T), f[0], @offsetOf(T, f[0]), @offsetOf(C, f[1]) }));
+    }
+}
+'''
+
+types = typetable.TypeTable(naming.convertTypeName)
+
+# C structs emitted as zig opaques, filled in by generateStructs. C pointers
+# can't point at opaque types so these get a plain optional pointer instead.
+opaqueStructs = {}
+
+def convertCType(ctype):
+    if ctype.funcPtr is not None:
+        return convertFuncPtrType(ctype.funcPtr)
+    if ctype.base == 'void' and ctype.pointers:
+        rv = '?*const anyopaque' if ctype.const else '?*anyopaque'
+        pointers = ctype.pointers[1:]
+        constNext = ctype.pointers[0]
+    elif ctype.base in opaqueStructs and ctype.pointers:
+        rv = '?*' + ('const ' if ctype.const else '') + types.zigType(ctype.base)
+        pointers = ctype.pointers[1:]
+        constNext = ctype.pointers[0]
+    else:
+        rv = types.zigType(ctype.base)
+        pointers = ctype.pointers
+        constNext = ctype.const
+    # built inside out, a const pointer level makes the level above point to const
+    for isConst in pointers:
+        rv = '[*c]' + ('const ' if constNext else '') + rv
+        constNext = isConst
+    return rv
+
+def convertFuncPtrType(funcPtr):
+    # exact C callable type, so callbacks can be called without a cast.
+    # Optional like translate-c has it, C leaves them NULL until a backend
+    # installs one and zig code has to be able to test for that
+    args = []
+    for arg in funcPtr.args:
+        t = arg.type.decayed()
+        if t.base == 'void' and not t.pointers and t.funcPtr is None:
+            continue
+        args.append(convertCType(t))
+    if funcPtr.variadic:
+        args.append('...')
+    return ''.join([
+        '?*const fn (', ', '.join(args), ') callconv(.C) ', convertCType(funcPtr.returnType),
+    ])
+
+def generateCallbackTypes(header, only=None):
+    out = []
+    for t in header.typedefs:
+        if t.type.funcPtr is not None and not t.type.pointers and (only is None or t.name in only):
+            out.append(f'pub const {types.zigType(t.name)} = {convertFuncPtrType(t.type.funcPtr)}; // {t.name}')
+    return out
+
+def convertArrayDim(dim):
+    if dim.isdigit():
+        return dim
+    # enum counts and expressions are evaluated on the C side
+    expr = ''
+    for tok in cheader.tokenize(dim):
+        if tok[0] == 'ident':
+            expr += 'c.' + tok[1]
+        else:
+            expr += tok[1]
+    return f'@as(usize, @intCast({expr}))'
+
+def convertFieldType(ctype):
+    rv = convertCType(ctype)
+    for dim in reversed(ctype.array):
+        rv = f'[{convertArrayDim(dim)}]' + rv
+    return rv
+
+def hasBitfields(struct):
+    for field in struct.fields:
+        if field.bits is not None:
+            return True
+        if field.nested is not None and hasBitfields(field.nested):
+            return True
+    return False
+
+def findOpaque(structs):
+    # translate-c can't lay out bitfields and demotes those structs to opaque,
+    # anything holding one of them by value can't be laid out either.
+    # returns struct name -> reason
+    opaque = {s.name: 'has bitfields' for s in structs if hasBitfields(s)}
+    changed = True
+    while changed:
+        changed = False
+        for s in structs:
+            if s.name in opaque:
+                continue
+            for field in s.fields:
+                if field.type is not None and not field.type.pointers and field.type.base in opaque:
+                    opaque[s.name] = f'holds {field.type.base} by value'
+                    changed = True
+                    break
+    return opaque
+
+def generateFields(fields, indent, unnamed):
+    lines = []
+    for field in fields:
+        if field.nested is not None:
+            name = naming.zigIdent(naming.convertVarName(field.name)) if field.name else f'unnamed_{unnamed[0]}'
+            unnamed[0] += 1
+            lines.append(f'{indent}{name}: extern {field.nested.kind} {{')
+            lines.extend(generateFields(field.nested.fields, indent + '    ', [0]))
+            lines.append(f'{indent}}},')
+        else:
+            lines.append(f'{indent}{naming.zigIdent(naming.convertVarName(field.name))}: {convertFieldType(field.type)},')
+    return lines
+
+def generateStruct(struct, zigName, opaque):
+    nameLine = f'{struct.kind} {struct.name}'
+    if struct.name in opaque:
+        return f'pub const {zigName} = opaque {{}}; // {nameLine}, {opaque[struct.name]}'
+
+    lines = [f'pub const {zigName} = extern {struct.kind} ' + '{ // ' + nameLine]
+    lines.extend(generateFields(struct.fields, '    ', [0]))
+    if struct.isVector:
+        lines.extend(generateVectorHelpers(struct))
+    lines.append('};')
+    return '\n'.join(lines)
+
+def vectorElement(struct):
+    # the Data field's pointee, None when zig can't have a slice of it
+    for field in struct.fields:
+        if field.name == 'Data' and field.type is not None and field.type.pointers:
+            t = field.type
+            element = cheader.CType(t.base, t.const, t.pointers[:-1])
+            if not element.pointers and (element.base in opaqueStructs or element.base == 'void'):
+                return None
+            return convertCType(element)
+    return None
+
+def generateVectorHelpers(struct):
+    # views over Data so whole buffers can be handed to @memcpy at once
+    element = vectorElement(struct)
+    if element is None:
+        return []
+    return [
+        '',
+        f'    pub const Element = {element};',
+        '',
+        '    pub fn asSlice(self: *@This()) []Element {',
+        '        if (self.size <= 0) return self.data[0..0];',
+        '        return self.data[0..@intCast(self.size)];',
+        '    }',
+        '',
+        '    pub fn asConstSlice(self: *const @This()) []const Element {',
+        '        if (self.size <= 0) return self.data[0..0];',
+        '        return self.data[0..@intCast(self.size)];',
+        '    }',
+        '',
+        '    // copies every element to the front of dest in one go, returns how many',
+        '    pub fn copyTo(self: *const @This(), dest: []Element) usize {',
+        '        const items = self.asConstSlice();',
+        '        @memcpy(dest[0..items.len], items);',
+        '        return items.len;',
+        '    }',
+    ]
+
+def generateLayoutCheck(struct, zigName):
+    lines = [f'    checkLayout({zigName}, c.{struct.name}, &.{{']
+    for field in struct.fields:
+        if field.nested is None:
+            lines.append(f'        .{{ "{naming.convertVarName(field.name)}", "{field.name}" }},')
+    lines.append('    });')
+    return '\n'.join(lines)
+
+def structAliases(header):
+    # typedef ImBitArray_<...> ImBitArrayForNamedKeys; names the struct after the alias
+    names = set(s.name for s in header.structs)
+    aliases = {}
+    for t in header.typedefs:
+        if t.type.funcPtr is None and not t.type.pointers and t.type.base in names and t.type.base != t.name:
+            aliases[t.type.base] = t.name
+    return aliases
+
+def generateStructs(header, only=None, checks=True, pointerOnly=()):
+    # pointerOnly structs are declared opaque, see prune.py
+    structs = [s for s in header.structs if s.fields and (only is None or s.name in only)]
+    aliases = structAliases(header)
+    opaque = findOpaque(header.structs)
+    for name in pointerOnly:
+        opaque.setdefault(name, 'only used through pointers')
+    opaqueStructs.clear()
+    opaqueStructs.update(opaque)
+
+    out = []
+    callbacks = generateCallbackTypes(header, only)
+    if callbacks:
+        out.append('\n'.join(callbacks))
+    laidOut = []
+    for struct in structs:
+        zigName = types.zigType(aliases.get(struct.name, struct.name))
+        out.append(generateStruct(struct, zigName, opaque))
+        if struct.name not in opaque:
+            laidOut.append((struct, zigName))
+
+    if checks and laidOut:
+        out.append(layoutCheckPrelude)
+        lines = ['comptime {']
+        for struct, zigName in laidOut:
+            lines.append(generateLayoutCheck(struct, zigName))
+        lines.append('}')
+        out.append('\n'.join(lines))
+    return out
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='generates zig extern structs for cimgui structs')
+    parser.add_argument('input', nargs='?', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cimgui.h'))
+    parser.add_argument('--output', '-o', help='write to this file (atomically replaced) instead of stdout')
+    parser.add_argument('--only', action='append', help='only emit this C struct or callback typedef, can be given multiple times')
+    parser.add_argument('--deps', help='only emit the structs listed in a functions.py --prune --deps file')
+    parser.add_argument('--no-index', action='store_true', help='reparse the header instead of loading it from the declaration index')
+    parser.add_argument('--no-checks', action='store_true', help='skip the comptime @sizeOf/@offsetOf assertions')
+    args = parser.parse_args(argv[1:])
+
+    header = declindex.load(args.input, None if args.no_index else declindex.defaultDir)
+    only = args.only
+    pointerOnly = ()
+    if args.deps:
+        deps = prune.readDeps(args.deps)
+        only = (only or []) + deps['structs'] + deps['opaque'] + deps['typedefs']
+        pointerOnly = deps['opaque']
+    with sink.Sink(args.output) as out:
+        out.write('\n\n'.join(generateStructs(header, only, not args.no_checks, pointerOnly)), '\n')
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,149 @@
+# persistent declaration index for the cimgui headers.
+#
+# cheader.parseHeaderFile() output is stored in a small binary file keyed on
+# the header contents, the parser source and the defines it was parsed with.
+# functions.py, structs.py, enumtool.py and genall.py go through load(), so
+# only the first tool to see a header version parses it, the rest map the
+# index in and unpickle it. Identical C types are shared before pickling,
+# which keeps the file small and the load fast.
+#
+# layout: MAGIC, a little endian u32 version, the 40 byte hex key, then the
+# pickled cheader.Header.
+
+import gc
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+import cheader
+
+MAGIC = b'CDECLIDX'
+INDEX_VERSION = 1
+PREAMBLE = struct.Struct('<8sI40s')
+
+defaultDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.declindex')
+
+declClasses = (
+    cheader.CType, cheader.Param, cheader.FuncPtr, cheader.Function,
+    cheader.Field, cheader.Struct, cheader.Enum, cheader.Typedef, cheader.Header,
+)
+
+
+def indexKey(path, defines=cheader.DEFAULT_DEFINES, apiMacro='CIMGUI_API'):
+    h = hashlib.sha1()
+    h.update(str(INDEX_VERSION).encode())
+    with open(cheader.__file__, 'rb') as f:
+        h.update(f.read())
+    h.update(repr((sorted(defines), apiMacro)).encode())
+    with open(path, 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def indexPath(indexDir, path, key):
+    return os.path.join(indexDir, f'{os.path.basename(path)}-{key[:16]}.idx')
+
+
+class DeclPickler(pickle.Pickler):
+    # dataclasses are rebuilt through their constructor from a plain tuple,
+    # a lot cheaper to unpickle than the default __dict__ restore
+    def reducer_override(self, obj):
+        if isinstance(obj, declClasses):
+            return type(obj), tuple(obj.__dict__.values())
+        return NotImplemented
+
+
+def shareTypes(header):
+    # the few hundred distinct C types repeat across thousands of
+    # declarations, pickle only writes each shared object once
+    pool = {}
+
+    def share(t):
+        if t is None:
+            return None
+        if t.funcPtr is not None:
+            t.funcPtr.returnType = share(t.funcPtr.returnType)
+            shareParams(t.funcPtr.args)
+            return t
+        return pool.setdefault((t.base, t.const, tuple(t.pointers), tuple(t.array)), t)
+
+    def shareParams(params):
+        for p in params:
+            p.type = share(p.type)
+
+    def shareFields(fields):
+        for f in fields:
+            f.type = share(f.type)
+            if f.nested is not None:
+                shareFields(f.nested.fields)
+
+    for f in header.functions:
+        f.returnType = share(f.returnType)
+        shareParams(f.args)
+    for s in header.structs:
+        shareFields(s.fields)
+    for t in header.typedefs:
+        t.type = share(t.type)
+    return header
+
+
+def read(path, key):
+    # returns the stored header, or None when the file is missing or stale
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+    with f:
+        if os.fstat(f.fileno()).st_size < PREAMBLE.size:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, storedKey = PREAMBLE.unpack_from(mm)
+            if magic != MAGIC or version != INDEX_VERSION or storedKey != key.encode():
+                return None
+            with memoryview(mm) as view:
+                # the unpickled graph is acyclic, no point collecting mid load
+                gc.disable()
+                try:
+                    return pickle.loads(view[PREAMBLE.size:])
+                finally:
+                    gc.enable()
+
+
+def write(path, key, header):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with open(fd, 'wb') as f:
+            f.write(PREAMBLE.pack(MAGIC, INDEX_VERSION, key.encode()))
+            DeclPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(shareTypes(header))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+    # older versions of the same header are never read again
+    stem = os.path.basename(path).rsplit('-', 1)[0] + '-'
+    for name in os.listdir(directory):
+        if name.startswith(stem) and name.endswith('.idx') and os.path.join(directory, name) != path:
+            os.unlink(os.path.join(directory, name))
+
+
+def load(path, indexDir=defaultDir, defines=cheader.DEFAULT_DEFINES, apiMacro='CIMGUI_API'):
+    # parsed declarations for path, from the index when it's current.
+    # indexDir=None always parses and leaves the index alone.
+    if indexDir is None:
+        return cheader.parseHeaderFile(path, defines, apiMacro)
+    key = indexKey(path, defines, apiMacro)
+    idx = indexPath(indexDir, path, key)
+    try:
+        header = read(idx, key)
+    except (pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+        header = None
+    if header is None:
+        header = cheader.parseHeaderFile(path, defines, apiMacro)
+        write(idx, key, header)
+    return header
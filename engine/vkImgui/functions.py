@@ -1,512 +1,692 @@
-inp = """
-CIMGUI_API ImVec2* igImVec2_ImVec2_Nil(const char* x);
-CIMGUI_API void ImVec2_destroy(ImVec2* self);
-CIMGUI_API ImVec2* ImVec2_ImVec2_Float(float _x,float _y);
-CIMGUI_API ImVec4* ImVec4_ImVec4_Nil(void);
-CIMGUI_API void ImVec4_destroy(ImVec4* self);
-CIMGUI_API ImVec4* ImVec4_ImVec4_Float(float _x,float _y,float _z,float _w);
-CIMGUI_API ImGuiContext* igCreateContext(ImFontAtlas* shared_font_atlas);
-CIMGUI_API void igDestroyContext(ImGuiContext* ctx);
-CIMGUI_API ImGuiContext* igGetCurrentContext(void);
-CIMGUI_API void igSetCurrentContext(ImGuiContext* ctx);
-CIMGUI_API ImGuiIO* igGetIO(void);
-CIMGUI_API ImGuiStyle* igGetStyle(void);
-CIMGUI_API void igNewFrame(void);
-CIMGUI_API void igEndFrame(void);
-CIMGUI_API void igRender(void);
-CIMGUI_API ImDrawData* igGetDrawData(void);
-CIMGUI_API void igShowDemoWindow(bool* p_open);
-"""
-
-
-singletonList = [
-    'getStyle',
-    'getIO',
-    'getCurrentContext',
-    'getMainViewport',
-]
-
-bitcastList = [
-    "Vec2",
-    "Vec4",
-    "Cond",
-    "WindowFlags",
-    "DockNodeFlags",
-    "ConstCharPtrVector",
-    "CharVector",
-    "WcharVector",
-    "InputTextFlags",
-    "TreeNodeFlags",
-    "PopupFlags",
-    "SelectableFlags",
-    "ComboFlags",
-    "TabBarFlags",
-    "TabItemFlags",
-    "TableColumnFlags",
-    "TableFlags",
-    "TableRowFlags",
-    "TableBgTarget",
-    "FocusedFlags",
-    "HoveredFlags",
-    "DragDropFlags",
-    "DockNodeFlags",
-    "ModFlags",
-    "ConfigFlags",
-    "BackendFlags",
-    "ColorEditFlags",
-    "SliderFlags",
-    "Cond",
-    "Style",
-    "KeyData",
-    "FontAtlas",
-    "FontAtlasCustomRect",
-    "FontConfig",
-    "Io",
-    "Viewport",
-    "PlatformMonitorVector",
-    "ViewportPtrVector",
-    "PlatformIO",
-    "PlatformMonitor",
-    "ViewportFlags",
-    "DrawFlags",
-    "DrawListFlags",
-    "FontAtlasFlags",
-    "PlatformImeData",
-    "StbUndoRecord",
-    "StbUndoState",
-    "StbTexteditState",
-    "StbTexteditRow",
-    "Vec1",
-    "Rect",
-    "BitVector",
-    "Vec2ih",
-    "DrawListSharedData",
-    "DrawListPtrVector",
-    "DrawList",
-    "DrawDataBuilder",
-    "ItemFlags",
-    "ItemStatusFlags",
-    "SeparatorFlags",
-    "TextFlags",
-    "TooltipFlags",
-    "NextWindowDataFlags",
-    "NextItemDataFlags",
-    "ActivateFlags",
-    "ScrollFlags",
-    "NavHighlightFlags",
-    "NavDirSourceFlags",
-    "NavMoveFlags",
-    "OldColumnFlags",
-    "DebugLogFlags",
-    "DataTypeTempStorage",
-    "DataTypeInfo",
-    "ColorMod",
-    "StyleMod",
-    "ComboPreviewData",
-    "GroupData",
-    "MenuColumns",
-    "InputTextState",
-    "PopupData",
-    "NextWindowData",
-    "NextItemData",
-    "LastItemData",
-    "StackSizes",
-    "WindowStackData",
-    "PtrOrIndex",
-    "BitArrayForNamedKeys",
-    "InputEventMousePos",
-    "InputEventMouseWheel",
-    "InputEventMouseButton",
-    "InputEventMouseViewport",
-    "InputEventKey",
-    "InputEventText",
-    "InputEventAppFocused",
-    "InputEvent",
-    "ListClipperRange",
-    "ListClipperData",
-    "ListClipperRangeVector",
-    "NavItemData",
-    "OldColumnData",
-    "OldColumnDataVector",
-    "WindowPtrVector",
-    "WindowDockStyle",
-    "DockRequestVector",
-    "DockNodeSettingsVector",
-    "DockContext",
-    "ViewportP",
-    "WindowSettings",
-    "SettingsHandler",
-    "MetricsConfig",
-    "StackLevelInfoVector",
-    "StackTool",
-    "ContextHook",
-    "InputEventVector",
-    "WindowStackDataVector",
-    "ColorModVector",
-    "StyleModVector",
-    "IDVector",
-    "ItemFlagsVector",
-    "GroupDataVector",
-    "PopupDataVector",
-    "ViewportPPtrVector",
-    "ListClipperDataVector",
-    "TableTempDataVector",
-    "TableVector",
-    "TabBarVector",
-    "PtrOrIndexVector",
-    "ShrinkWidthItemVector",
-    "ShrinkWidthItem",
-    "SettingsHandlerVector",
-    "ContextHookVector",
-    "u8Vector",
-    "TablePool",
-    "TabBarPool",
-    "TabItemVector",
-    "WindowSettingsChunkStream",
-    "TableSettingsChunkStream",
-    "TabItem",
-    "TabBar",
-    "TableTempData",
-    "TableSettings",
-    "FontBuilderIO",
-    "TableCellData",
-    "TableInstanceData",
-    "TableColumnSpan",
-    "TableColumnIdxSpan",
-    "TableCellDataSpan",
-    "TableInstanceDataVector",
-    "TableColumnSortSpecsVector",
-    "TextBuffer",
-    "Context",
-    "DrawChannelVector",
-    "DrawChannel",
-    "DrawCmdVector",
-    "DrawIdxVector",
-    "f32Vector",
-    "FontPtrVector",
-    "Payload",
-    "ListClipper",
-    "Storage",
-    "StoragePairVector",
-    "WindowClass",
-    "InputTextCallbackData",
-    "SizeCallbackData",
-    "DrawData",
-    "FontGlyphVector",
-    "Font",
-    "DrawCmd",
-    "DrawVert",
-    "DrawCmdHeader",
-    "DrawListSplitter",
-]
-
-
-ptrcastList = [
-    "WindowClass"
-]
-
-enumcastList = [
-    "StyleVar",
-    "DataType",
-    "DataTypePrivate",
-    "NavLayer",
-    "DataAuthority",
-    "DockNodeState",
-    "WindowDockStyleCol",
-    "ContextHookType",
-    "Dir",
-    "NavInput",
-    "LayoutType",
-    "LogType",
-    "Axis",
-    "PlotType",
-    "PopupPositionPolicy",
-    "MouseButton",
-    "MouseCursor",
-    "SortDirection",
-    "Key",
-    "StyleColor",
-    "KeyPrivate",
-    "InputSource",
-    "NavReadMode",
-    "InputEventType",
-]
-
-with open('functions.txt') as f:
-    inp = f.read()
-    pass
-
-def splitTypeAndLabel(line):
-    if ' ' in line:
-        spaceIndex = line.rindex(' ')
-        left = line[:spaceIndex]
-        right = line[spaceIndex + 1:]
-        return left, right
-    else:
-        return line, ''
-
-def convertInner(typeName):
-    if 'size_t' == typeName:
-        return 'usize'
-    if 'double' == typeName:
-        return 'f64'
-    if 'float' == typeName:
-        return 'f32'
-    if 'char' == typeName:
-        return 'u8'
-    if 'int' == typeName:
-        return 'c_int'
-    if 'short' == typeName:
-        return 'c_short'
-    if 'unsigned char' == typeName:
-        return 'u8'
-    if 'unsigned int' == typeName:
-        return 'c_uint'
-    if 'unsigned short' == typeName:
-        return 'c_ushort'
-    if 'unsigned long' == typeName:
-        return 'c_ulong'
-    if 'long' == typeName:
-        return 'c_long'
-    if 'longlong' == typeName:
-        return 'c_longlong'
-    if 'ImGui' == typeName[0:5]:
-        return typeName[5:]
-    if 'Im' == typeName[0:2]:
-        return typeName[2:]
-    return typeName
-
-def parseFuncName(line):
-    line = line.strip(' \n;')
-    line = line.replace(')', '')
-    s = line.split('(')
-    funcName = s[1].strip('* ')
-    return funcName
-
-def parseFunction(line):
-    line = line.strip(' \n;')
-    line = line.replace(')', '')
-    s = line.split('(')
-    returnType = convertTypeName(s[0].strip(' '))
-    funcName = convertVarName(s[1].strip('* '))
-    funcName = funcName.replace('__', '_')
-    argsRaw = s[2].split(',')
-    args = []
-    for a in argsRaw:
-        if len(a) >= 1:
-            args.append(a)
-
-    argList = []
-    for a in args:
-        a = a.strip(' ')
-        tname, vname = splitTypeAndLabel(a)
-        argList.append([convertTypeName(tname), convertVarName(vname)])
-
-    return (returnType, funcName, argList)
-
-def convertFuncName(funcName):
-    returnType, funcName, argList = parseFunction(line)
-    ostr = funcName + ': *const fn ('
-    first = True
-    for arg in argList:
-        if first:
-            first = False
-        else:
-            ostr += ', '
-        ostr += arg[0]
-    ostr += ') ' + returnType + ','
-    return ostr
-
-def convertVarName(name):
-    ostr = ""
-    first = True
-    for c in name:
-        if c.isupper():
-            if first:
-                first = False
-            else:
-                ostr += '_'
-        ostr += c.lower()
-    return ostr
-
-def convertTypeName(entry):
-    if 'void*' == entry:
-        return '?*anyopaque'
-    if 'void' == entry:
-        return 'void'
-    if 'size_t' == entry:
-        return 'c_usize'
-
-    # print('---')
-    # print(entry)
-    entry = entry.strip(' ')
-    isVector = False
-    if entry[:8] == 'ImVector':
-        isVector = True
-
-    typeName = entry
-    const = False
-    pointer = False
-    if '*' in typeName:
-        pointer = True;
-        typeName = typeName.strip('*')
-
-    # print('\'' + typeName[:5] + '\'')
-    if typeName[:5] == 'const':
-        const = True
-        typeName = typeName[5:]
-        typeName = typeName.strip(' ')
-    # print(typeName)
-
-
-    if '_' in typeName:
-        x = typeName.split('_')
-        typeName = x[-1]
-    rv = convertInner(typeName)
-
-    if const and pointer:
-        rv = 'const ' + rv
-
-    if pointer:
-        rv = '[*c]' + rv
-
-    if isVector:
-        rv += 'Vector'
-
-    # print(rv)
-    return rv
-
-
-def startswith(line, segment):
-    if line[0:len(segment)] == segment:
-        return True
-    return False
-
-def parseRawArgsList(line):
-    argList = []
-    windowStart = 0
-    braceCount = 0
-    for i in range(0, len(line)):
-        if line[i] == '(':
-            braceCount += 1
-            continue
-        if line[i] == ')':
-            braceCount -= 1
-            continue
-        if braceCount == 0 and (line[i] == ',' or i == len(line) - 1):
-            argList.append((line[windowStart: i + 1]).strip(','))
-            windowStart = i
-    return argList
-
-def lowerFirst(s):
-    if len(s) > 1:
-        s = s[0].lower() + s[1:]
-    elif len(s) == 1:
-        s = s[0].lower()
-    return s
-
-funcList = []
-for l in inp.split('\n'):
-    line = l.strip(' \n;')
-    line = line.replace(' *', '* ')
-
-    if len(line) == 0:
-        continue
-
-    function = {}
-    if startswith(line, 'CIMGUI_API'):
-        line = line[len('CIMGUI_API'):].strip(' ')
-        s = line[line.index('('):]
-        argListRaw = parseRawArgsList(s.strip(' ()'))
-        argList = []
-        for arg in argListRaw:
-            if '(*' in arg:
-                paramName =  parseFuncName(arg)
-                typeName = arg
-                argList.append((typeName, paramName))
-            elif ' ' in arg:
-                argList.append(( arg[:arg.rindex(' ')].strip(' '), arg[arg.rindex(' '):].strip(' ')))
-            else:
-                argList.append((arg.strip(' '), None))
-        #print(line, '> ', argList)
-        function['rawName'] = line[:line.index('(')]
-        function['args'] = argList
-        rawName = function['rawName']
-        function['label'] = rawName[rawName.rindex(' '):].strip(' ')
-        function['returnType'] = rawName[:rawName.rindex(' ')].strip(' ')
-        # reject any functions that have a variadic
-        shouldAdd = True
-        for arg in function['args']:
-            if '...' in arg[0]:
-                shouldAdd = False
-        if shouldAdd:
-            funcList.append(function)
-
-def wrapCast(arg):
-    convertedType = convertTypeName(arg[0])
-    return convertedType
-
-for f in funcList:
-    if startswith(f['label'], 'ig'):
-        ostr = "pub fn "
-        label = f['label'][2:]
-        ostr += lowerFirst(label)
-        ostr += "("
-        first = True
-        for arg in f['args']:
-            if arg[0] == 'void':
-                continue
-            if first:
-                first = False
-            else:
-                ostr += ', '
-            ostr += convertVarName(arg[1]) + ': '
-            ostr += convertTypeName(arg[0])
-
-        ostr += ") "
-        returnType = convertTypeName(f['returnType'])
-        isSingleton = False
-        for s in singletonList:
-            if s == lowerFirst(label):
-                returnType = returnType.replace(r'[*c]', r'?*')
-                isSingleton = True
-                break
-        ostr += returnType
-        ostr += " { //" + f['label'] +"\n    "
-        if returnType != 'void':
-            ostr += 'return '
-        if isSingleton:
-            ostr += '@ptrCast('
-        ostr += "c." + f['label'] + '('
-        first = True
-        for arg in f['args']:
-            if first:
-                first = False
-            else:
-                ostr += ', '
-
-            if arg[0] == 'void':
-                continue
-            argStr = convertVarName(arg[1])
-            def applyCasts(a, t):
-                for cast in bitcastList:
-                    if t == cast:
-                        return '@bitCast(' + a + ')'
-                for cast in ptrcastList:
-                    if cast in t:
-                        return '@ptrCast(' + a + ')'
-                for cast in enumcastList:
-                    if t == cast:
-                        return '@intFromEnum(' + a + ')'
-                return a
-            argStr = applyCasts(argStr, convertTypeName(arg[0]))
-            ostr += argStr
-            # print(wrapCast(arg))
-        if isSingleton:
-            ostr += ')'
-        ostr += ');\n'
-        # ostr += convertTypeName(arg[0])
-        ostr += "}"
-        print(ostr)
-    else:
-        continue
+import argparse
+import os
+import sys
+
+import casts
+import declindex
+import gencache
+import naming
+import prune
+import shards
+import sink
+import typetable
+import usage
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# full header the --deps types are looked up in when the input is an
+# extracted function list like functions.txt
+defaultHeader = os.path.join(here, 'cimgui', 'imgui', 'cimgui.h')
+
+# where src/cimgui.zig deviates from the converted C names
+defaultTypes = os.path.join(here, 'cimgui_types.json')
+
+singletonList = [
+    'getStyle',
+    'getIO',
+    'getCurrentContext',
+    'getMainViewport',
+]
+
+bitcastList = [
+    "Vec2",
+    "Vec4",
+    "Cond",
+    "WindowFlags",
+    "DockNodeFlags",
+    "ConstCharPtrVector",
+    "CharVector",
+    "WcharVector",
+    "InputTextFlags",
+    "TreeNodeFlags",
+    "PopupFlags",
+    "SelectableFlags",
+    "ComboFlags",
+    "TabBarFlags",
+    "TabItemFlags",
+    "TableColumnFlags",
+    "TableFlags",
+    "TableRowFlags",
+    "TableBgTarget",
+    "FocusedFlags",
+    "HoveredFlags",
+    "DragDropFlags",
+    "DockNodeFlags",
+    "ModFlags",
+    "ConfigFlags",
+    "BackendFlags",
+    "ColorEditFlags",
+    "SliderFlags",
+    "Cond",
+    "Style",
+    "KeyData",
+    "FontAtlas",
+    "FontAtlasCustomRect",
+    "FontConfig",
+    "Io",
+    "Viewport",
+    "PlatformMonitorVector",
+    "ViewportPtrVector",
+    "PlatformIO",
+    "PlatformMonitor",
+    "ViewportFlags",
+    "DrawFlags",
+    "DrawListFlags",
+    "FontAtlasFlags",
+    "PlatformImeData",
+    "StbUndoRecord",
+    "StbUndoState",
+    "StbTexteditState",
+    "StbTexteditRow",
+    "Vec1",
+    "Rect",
+    "BitVector",
+    "Vec2ih",
+    "DrawListSharedData",
+    "DrawListPtrVector",
+    "DrawList",
+    "DrawDataBuilder",
+    "ItemFlags",
+    "ItemStatusFlags",
+    "SeparatorFlags",
+    "TextFlags",
+    "TooltipFlags",
+    "NextWindowDataFlags",
+    "NextItemDataFlags",
+    "ActivateFlags",
+    "ScrollFlags",
+    "NavHighlightFlags",
+    "NavDirSourceFlags",
+    "NavMoveFlags",
+    "OldColumnFlags",
+    "DebugLogFlags",
+    "DataTypeTempStorage",
+    "DataTypeInfo",
+    "ColorMod",
+    "StyleMod",
+    "ComboPreviewData",
+    "GroupData",
+    "MenuColumns",
+    "InputTextState",
+    "PopupData",
+    "NextWindowData",
+    "NextItemData",
+    "LastItemData",
+    "StackSizes",
+    "WindowStackData",
+    "PtrOrIndex",
+    "BitArrayForNamedKeys",
+    "InputEventMousePos",
+    "InputEventMouseWheel",
+    "InputEventMouseButton",
+    "InputEventMouseViewport",
+    "InputEventKey",
+    "InputEventText",
+    "InputEventAppFocused",
+    "InputEvent",
+    "ListClipperRange",
+    "ListClipperData",
+    "ListClipperRangeVector",
+    "NavItemData",
+    "OldColumnData",
+    "OldColumnDataVector",
+    "WindowPtrVector",
+    "WindowDockStyle",
+    "DockRequestVector",
+    "DockNodeSettingsVector",
+    "DockContext",
+    "ViewportP",
+    "WindowSettings",
+    "SettingsHandler",
+    "MetricsConfig",
+    "StackLevelInfoVector",
+    "StackTool",
+    "ContextHook",
+    "InputEventVector",
+    "WindowStackDataVector",
+    "ColorModVector",
+    "StyleModVector",
+    "IDVector",
+    "ItemFlagsVector",
+    "GroupDataVector",
+    "PopupDataVector",
+    "ViewportPPtrVector",
+    "ListClipperDataVector",
+    "TableTempDataVector",
+    "TableVector",
+    "TabBarVector",
+    "PtrOrIndexVector",
+    "ShrinkWidthItemVector",
+    "ShrinkWidthItem",
+    "SettingsHandlerVector",
+    "ContextHookVector",
+    "u8Vector",
+    "TablePool",
+    "TabBarPool",
+    "TabItemVector",
+    "WindowSettingsChunkStream",
+    "TableSettingsChunkStream",
+    "TabItem",
+    "TabBar",
+    "TableTempData",
+    "TableSettings",
+    "FontBuilderIO",
+    "TableCellData",
+    "TableInstanceData",
+    "TableColumnSpan",
+    "TableColumnIdxSpan",
+    "TableCellDataSpan",
+    "TableInstanceDataVector",
+    "TableColumnSortSpecsVector",
+    "TextBuffer",
+    "Context",
+    "DrawChannelVector",
+    "DrawChannel",
+    "DrawCmdVector",
+    "DrawIdxVector",
+    "f32Vector",
+    "FontPtrVector",
+    "Payload",
+    "ListClipper",
+    "Storage",
+    "StoragePairVector",
+    "WindowClass",
+    "InputTextCallbackData",
+    "SizeCallbackData",
+    "DrawData",
+    "FontGlyphVector",
+    "Font",
+    "DrawCmd",
+    "DrawVert",
+    "DrawCmdHeader",
+    "DrawListSplitter",
+]
+
+
+ptrcastList = [
+    "WindowClass",
+    "TableSortSpecs",
+]
+
+# zig types that are the very same type translate-c gives the cImport, a
+# wrapper using only these can re-export the extern function directly
+transparentTypes = [
+    "void",
+    "bool",
+    "u8",
+    "f32",
+    "f64",
+    "c_int",
+    "c_uint",
+    "c_short",
+    "c_ushort",
+    "c_long",
+    "c_ulong",
+    "c_longlong",
+    "c_ulonglong",
+    "anyopaque",
+    "ID",
+    "S16",
+    "U16",
+    "S32",
+    "U32",
+    "S64",
+    "U64",
+    "Wchar",
+    "Wchar16",
+    "DrawIdx",
+]
+
+enumcastList = [
+    "StyleVar",
+    "DataType",
+    "DataTypePrivate",
+    "NavLayer",
+    "DataAuthority",
+    "DockNodeState",
+    "WindowDockStyleCol",
+    "ContextHookType",
+    "Dir",
+    "NavInput",
+    "LayoutType",
+    "LogType",
+    "Axis",
+    "PlotType",
+    "PopupPositionPolicy",
+    "MouseButton",
+    "MouseCursor",
+    "SortDirection",
+    "Key",
+    "StyleColor",
+    "KeyPrivate",
+    "InputSource",
+    "NavReadMode",
+    "InputEventType",
+]
+
+def convertTypeName(entry):
+    if 'void*' == entry:
+        return '?*anyopaque'
+    if 'void' == entry:
+        return 'void'
+
+    # print('---')
+    # print(entry)
+    entry = entry.strip(' ')
+    typeName = entry
+    const = False
+    pointer = False
+    if '*' in typeName:
+        pointer = True;
+        typeName = typeName.strip('*')
+
+    # print('\'' + typeName[:5] + '\'')
+    if typeName[:5] == 'const':
+        const = True
+        typeName = typeName[5:]
+        typeName = typeName.strip(' ')
+    # print(typeName)
+
+
+    rv = naming.convertTypeName(typeName)
+
+    if const and pointer:
+        rv = 'const ' + rv
+
+    if pointer:
+        rv = '[*c]' + rv
+
+    # print(rv)
+    return rv
+
+
+def startswith(line, segment):
+    if line[0:len(segment)] == segment:
+        return True
+    return False
+
+def lowerFirst(s):
+    if len(s) > 1:
+        s = s[0].lower() + s[1:]
+    elif len(s) == 1:
+        s = s[0].lower()
+    return s
+
+def argTypeName(arg):
+    # array params decay to pointers, same as they do on the C side
+    return arg.type.decayed().spelling
+
+def isFormatFunction(function):
+    # printf style: variadic with a trailing `const char* fmt`
+    if not function.variadic or not function.args:
+        return False
+    last = function.args[-1]
+    return last.name == 'fmt' and last.type.base == 'char' and last.type.const and last.type.pointers == [False]
+
+def canTranslate(function):
+    # reject any functions that have a variadic, function pointer args,
+    # va_list args, arrays of pointers and pointers to pointers aren't expressible
+    # by convertTypeName yet.
+    # printf style functions get a slice wrapper instead, see generateFormatWrapper.
+    if function.variadic and not isFormatFunction(function):
+        return False
+    for arg in function.args:
+        if arg.type.funcPtr is not None or arg.type.base == 'va_list':
+            return False
+        if arg.type.array and arg.type.pointers:
+            return False
+        if len(arg.type.pointers) > 1:
+            return False
+    return True
+
+castBuiltins = {
+    'bitcast': '@bitCast',
+    'ptrcast': '@ptrCast',
+    'enum': '@intFromEnum',
+}
+
+def applyCasts(a, castKind):
+    if castKind is None:
+        return a
+    return castBuiltins[castKind] + '(' + a + ')'
+
+castRules = casts.CastClassifier(bitcastList, ptrcastList, enumcastList, singletonList)
+types = typetable.TypeTable(convertTypeName, castRules.classify)
+transparent = frozenset(transparentTypes)
+
+def isTransparent(zigType):
+    pointer = False
+    for p in ('[*c]', '?*', 'const '):
+        while zigType.startswith(p):
+            zigType = zigType[len(p):]
+            pointer = pointer or p != 'const '
+    # translate-c spells void pointers ?*anyopaque, never [*c]void
+    if pointer and zigType == 'void':
+        return False
+    return zigType in transparent
+
+# printf style functions that have a non-formatting twin taking begin/end
+unformattedTwins = {
+    'igText': 'igTextUnformatted',
+}
+
+# ImHashStr ported to zig so string ids can be folded at compile time.
+# Emitted after igGetID_Str, pushIDComptime only when igPushOverrideID exists.
+idHashHelpers = """const idHashTable = blk: {
+    @setEvalBranchQuota(4096);
+    var table: [256]u32 = undefined;
+    for (&table, 0..) |*entry, i| {
+        var crc: u32 = @intCast(i);
+        for (0..8) |_| {
+            crc = if (crc & 1 != 0) (crc >> 1) ^ 0xEDB88320 else crc >> 1;
+        }
+        entry.* = crc;
+    }
+    break :blk table;
+};
+// same result as ImHashStr(str, str.len, seed): "###" resets to the seed
+pub fn hashStr(str: []const u8, seed: ID) ID {
+    const start: u32 = ~@as(u32, seed);
+    var crc = start;
+    for (str, 0..) |ch, i| {
+        if (ch == '#' and i + 2 < str.len and str[i + 1] == '#' and str[i + 2] == '#') {
+            crc = start;
+        }
+        crc = (crc >> 8) ^ idHashTable[(crc & 0xFF) ^ ch];
+    }
+    return ~crc;
+}
+// the id getID_Str(str) returns in the id scope seed, computed at compile
+// time. A top level window's scope is hashStr(window name, 0).
+pub inline fn getIDComptime(comptime str: []const u8, comptime seed: ID) ID {
+    return comptime blk: {
+        @setEvalBranchQuota(1000 + str.len * 8);
+        break :blk hashStr(str, seed);
+    };
+}"""
+
+pushIDComptime = """
+// pushID_Str(str) inside the id scope seed, without hashing at runtime
+pub inline fn pushIDComptime(comptime str: []const u8, comptime seed: ID) void {
+    c.igPushOverrideID(getIDComptime(str, seed));
+}"""
+
+idHashNames = ['hashStr', 'getIDComptime', 'pushIDComptime']
+
+def generateIdHashHelpers(header):
+    text = idHashHelpers
+    if any(f.name == 'igPushOverrideID' for f in header.functions):
+        text += pushIDComptime
+    return text
+
+def paramName(arg, reserved):
+    # zig rejects parameters shadowing a declaration, e.g. `button` in
+    # isMouseDown(button) next to pub fn button, and keywords like `type`
+    name = naming.convertVarName(arg.name)
+    if name in reserved or name in naming.zigKeywords:
+        name += '_'
+    return name
+
+# element types a begin/end pair has to point at to be taken as text
+textElements = frozenset(['char', 'ImWchar'])
+
+def textRanges(f):
+    # indices of (begin, end) pointer pairs like text/text_end or
+    # str_id_begin/str_id_end, the end is allowed to be NULL on the C side
+    ranges = []
+    for i in range(len(f.args) - 1):
+        begin, end = f.args[i], f.args[i + 1]
+        stem = begin.name[:-len('_begin')] if begin.name.endswith('_begin') else begin.name
+        if begin.type.base not in textElements:
+            continue
+        if end.name == stem + '_end' and begin.type == end.type and begin.type.pointers == [False] and not begin.type.array:
+            ranges.append(i)
+    return ranges
+
+def generateSliceWrapper(f, ranges, prefix='ig', direct=False, reserved=()):
+    # takes each begin/end pair as one zig slice and passes ptr, ptr + len,
+    # so labels don't need a NUL terminated copy every frame
+    label = f.name[len(prefix):]
+    returnType = types.zigType(f.returnType.spelling)
+    params = []
+    callArgs = []
+    i = 0
+    while i < len(f.args):
+        arg = f.args[i]
+        zigType, castKind = types.lookup(argTypeName(arg))
+        if i in ranges:
+            name = arg.name[:-len('_begin')] if arg.name.endswith('_begin') else arg.name
+            argName = naming.convertVarName(name)
+            if argName in reserved or argName in naming.zigKeywords:
+                argName += '_'
+            params.append(argName + ': []' + zigType[len('[*c]'):])
+            callArgs.extend([argName + '.ptr', argName + '.ptr + ' + argName + '.len'])
+            i += 2
+            continue
+        argName = paramName(arg, reserved)
+        params.append(argName + ': ' + zigType)
+        callArgs.append(applyCasts(argName, castKind))
+        i += 1
+
+    return ''.join([
+        'pub inline fn ' if direct else 'pub fn ', lowerFirst(label), naming.sliceSuffix, '(', ', '.join(params), ') ', returnType, ' { //', f.name, '\n',
+        '    ', 'return ' if returnType != 'void' else '', 'c.', f.name, '(', ', '.join(callArgs), ');\n',
+        '}',
+    ])
+
+def generateFormatWrapper(f, prefix='ig', direct=False, reserved=()):
+    # the text is passed through "%.*s" with its length, so any []const u8
+    # works without a NUL terminated copy and the va_list never has to be
+    # built on the zig side
+    label = f.name[len(prefix):]
+    returnType = types.zigType(f.returnType.spelling)
+    params = []
+    callArgs = []
+    for arg in f.args[:-1]:
+        argName = paramName(arg, reserved)
+        zigType, castKind = types.lookup(argTypeName(arg))
+        params.append(argName + ': ' + zigType)
+        callArgs.append(applyCasts(argName, castKind))
+    params.append('str: []const u8')
+
+    if f.name in unformattedTwins:
+        call = 'c.' + unformattedTwins[f.name] + '(' + ', '.join(callArgs + ['str.ptr', 'str.ptr + str.len']) + ')'
+    else:
+        call = 'c.' + f.name + '(' + ', '.join(callArgs + ['"%.*s"', '@as(c_int, @intCast(str.len))', 'str.ptr']) + ')'
+
+    return ''.join([
+        'pub inline fn ' if direct else 'pub fn ', lowerFirst(label), '(', ', '.join(params), ') ', returnType, ' { //', f.name, '\n',
+        '    ', 'return ' if returnType != 'void' else '', call, ';\n',
+        '}',
+    ])
+
+def generateFunction(f, prefix='ig', direct=False, reserved=()):
+    if f.variadic:
+        return generateFormatWrapper(f, prefix, direct, reserved)
+    text = generateBinding(f, prefix, direct, reserved)
+    ranges = [i for i in textRanges(f) if types.lookup(argTypeName(f.args[i]))[0].startswith('[*c]')]
+    if ranges:
+        text += '\n' + generateSliceWrapper(f, ranges, prefix, direct, reserved)
+    return text
+
+def generateBinding(f, prefix='ig', direct=False, reserved=()):
+    label = f.name[len(prefix):]
+    returnType = types.zigType(f.returnType.spelling)
+    isSingleton = castRules.isSingleton(lowerFirst(label))
+    if isSingleton:
+        returnType = returnType.replace(r'[*c]', r'?*')
+
+    params = []
+    callArgs = []
+    castFree = not isSingleton and isTransparent(returnType)
+    for arg in f.args:
+        argName = paramName(arg, reserved)
+        zigType, castKind = types.lookup(argTypeName(arg))
+        params.append(argName + ': ' + zigType)
+        callArgs.append(applyCasts(argName, castKind))
+        castFree = castFree and castKind is None and isTransparent(zigType)
+
+    if direct and castFree:
+        # same signature as the extern, skip the forwarding call entirely
+        return ''.join(['pub const ', lowerFirst(label), ' = c.', f.name, ';'])
+
+    call = 'c.' + f.name + '(' + ', '.join(callArgs) + ')'
+    if isSingleton or types.castKind(f.returnType.spelling) == 'ptrcast':
+        call = '@ptrCast(' + call + ')'
+
+    return ''.join([
+        'pub inline fn ' if direct else 'pub fn ', lowerFirst(label), '(', ', '.join(params), ') ', returnType, ' { //', f.name, '\n',
+        '    ', 'return ' if returnType != 'void' else '', call, ';\n',
+        '}',
+    ])
+
+def selectFunctions(header, prefix='ig', keep=None):
+    # keep limits the output to these zig or C function names, see prune.py
+    return [f for f in header.functions if startswith(f.name, prefix) and canTranslate(f)
+            and (keep is None or prune.keepFunction(f, prefix, keep))]
+
+def reservedNames(header, prefix='ig'):
+    # every zig function name the header can produce, independent of
+    # pruning so a parameter keeps its name whichever functions are kept.
+    # c is the @cImport namespace the wrappers call into
+    names = {'c'}
+    for f in selectFunctions(header, prefix):
+        names.add(lowerFirst(f.name[len(prefix):]))
+    return names
+
+def generateFunctions(header, cache=None, prefix='ig', direct=False, keep=None):
+    out = []
+    mode = 'direct' if direct else 'wrap'
+    reserved = reservedNames(header, prefix)
+    for f in selectFunctions(header, prefix, keep):
+        if cache is None:
+            out.append(generateFunction(f, prefix, direct, reserved))
+        else:
+            clashes = sorted(reserved.intersection(naming.convertVarName(arg.name) for arg in f.args))
+            key = gencache.hashText(prefix, mode, f.spelling, *clashes)
+            out.append(cache.lookup(key, lambda: generateFunction(f, prefix, direct, reserved)))
+        if prefix == 'ig' and f.name == 'igGetID_Str':
+            out[-1] += '\n' + generateIdHashHelpers(header)
+    return out
+
+def declaresTypes(header):
+    return bool(header.structs or header.enums or header.typedefs)
+
+def countDirect(generated):
+    return sum(1 for g in generated if g.startswith('pub const '))
+
+def directNames(generated):
+    return [shards.declaration.match(g).group(1) for g in generated if g.startswith('pub const ')]
+
+def generatorSources(typesPath=None):
+    sources = [os.path.join(here, name) for name in ('functions.py', 'casts.py', 'cheader.py', 'naming.py', 'typetable.py', 'gencache.py', 'sink.py')]
+    if typesPath:
+        sources.append(typesPath)
+    return sources
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='generates zig wrappers for the cimgui ig* functions')
+    # accepts either the full header or a pre-extracted list like functions.txt
+    parser.add_argument('input', nargs='?', default='functions.txt')
+    parser.add_argument('--cache', help='directory to cache per-declaration output in, only changed declarations get re-translated')
+    outputs = parser.add_mutually_exclusive_group()
+    outputs.add_argument('--output', '-o', help='write to this file (atomically replaced) instead of stdout')
+    outputs.add_argument('--splice', help='zig file to splice the output into, between the "// @generated functions begin/end" markers')
+    outputs.add_argument('--shard-dir', help='write one cimgui_<subsystem>.zig per subsystem plus a cimgui_api.zig facade to this directory')
+    parser.add_argument('--scan', action='append', help='zig file or directory the facade and --prune look for used bindings in, defaults to engine/ui, engine/vkImgui/src and projects')
+    parser.add_argument('--prune', action='store_true', help='only emit the functions the scanned sources use plus the allowlist')
+    parser.add_argument('--allowlist', action='append', help='file of extra function names to keep with --prune, defaults to prune_allowlist.txt')
+    parser.add_argument('--deps', help='with --prune, write the structs, enums and typedefs the kept functions need to this json file')
+    parser.add_argument('--header', help='header declaring the structs, enums and typedefs --deps resolves against, '
+                                         'the input itself or cimgui/imgui/cimgui.h when the input declares none')
+    parser.add_argument('--types', default=defaultTypes, help='json file of C spelling -> [zig type, cast kind] entries to preload, overrides the converter. '
+                                                             'Defaults to cimgui_types.json, the names src/cimgui.zig declares')
+    parser.add_argument('--dump-types', help='write the type table built during this run to a json file')
+    parser.add_argument('--no-index', action='store_true', help='reparse the header instead of loading it from the declaration index')
+    parser.add_argument('--report-casts', action='store_true', help='report duplicated and unused cast rules on stderr')
+    parser.add_argument('--direct', action='store_true', help='re-export cast free functions as c.ig* aliases and make the rest inline')
+    args = parser.parse_args(argv[1:])
+
+    if args.types:
+        types.preload(args.types)
+
+    used = None
+    keep = None
+    if args.prune or args.shard_dir:
+        used = usage.scanUsage(args.scan)
+    if args.prune:
+        keep = set(used)
+        for path in args.allowlist or [prune.defaultAllowlist]:
+            keep |= prune.readAllowlist(path)
+        if keep.intersection(idHashNames):
+            # the helpers are emitted with getID_Str
+            keep |= {'igGetID_Str', 'igPushOverrideID'}
+
+    cache = None
+    inputHash = None
+    if args.cache:
+        cache = gencache.GenCache(os.path.join(args.cache, 'functions.json'), gencache.fingerprint(generatorSources(args.types)))
+        inputHash = gencache.hashText(gencache.hashFile(args.input), 'direct' if args.direct else 'wrap')
+        if keep is not None:
+            # a pruned splice is only current while the engine uses the same names
+            inputHash = gencache.hashText(inputHash, *sorted(keep))
+        if args.splice and cache.isUpToDate(inputHash, args.splice, 'functions'):
+            return
+
+    header = declindex.load(args.input, None if args.no_index else declindex.defaultDir)
+    generated = generateFunctions(header, cache, direct=args.direct, keep=keep)
+    output = None
+
+    if keep is not None:
+        kept = selectFunctions(header, keep=keep)
+        typeHeader = header
+        if args.header:
+            typeHeader = declindex.load(args.header, None if args.no_index else declindex.defaultDir)
+        elif not declaresTypes(header):
+            typeHeader = declindex.load(defaultHeader, None if args.no_index else declindex.defaultDir)
+        if not declaresTypes(typeHeader):
+            sys.exit(f'error: {args.header or defaultHeader} declares no structs, enums or typedefs to resolve the kept functions against')
+        deps = prune.typeDeps(typeHeader, kept)
+        print(f'kept {len(kept)} of {len(selectFunctions(header))} functions, needing {len(deps["structs"])} structs, '
+              f'{len(deps["opaque"])} opaque structs, {len(deps["enums"])} enums and {len(deps["typedefs"])} typedefs', file=sys.stderr)
+        if args.deps:
+            prune.writeDeps(args.deps, kept, deps)
+
+    if args.splice:
+        output = '\n'.join(generated) + '\n'
+        gencache.splice(args.splice, 'functions', output)
+    elif args.shard_dir:
+        try:
+            counts, unresolved = shards.writeShards(header, selectFunctions(header, keep=keep), generated, 'ig', args.shard_dir, used, os.path.basename(args.input))
+        except FileNotFoundError as e:
+            sys.exit(f'error: {e}')
+        print(', '.join(f'{shard} {n}' for shard, n in counts.items()) + f', facade {len(used) - len(unresolved)}', file=sys.stderr)
+        for name in unresolved:
+            print(f'warning: {name} is used by {", ".join(used[name])} but not declared anywhere', file=sys.stderr)
+    else:
+        with sink.Sink(args.output) as out:
+            out.lines(generated)
+
+    if args.report_casts:
+        if cache is not None and cache.hits:
+            print('note: rules only needed by cached declarations show up as unused', file=sys.stderr)
+        for line in castRules.report():
+            print(line, file=sys.stderr)
+
+    if args.direct:
+        calls = usage.countReferences(args.scan)
+        names = set(name for text in generated for name in shards.declaration.findall(text))
+        sites = sum(calls.get(name, 0) for name in directNames(generated))
+        total = sum(calls.get(name, 0) for name in names)
+        print(f'{countDirect(generated)} of {len(generated)} functions re-exported directly, the rest are inline wrappers. '
+              f'{sites} of {total} call sites in the scanned sources take the direct path', file=sys.stderr)
+
+    if args.dump_types:
+        types.dump(args.dump_types)
+
+    if cache is not None:
+        cache.save(inputHash, output if output is not None else '\n'.join(generated) + '\n')
+        print(f'{cache.misses} translated, {cache.hits} cached', file=sys.stderr)
+
+if __name__ == '__main__':
+    main(sys.argv)
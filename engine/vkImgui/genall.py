@@ -0,0 +1,113 @@
+# parallel multi-header binding generation.
+#
+# every header is parsed and translated in its own worker process, results
+# are merged back in the order the headers were given so the output doesn't
+# depend on which worker finished first. Each header becomes its own zig
+# module. Regenerating all of them takes about as long as the largest one.
+# The cimplot module also needs the ImPlot structs and enums (structs.py,
+# enumtool.py) in scope before it compiles.
+#
+#   python genall.py                    # cimgui.h, cimgui2.h and cimplot.h
+#   python genall.py cimplot/cimplot.h:cimplot_functions.zig:ImPlot_
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+import declindex
+import functions
+import gencache
+import sink
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# header, output module, function prefix
+defaultJobs = [
+    ('cimgui/imgui/cimgui.h', 'cimgui_functions.zig', 'ig'),
+    ('cimgui/imgui/cimgui2.h', 'cimgui2_functions.zig', 'ig'),
+    ('cimplot/cimplot.h', 'cimplot_functions.zig', 'ImPlot_'),
+]
+
+# the hand maintained types module the wrappers are written against
+typesModule = os.path.join(here, 'src', 'cimgui.zig')
+
+prelude = """// generated by genall.py from {header}, do not edit
+usingnamespace @import("{types}");
+
+"""
+
+
+def parseJob(spec):
+    # header[:output[:prefix]]
+    parts = spec.split(':')
+    header = parts[0]
+    output = parts[1] if len(parts) > 1 and parts[1] else os.path.splitext(os.path.basename(header))[0] + '_functions.zig'
+    prefix = parts[2] if len(parts) > 2 and parts[2] else 'ig'
+    return header, output, prefix
+
+
+def translateHeader(header, prefix, cacheDir=None, direct=False, indexDir=declindex.defaultDir):
+    # runs inside a worker process
+    start = time.perf_counter()
+    functions.types.preload(functions.defaultTypes)
+    parsed = declindex.load(header, indexDir)
+    parseTime = time.perf_counter() - start
+
+    cache = None
+    if cacheDir:
+        name = os.path.splitext(os.path.basename(header))[0]
+        cache = gencache.GenCache(os.path.join(cacheDir, name + '.json'), gencache.fingerprint(functions.generatorSources(functions.defaultTypes)))
+
+    generated = functions.generateFunctions(parsed, cache, prefix, direct)
+    output = '\n'.join(generated) + '\n'
+    if cache is not None:
+        cache.save(gencache.hashFile(header), output)
+
+    return {
+        'header': header,
+        'output': output,
+        'count': len(generated),
+        'direct': functions.countDirect(generated),
+        'parseTime': parseTime,
+        'totalTime': time.perf_counter() - start,
+    }
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='generates zig wrappers for several cimgui style headers in parallel')
+    parser.add_argument('jobs', nargs='*', help='header[:output[:prefix]], defaults to cimgui.h, cimgui2.h and cimplot.h')
+    parser.add_argument('--out-dir', default=os.path.join(here, 'src', 'generated'), help='directory the zig modules are written to')
+    parser.add_argument('--workers', '-j', type=int, default=None, help='worker processes, defaults to the number of cores')
+    parser.add_argument('--cache', help='directory to keep per-header declaration caches in, see functions.py --cache')
+    parser.add_argument('--no-index', action='store_true', help='reparse the header instead of loading it from the declaration index')
+    parser.add_argument('--direct', action='store_true', help='re-export cast free functions directly, see functions.py --direct')
+    args = parser.parse_args(argv[1:])
+
+    if args.jobs:
+        jobs = [parseJob(j) for j in args.jobs]
+    else:
+        jobs = [(os.path.join(here, h), o, p) for h, o, p in defaultJobs]
+
+    start = time.perf_counter()
+    workers = args.workers or min(len(jobs), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(translateHeader, header, prefix, args.cache, args.direct, None if args.no_index else declindex.defaultDir) for header, _, prefix in jobs]
+        results = [f.result() for f in futures]
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    # zig resolves the import relative to the generated file
+    types = os.path.relpath(typesModule, args.out_dir).replace(os.sep, '/')
+    for (header, output, _), result in zip(jobs, results):
+        with sink.Sink(os.path.join(args.out_dir, output)) as out:
+            out.write(prelude.format(header=os.path.basename(header), types=types), result['output'])
+        direct = f", {result['direct']} direct" if args.direct else ''
+        print(f"{os.path.basename(header)}: {result['count']} functions{direct} -> {output} "
+              f"(parse {result['parseTime'] * 1000:.1f}ms, total {result['totalTime'] * 1000:.1f}ms)", file=sys.stderr)
+
+    print(f'{len(jobs)} headers in {(time.perf_counter() - start) * 1000:.1f}ms on {workers} workers', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,134 @@
+# content-hash cache for the binding generators.
+#
+# every parsed declaration is hashed and its generated zig text is kept on
+# disk, so a rerun only re-translates declarations that were added or changed.
+# the whole cache is keyed on a fingerprint of the generator sources, editing
+# functions.py (or anything else that changes the output) throws it away.
+
+import hashlib
+import json
+import os
+import re
+
+import sink
+
+CACHE_VERSION = 1
+
+
+def hashText(*parts):
+    h = hashlib.sha1()
+    for p in parts:
+        h.update(p.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def hashFile(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def fingerprint(paths):
+    h = hashlib.sha1()
+    h.update(str(CACHE_VERSION).encode())
+    for p in paths:
+        h.update(hashFile(p).encode())
+    return h.hexdigest()
+
+
+class GenCache:
+    def __init__(self, path, fingerprint):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries = {}
+        self.used = {}
+        self.inputHash = None
+        self.outputHash = None
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.exists(path):
+            with open(path) as f:
+                try:
+                    data = json.load(f)
+                except ValueError:
+                    data = {}
+            if data.get('version') == CACHE_VERSION and data.get('fingerprint') == fingerprint:
+                self.entries = data.get('entries', {})
+                self.inputHash = data.get('inputHash')
+                self.outputHash = data.get('outputHash')
+
+    def lookup(self, key, generate):
+        text = self.entries.get(key)
+        if text is None:
+            self.misses += 1
+            text = generate()
+        else:
+            self.hits += 1
+        self.used[key] = text
+        return text
+
+    def isUpToDate(self, inputHash, splicePath, section):
+        # a no-op regen: same input, same generator and nobody touched the
+        # spliced block since we last wrote it
+        if self.inputHash != inputHash or self.outputHash is None:
+            return False
+        if not os.path.exists(splicePath):
+            return False
+        block = readSection(splicePath, section)
+        return block is not None and hashText(block) == self.outputHash
+
+    def save(self, inputHash, output):
+        # only declarations seen this run are kept, removed ones fall out
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = {
+            'version': CACHE_VERSION,
+            'fingerprint': self.fingerprint,
+            'inputHash': inputHash,
+            'outputHash': hashText(output),
+            'entries': self.used,
+        }
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp, self.path)
+
+
+def sectionMarkers(section):
+    return f'// @generated {section} begin', f'// @generated {section} end'
+
+
+def findSection(text, section):
+    begin, end = sectionMarkers(section)
+    m = re.search(re.escape(begin) + r'[^\n]*\n(.*?)^[ \t]*' + re.escape(end), text, re.S | re.M)
+    if m is None:
+        raise ValueError(f'missing "{begin}" / "{end}" markers')
+    return m
+
+
+def readSection(path, section):
+    with open(path, newline='') as f:
+        text = f.read().replace('\r\n', '\n')
+    try:
+        return findSection(text, section).group(1)
+    except ValueError:
+        return None
+
+
+def splice(path, section, output):
+    # replaces everything between the section markers, keeping the file's
+    # line endings. Only writes when the block actually changed.
+    with open(path, newline='') as f:
+        raw = f.read()
+    crlf = '\r\n' in raw
+    text = raw.replace('\r\n', '\n')
+    m = findSection(text, section)
+    if not output.endswith('\n'):
+        output += '\n'
+    if m.group(1) == output:
+        return False
+    with sink.Sink(path, newline='\r\n' if crlf else '\n') as out:
+        out.write(text[:m.start(1)], output, text[m.end(1):])
+    return True
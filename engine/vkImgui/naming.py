@@ -0,0 +1,96 @@
+# C -> zig name conversions shared by functions.py, structs.py and enumtool.py.
+
+# Im<Template>_<Arg> instantiations are named <Arg><Template> on the zig side
+templates = ['Vector', 'Pool', 'ChunkStream', 'Span']
+
+# element spellings used in template names that aren't Im/ImGui types
+templateBuiltins = {
+    'char': 'Char',
+    'float': 'f32',
+    'unsigned_char': 'u8',
+}
+
+zigKeywords = frozenset([
+    'addrspace', 'align', 'allowzero', 'and', 'anyframe', 'anytype', 'asm', 'async', 'await', 'break',
+    'callconv', 'catch', 'comptime', 'const', 'continue', 'defer', 'else', 'enum', 'errdefer', 'error',
+    'export', 'extern', 'fn', 'for', 'if', 'inline', 'noalias', 'noinline', 'nosuspend', 'opaque', 'or',
+    'orelse', 'packed', 'pub', 'resume', 'return', 'linksection', 'struct', 'suspend', 'switch', 'test',
+    'threadlocal', 'try', 'type', 'union', 'unreachable', 'usingnamespace', 'var', 'volatile', 'while',
+])
+
+# suffix of the functions.py wrappers taking begin/end string pairs as one slice
+sliceSuffix = 'Slice'
+
+builtinTypes = {
+    'size_t': 'usize',
+    'double': 'f64',
+    'float': 'f32',
+    'char': 'u8',
+    'unsigned char': 'u8',
+    'signed char': 'i8',
+    'int': 'c_int',
+    'short': 'c_short',
+    'unsigned int': 'c_uint',
+    'unsigned short': 'c_ushort',
+    'unsigned long': 'c_ulong',
+    'long': 'c_long',
+    'longlong': 'c_longlong',
+}
+
+def convertVarName(name):
+    ostr = ""
+    first = True
+    for c in name:
+        if c.isupper():
+            if first:
+                first = False
+            else:
+                ostr += '_'
+        ostr += c.lower()
+    return ostr
+
+def zigIdent(name):
+    if name in zigKeywords:
+        return '@"' + name + '"'
+    return name
+
+def convertInner(typeName):
+    if typeName in builtinTypes:
+        return builtinTypes[typeName]
+    if 'ImGui' == typeName[0:5]:
+        return typeName[5:]
+    if 'Im' == typeName[0:2]:
+        return typeName[2:]
+    return typeName
+
+def convertTemplateArg(arg):
+    const = arg.startswith('const_')
+    if const:
+        arg = arg[len('const_'):]
+    ptr = arg.endswith('Ptr')
+    if ptr:
+        arg = arg[:-len('Ptr')]
+    if arg in templateBuiltins:
+        rv = templateBuiltins[arg]
+    else:
+        rv = convertInner(arg)
+    if const:
+        rv = 'Const' + rv[0].upper() + rv[1:]
+    if ptr:
+        rv += 'Ptr'
+    return rv
+
+def convertTypeName(entry):
+    # a bare C type name, no pointers or qualifiers
+    if 'void' == entry:
+        return 'void'
+
+    for template in templates:
+        prefix = 'Im' + template + '_'
+        if entry.startswith(prefix):
+            return convertTemplateArg(entry[len(prefix):]) + template
+
+    rv = convertInner(entry)
+    if rv == entry and '_' in entry:
+        rv = convertInner(entry.split('_')[-1])
+    return rv
@@ -0,0 +1,115 @@
+# dead binding pruning.
+#
+# keeps only the wrappers the engine references (usage.py) plus an
+# allowlist, and works out which C structs, enums and typedefs those
+# wrappers need, transitively through struct fields and typedefs. The
+# dependency set is written as json for structs.py / enumtool.py --deps.
+
+import json
+import os
+import re
+
+import naming
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+defaultAllowlist = os.path.join(here, 'prune_allowlist.txt')
+
+
+def readAllowlist(path):
+    # one zig or C function name per line, # starts a comment
+    names = set()
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                names.add(line)
+    return names
+
+
+def keepFunction(f, prefix, keep):
+    label = f.name[len(prefix):]
+    name = label[:1].lower() + label[1:]
+    return f.name in keep or name in keep or name + naming.sliceSuffix in keep
+
+
+def typeRefs(ctype, byValue=True):
+    # (base, byValue) for every type named in ctype. Only types held by
+    # value need their layout, anything behind a pointer can stay opaque.
+    if ctype is None:
+        return
+    if ctype.funcPtr is not None:
+        yield from typeRefs(ctype.funcPtr.returnType, byValue)
+        for arg in ctype.funcPtr.args:
+            yield from typeRefs(arg.type, byValue)
+        return
+    yield ctype.base, byValue and not ctype.pointers
+
+
+def fieldRefs(fields):
+    for field in fields:
+        if field.nested is not None:
+            yield from fieldRefs(field.nested.fields)
+        else:
+            yield from typeRefs(field.type)
+
+
+def typeDeps(header, functions):
+    # returns {'structs': [...], 'opaque': [...], 'enums': [...], 'typedefs': [...]}
+    # of C names. Types in the kept signatures are laid out in full so their
+    # fields stay usable, structs only reached through pointers inside those
+    # are declared opaque instead of pulling in the whole ImGuiContext graph.
+    structs = {s.name: s for s in header.structs}
+    typedefs = {t.name: t for t in header.typedefs}
+    enums = set(e.name for e in header.enums)
+    # ImGuiXxxFlagsPrivate_ extends ImGuiXxxFlags_
+    privateEnums = {}
+    for name in enums:
+        m = re.match(r'(\w+?)Private_$', name)
+        if m and m.group(1) + '_' in enums:
+            privateEnums.setdefault(m.group(1) + '_', []).append(name)
+
+    pending = []
+    for f in functions:
+        # a struct the caller gets a pointer to is still one it works with
+        pending.extend((base, True) for base, _ in typeRefs(f.returnType))
+        for arg in f.args:
+            pending.extend((base, True) for base, _ in typeRefs(arg.type))
+
+    seen = set()
+    full = set()
+    deps = {'structs': set(), 'opaque': set(), 'enums': set(), 'typedefs': set()}
+    while pending:
+        base, byValue = pending.pop()
+        if (base, byValue) in seen:
+            continue
+        seen.add((base, byValue))
+        if base in typedefs:
+            deps['typedefs'].add(base)
+            pending.extend((b, byValue and v) for b, v in typeRefs(typedefs[base].type))
+            # typedef int ImGuiWindowFlags; goes with enum ImGuiWindowFlags_
+            pending.append((base + '_', True))
+        if base in structs:
+            if byValue:
+                full.add(base)
+                pending.extend(fieldRefs(structs[base].fields))
+            else:
+                deps['opaque'].add(base)
+        if base in enums:
+            deps['enums'].add(base)
+            deps['enums'].update(privateEnums.get(base, []))
+    deps['structs'] = full
+    deps['opaque'] -= full
+    return {kind: sorted(names) for kind, names in deps.items()}
+
+
+def writeDeps(path, functions, deps):
+    data = {'functions': [f.name for f in functions], **deps}
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=4)
+        f.write('\n')
+
+
+def readDeps(path):
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,121 @@
+# splits the generated wrappers into one zig file per imgui subsystem.
+#
+# zig re-parses a whole file whenever it changes, so a single module holding
+# every wrapper is re-analyzed after each regen. Sharded, every file stays
+# small and a facade re-exports just the names the engine references (see
+# usage.py), so only the shards those names live in get analyzed at all.
+
+import os
+import re
+
+import sink
+import usage
+
+# first match wins, matched against the function name without its prefix.
+# The first contiguous block of prefixed functions in the header is the
+# public imgui.h api, later blocks come from imgui_internal.h and go to
+# the internal shard.
+shardRules = [
+    ('docking', r'Dock|Viewport|PlatformWindows|WindowClass'),
+    ('tables', r'^(Begin|End)Table$|^Table|Column'),
+    ('drawlist', r'DrawList|DrawData|Font|ClipRect|ColorU32|ColorConvert|CalcTextSize'),
+    ('io', r'IO$|Key|Mouse|Clipboard|IniSettings|WantCapture|Allocator|^Mem(Alloc|Free)$|^GetTime$|^GetFrameCount$'),
+    ('windows', r'^(Begin|End)$|Window|Child|Context|Frame$|^Render$|Scroll|Style|Popup|Tooltip|MenuBar'
+                r'|^Show|^GetVersion$|ContentRegion|Cursor|SameLine|NewLine|Spacing|Separator|Dummy|Indent'
+                r'|Group|ItemWidth|TextWrapPos|FrameHeight|TextLineHeight|StateStorage|^Log|^Debug'),
+]
+
+# the hand maintained types module every shard is written against
+typesModule = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'cimgui.zig')
+
+shardNames = [name for name, _ in shardRules] + ['widgets', 'internal']
+
+shardMatchers = [(name, re.compile(rx)) for name, rx in shardRules]
+
+declaration = re.compile(r'^pub\s+(?:inline\s+)?(?:const|fn)\s+(\w+)', re.M)
+
+prelude = """// generated by functions.py --shard-dir from {header}, do not edit
+usingnamespace @import("{types}");
+
+"""
+
+facadePrelude = """// generated by functions.py --shard-dir from {header}, do not edit
+// re-exports the bindings referenced by the engine, rerun after using new ones
+"""
+
+
+def publicFunctions(functions, prefix):
+    public = set()
+    seen = False
+    for f in functions:
+        if f.name.startswith(prefix):
+            seen = True
+            public.add(f.name)
+        elif seen:
+            break
+    return public
+
+
+def shardOf(f, prefix, public):
+    if f.name not in public:
+        return 'internal'
+    label = f.name[len(prefix):]
+    for name, rx in shardMatchers:
+        if rx.search(label):
+            return name
+    return 'widgets'
+
+
+def shardFile(shard):
+    return f'cimgui_{shard}.zig'
+
+
+def writeShards(header, functions, generated, prefix, outDir, used, source, facade='cimgui_api.zig', types=typesModule):
+    # functions and generated are parallel lists, used is {zig name: files}.
+    # returns (count per shard, names the facade couldn't resolve)
+    if not os.path.isfile(types):
+        raise FileNotFoundError(f'{types} not found, the shards are written against it')
+    # zig resolves imports relative to the importing file
+    typesImport = os.path.relpath(types, outDir).replace(os.sep, '/')
+    public = publicFunctions(header.functions, prefix)
+    shards = {name: [] for name in shardNames}
+    location = {}
+    for f, text in zip(functions, generated):
+        shard = shardOf(f, prefix, public)
+        shards[shard].append(text)
+        # one declaration can come with extra wrappers, e.g. the slice ones
+        for name in declaration.findall(text):
+            location[name] = shard
+
+    os.makedirs(outDir, exist_ok=True)
+    for shard, texts in shards.items():
+        with sink.Sink(os.path.join(outDir, shardFile(shard))) as out:
+            out.write(prelude.format(header=source, types=typesImport))
+            if texts:
+                out.lines(texts)
+
+    declared = usage.declaredNames(types)
+    imports = set()
+    exports = []
+    unresolved = []
+    for name in sorted(used):
+        if name in location:
+            imports.add(location[name])
+            exports.append(f'pub const {name} = {location[name]}.{name};')
+        elif name in declared:
+            imports.add('types')
+            exports.append(f'pub const {name} = types.{name};')
+        else:
+            unresolved.append(name)
+
+    with sink.Sink(os.path.join(outDir, facade)) as out:
+        out.write(facadePrelude.format(header=source))
+        if 'types' in imports:
+            out.line(f'const types = @import("{typesImport}");')
+        for shard in shardNames:
+            if shard in imports:
+                out.line(f'const {shard} = @import("{shardFile(shard)}");')
+        out.write('\n')
+        out.lines(exports)
+
+    return {name: len(texts) for name, texts in shards.items()}, unresolved
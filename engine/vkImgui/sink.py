@@ -0,0 +1,72 @@
+# buffered output sink for the binding generators.
+#
+# generated code is streamed through one buffered writer instead of a print()
+# per declaration. With a path the output goes to a temp file next to the
+# target that is renamed over it on close, so a failed run never leaves a
+# half written zig file behind. Without a path it writes to stdout, which
+# keeps `python functions.py | zig fmt --stdin` working.
+
+import io
+import os
+import sys
+import tempfile
+
+BUFFER_SIZE = 1 << 16
+
+
+class Sink:
+    def __init__(self, path=None, newline='\n'):
+        self.path = path
+        self.tmpPath = None
+        if path is None:
+            sys.stdout.flush()
+            self.f = sys.stdout
+            if hasattr(sys.stdout, 'buffer'):
+                self.f = io.TextIOWrapper(sys.stdout.buffer, newline=newline)
+            self.ownsFile = False
+        else:
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, self.tmpPath = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+            self.f = open(fd, 'w', buffering=BUFFER_SIZE, newline=newline)
+            self.ownsFile = True
+        self.bytesWritten = 0
+
+    def write(self, *parts):
+        text = ''.join(parts)
+        self.bytesWritten += len(text)
+        self.f.write(text)
+
+    def line(self, *parts):
+        self.write(*parts, '\n')
+
+    def lines(self, lines):
+        # one write for a whole batch of already generated declarations
+        self.write('\n'.join(lines), '\n')
+
+    def close(self):
+        self.f.flush()
+        if self.ownsFile:
+            mode = 0o644
+            if os.path.exists(self.path):
+                mode = os.stat(self.path).st_mode & 0o777
+            os.chmod(self.tmpPath, mode)
+            self.f.close()
+            os.replace(self.tmpPath, self.path)
+        elif self.f is not sys.stdout:
+            # leave sys.stdout usable once we're done with the wrapper
+            self.f.detach()
+
+    def abort(self):
+        if self.ownsFile:
+            self.f.close()
+            os.unlink(self.tmpPath)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, exc, tb):
+        if excType is None:
+            self.close()
+        else:
+            self.abort()
+        return False
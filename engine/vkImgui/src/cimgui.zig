@@ -6,18 +6,75 @@ pub const ConstCharPtrVector = extern struct {
     size: c_int,
     capacity: c_int,
     data: [*c][*c]const u8,
+
+    pub const Element = [*c]const u8;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const CharVector = extern struct {
     size: c_int,
     capacity: c_int,
     data: [*c][*c]u8,
+
+    pub const Element = [*c]u8;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const WcharVector = extern struct { // typedef struct ImVector_ImWchar {
     size: c_int,
     capacity: c_int,
     data: [*c]Wchar,
+
+    pub const Element = Wchar;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 const OldColumns = c_int;
@@ -1068,12 +1125,50 @@ pub const PlatformMonitorVector = extern struct { // struct ImVector_ImGuiPlatfo
     size: c_int,
     capacity: c_int,
     data: [*c]PlatformMonitor,
+
+    pub const Element = PlatformMonitor;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ViewportPtrVector = extern struct { // struct ImVector_ImGuiViewportPtr
     size: c_int,
     capacity: c_int,
     data: [*c][*c]Viewport,
+
+    pub const Element = [*c]Viewport;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const PlatformIO = extern struct { // struct ImGuiPlatformIO
@@ -1246,6 +1341,25 @@ pub const DrawListPtrVector = extern struct { // struct ImVector_ImDrawListPtr
     size: c_int,
     capacity: c_int,
     data: [*c][*c]DrawList,
+
+    pub const Element = [*c]DrawList;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const DrawList = extern struct { // struct ImDrawList
@@ -1713,6 +1827,25 @@ pub const ListClipperRangeVector = extern struct { // struct ImVector_ImGuiListC
     size: c_int,
     capacity: c_int,
     data: [*c]ListClipperRange,
+
+    pub const Element = ListClipperRange;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const NavItemData = extern struct { // struct ImGuiNavItemData
@@ -1737,6 +1870,25 @@ pub const OldColumnDataVector = extern struct { // struct ImVector_ImGuiOldColum
     size: c_int,
     capacity: c_int,
     data: [*c]OldColumnData,
+
+    pub const Element = OldColumnData;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const WindowPtrVector = extern struct { // struct ImVector_ImGuiWindowPtr
@@ -1858,66 +2010,275 @@ pub const InputEventVector = extern struct { // struct ImVector_ImGuiInputEvent
     size: c_int,
     capacity: c_int,
     data: [*c]InputEvent,
+
+    pub const Element = InputEvent;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const WindowStackDataVector = extern struct { // struct ImVector_ImGuiWindowStackData
     size: c_int,
     capacity: c_int,
     data: [*c]WindowStackData,
+
+    pub const Element = WindowStackData;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ColorModVector = extern struct { // struct ImVector_ImGuiColorMod
     size: c_int,
     capacity: c_int,
     data: [*c]ColorMod,
+
+    pub const Element = ColorMod;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const StyleModVector = extern struct { // struct ImGuiStyleMod
     size: c_int,
     capacity: c_int,
     data: [*c]StyleMod,
+
+    pub const Element = StyleMod;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const IDVector = extern struct { // struct ImGuiID
     size: c_int,
     capacity: c_int,
     data: [*c]ID,
+
+    pub const Element = ID;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ItemFlagsVector = extern struct { // struct ImGuiItemFlags
     size: c_int,
     capacity: c_int,
     data: [*c]ItemFlags,
+
+    pub const Element = ItemFlags;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const GroupDataVector = extern struct { // struct ImGuiGroupData
     size: c_int,
     capacity: c_int,
     data: [*c]GroupData,
+
+    pub const Element = GroupData;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const PopupDataVector = extern struct { // struct ImGuiPopupData
     size: c_int,
     capacity: c_int,
     data: [*c]PopupData,
+
+    pub const Element = PopupData;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ViewportPPtrVector = extern struct { // struct ImGuiViewportPPtr
     size: c_int,
     capacity: c_int,
     data: [*c][*c]ViewportP,
+
+    pub const Element = [*c]ViewportP;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ListClipperDataVector = extern struct { // struct ImGuiListClipperData
     size: c_int,
     capacity: c_int,
     data: [*c]ListClipperData,
+
+    pub const Element = ListClipperData;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const TableTempDataVector = extern struct { // struct ImVector_ImGuiTableTempData
     size: c_int,
     capacity: c_int,
     data: [*c]TableTempData,
+
+    pub const Element = TableTempData;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const TableVector = extern struct { // struct ImVector_ImGuiTable
@@ -1930,18 +2291,75 @@ pub const TabBarVector = extern struct { // struct ImVector_ImGuiTabBar
     size: c_int,
     capacity: c_int,
     data: [*c]TabBar,
+
+    pub const Element = TabBar;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const PtrOrIndexVector = extern struct { // struct ImVector_ImGuiPtrOrIndex
     size: c_int,
     capacity: c_int,
     data: [*c]PtrOrIndex,
+
+    pub const Element = PtrOrIndex;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ShrinkWidthItemVector = extern struct { // struct ImVector_ImGuiShrinkWidthItem
     size: c_int,
     capacity: c_int,
     data: [*c]ShrinkWidthItem,
+
+    pub const Element = ShrinkWidthItem;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ShrinkWidthItem = extern struct { // struct ImVector_ImGuiShrinkWidthItem
@@ -1954,18 +2372,75 @@ pub const SettingsHandlerVector = extern struct { // struct ImVector_ImGuiSettin
     size: c_int,
     capacity: c_int,
     data: [*c]SettingsHandler,
+
+    pub const Element = SettingsHandler;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const ContextHookVector = extern struct { // struct ImVector_ImGuiContextHook
     size: c_int,
     capacity: c_int,
     data: [*c]ContextHook,
+
+    pub const Element = ContextHook;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const u8Vector = extern struct { // struct ImVector_unsigned_char
     size: c_int,
     capacity: c_int,
     data: [*c]u8,
+
+    pub const Element = u8;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const TablePool = extern struct { // struct ImPool_ImGuiTable
@@ -1986,6 +2461,25 @@ pub const TabItemVector = extern struct { // struct ImVector_ImGuiTabItem
     size: c_int,
     capacity: c_int,
     data: [*c]TabItem,
+
+    pub const Element = TabItem;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const WindowSettingsChunkStream = extern struct { // struct ImChunkStream_ImGuiWindowSettings
@@ -2104,6 +2598,25 @@ pub const TableInstanceDataVector = extern struct { // struct ImVector_ImGuiTabl
     size: c_int,
     capacity: c_int,
     data: [*c]TableInstanceData,
+
+    pub const Element = TableInstanceData;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const TableColumnSortSpecsVector = extern struct { // struct ImVector_ImGuiTableColumnSortSpecs
@@ -2358,6 +2871,25 @@ pub const DrawChannelVector = extern struct { // struct ImVector_ImDrawChannel
     size: c_int,
     capacity: c_int,
     data: [*c]DrawChannel,
+
+    pub const Element = DrawChannel;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const DrawChannel = extern struct { // struct ImDrawChannel
@@ -2369,24 +2901,100 @@ pub const DrawCmdVector = extern struct { // struct ImVector_ImDrawCmd
     size: c_int,
     capacity: c_int,
     data: [*c]DrawCmd,
+
+    pub const Element = DrawCmd;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const DrawIdxVector = extern struct { // struct ImVector_ImDrawIdx
     size: c_int,
     capacity: c_int,
     data: [*c]DrawIdx,
+
+    pub const Element = DrawIdx;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const f32Vector = extern struct { // struct ImVector_float
     size: c_int,
     capacity: c_int,
     data: [*c]f32,
+
+    pub const Element = f32;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const FontPtrVector = extern struct { // struct ImVector_ImFontPtr
     size: c_int,
     capacity: c_int,
     data: [*c]Font,
+
+    pub const Element = Font;
+
+    pub fn asSlice(self: *@This()) []Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    pub fn asConstSlice(self: *const @This()) []const Element {
+        if (self.size <= 0) return self.data[0..0];
+        return self.data[0..@intCast(self.size)];
+    }
+
+    // copies every element to the front of dest in one go, returns how many
+    pub fn copyTo(self: *const @This(), dest: []Element) usize {
+        const items = self.asConstSlice();
+        @memcpy(dest[0..items.len], items);
+        return items.len;
+    }
 };
 
 pub const Payload = extern struct { // struct ImGuiPayload
@@ -2519,6 +3127,7 @@ pub const DrawListSplitter = extern struct { // struct ImDrawListSplitter
     _channels: DrawChannelVector,
 };
 
+// @generated functions begin (functions.py --splice, hand edits inside this block are overwritten)
 pub fn createContext(shared_font_atlas: [*c]FontAtlas) [*c]Context { //igCreateContext
     return c.igCreateContext(shared_font_atlas);
 }
@@ -2736,10 +3345,10 @@ pub fn popFont() void { //igPopFont
     c.igPopFont();
 }
 pub fn pushStyleColor_U32(idx: StyleColor, col: U32) void { //igPushStyleColor_U32
-    c.igPushStyleColor_U32(idx, col);
+    c.igPushStyleColor_U32(@intFromEnum(idx), col);
 }
 pub fn pushStyleColor_Vec4(idx: StyleColor, col: Vec4) void { //igPushStyleColor_Vec4
-    c.igPushStyleColor_Vec4(idx, @bitCast(col));
+    c.igPushStyleColor_Vec4(@intFromEnum(idx), @bitCast(col));
 }
 pub fn popStyleColor(count: c_int) void { //igPopStyleColor
     c.igPopStyleColor(count);
@@ -2793,7 +3402,7 @@ pub fn getFontTexUvWhitePixel(pout: [*c]Vec2) void { //igGetFontTexUvWhitePixel
     c.igGetFontTexUvWhitePixel(pout);
 }
 pub fn getColorU32_Col(idx: StyleColor, alpha_mul: f32) U32 { //igGetColorU32_Col
-    return c.igGetColorU32_Col(idx, alpha_mul);
+    return c.igGetColorU32_Col(@intFromEnum(idx), alpha_mul);
 }
 pub fn getColorU32_Vec4(col: Vec4) U32 { //igGetColorU32_Vec4
     return c.igGetColorU32_Vec4(@bitCast(col));
@@ -2802,13 +3411,13 @@ pub fn getColorU32_U32(col: U32) U32 { //igGetColorU32_U32
     return c.igGetColorU32_U32(col);
 }
 pub fn getStyleColorVec4(idx: StyleColor) [*c]const Vec4 { //igGetStyleColorVec4
-    return c.igGetStyleColorVec4(idx);
+    return c.igGetStyleColorVec4(@intFromEnum(idx));
 }
 pub fn separator() void { //igSeparator
     c.igSeparator();
 }
-pub fn sameLine(offset_from_start_x: f32, space: f32) void { //igSameLine
-    c.igSameLine(offset_from_start_x, space);
+pub fn sameLine(offset_from_start_x: f32, spacing_: f32) void { //igSameLine
+    c.igSameLine(offset_from_start_x, spacing_);
 }
 pub fn newLine() void { //igNewLine
     c.igNewLine();
@@ -2879,6 +3488,9 @@ pub fn pushID_Str(str_id: [*c]const u8) void { //igPushID_Str
 pub fn pushID_StrStr(str_id_begin: [*c]const u8, str_id_end: [*c]const u8) void { //igPushID_StrStr
     c.igPushID_StrStr(str_id_begin, str_id_end);
 }
+pub fn pushID_StrStrSlice(str_id: []const u8) void { //igPushID_StrStr
+    c.igPushID_StrStr(str_id.ptr, str_id.ptr + str_id.len);
+}
 pub fn pushID_Ptr(ptr_id: [*c]const void) void { //igPushID_Ptr
     c.igPushID_Ptr(ptr_id);
 }
@@ -2891,14 +3503,74 @@ pub fn popID() void { //igPopID
 pub fn getID_Str(str_id: [*c]const u8) ID { //igGetID_Str
     return c.igGetID_Str(str_id);
 }
+const idHashTable = blk: {
+    @setEvalBranchQuota(4096);
+    var table: [256]u32 = undefined;
+    for (&table, 0..) |*entry, i| {
+        var crc: u32 = @intCast(i);
+        for (0..8) |_| {
+            crc = if (crc & 1 != 0) (crc >> 1) ^ 0xEDB88320 else crc >> 1;
+        }
+        entry.* = crc;
+    }
+    break :blk table;
+};
+// same result as ImHashStr(str, str.len, seed): "###" resets to the seed
+pub fn hashStr(str: []const u8, seed: ID) ID {
+    const start: u32 = ~@as(u32, seed);
+    var crc = start;
+    for (str, 0..) |ch, i| {
+        if (ch == '#' and i + 2 < str.len and str[i + 1] == '#' and str[i + 2] == '#') {
+            crc = start;
+        }
+        crc = (crc >> 8) ^ idHashTable[(crc & 0xFF) ^ ch];
+    }
+    return ~crc;
+}
+// the id getID_Str(str) returns in the id scope seed, computed at compile
+// time. A top level window's scope is hashStr(window name, 0).
+pub inline fn getIDComptime(comptime str: []const u8, comptime seed: ID) ID {
+    return comptime blk: {
+        @setEvalBranchQuota(1000 + str.len * 8);
+        break :blk hashStr(str, seed);
+    };
+}
+// pushID_Str(str) inside the id scope seed, without hashing at runtime
+pub inline fn pushIDComptime(comptime str: []const u8, comptime seed: ID) void {
+    c.igPushOverrideID(getIDComptime(str, seed));
+}
 pub fn getID_StrStr(str_id_begin: [*c]const u8, str_id_end: [*c]const u8) ID { //igGetID_StrStr
     return c.igGetID_StrStr(str_id_begin, str_id_end);
 }
+pub fn getID_StrStrSlice(str_id: []const u8) ID { //igGetID_StrStr
+    return c.igGetID_StrStr(str_id.ptr, str_id.ptr + str_id.len);
+}
 pub fn getID_Ptr(ptr_id: [*c]const void) ID { //igGetID_Ptr
     return c.igGetID_Ptr(ptr_id);
 }
-pub fn textUnformatted(text: [*c]const u8, text_end: [*c]const u8) void { //igTextUnformatted
-    c.igTextUnformatted(text, text_end);
+pub fn textUnformatted(text_: [*c]const u8, text_end: [*c]const u8) void { //igTextUnformatted
+    c.igTextUnformatted(text_, text_end);
+}
+pub fn textUnformattedSlice(text_: []const u8) void { //igTextUnformatted
+    c.igTextUnformatted(text_.ptr, text_.ptr + text_.len);
+}
+pub fn text(str: []const u8) void { //igText
+    c.igTextUnformatted(str.ptr, str.ptr + str.len);
+}
+pub fn textColored(col: Vec4, str: []const u8) void { //igTextColored
+    c.igTextColored(@bitCast(col), "%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
+pub fn textDisabled(str: []const u8) void { //igTextDisabled
+    c.igTextDisabled("%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
+pub fn textWrapped(str: []const u8) void { //igTextWrapped
+    c.igTextWrapped("%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
+pub fn labelText(label: [*c]const u8, str: []const u8) void { //igLabelText
+    c.igLabelText(label, "%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
+pub fn bulletText(str: []const u8) void { //igBulletText
+    c.igBulletText("%.*s", @as(c_int, @intCast(str.len)), str.ptr);
 }
 pub fn button(label: [*c]const u8, size: Vec2) bool { //igButton
     return c.igButton(label, @bitCast(size));
@@ -2951,12 +3623,30 @@ pub fn combo_Str(label: [*c]const u8, current_item: [*c]c_int, items_separated_b
 pub fn dragFloat(label: [*c]const u8, v: [*c]f32, v_speed: f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igDragFloat
     return c.igDragFloat(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
 }
+pub fn dragFloat2(label: [*c]const u8, v: [*c]f32, v_speed: f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igDragFloat2
+    return c.igDragFloat2(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
+}
+pub fn dragFloat3(label: [*c]const u8, v: [*c]f32, v_speed: f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igDragFloat3
+    return c.igDragFloat3(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
+}
+pub fn dragFloat4(label: [*c]const u8, v: [*c]f32, v_speed: f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igDragFloat4
+    return c.igDragFloat4(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
+}
 pub fn dragFloatRange2(label: [*c]const u8, v_current_min: [*c]f32, v_current_max: [*c]f32, v_speed: f32, v_min: f32, v_max: f32, format: [*c]const u8, format_max: [*c]const u8, flags: SliderFlags) bool { //igDragFloatRange2
     return c.igDragFloatRange2(label, v_current_min, v_current_max, v_speed, v_min, v_max, format, format_max, @bitCast(flags));
 }
 pub fn dragInt(label: [*c]const u8, v: [*c]c_int, v_speed: f32, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igDragInt
     return c.igDragInt(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
 }
+pub fn dragInt2(label: [*c]const u8, v: [*c]c_int, v_speed: f32, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igDragInt2
+    return c.igDragInt2(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
+}
+pub fn dragInt3(label: [*c]const u8, v: [*c]c_int, v_speed: f32, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igDragInt3
+    return c.igDragInt3(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
+}
+pub fn dragInt4(label: [*c]const u8, v: [*c]c_int, v_speed: f32, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igDragInt4
+    return c.igDragInt4(label, v, v_speed, v_min, v_max, format, @bitCast(flags));
+}
 pub fn dragIntRange2(label: [*c]const u8, v_current_min: [*c]c_int, v_current_max: [*c]c_int, v_speed: f32, v_min: c_int, v_max: c_int, format: [*c]const u8, format_max: [*c]const u8, flags: SliderFlags) bool { //igDragIntRange2
     return c.igDragIntRange2(label, v_current_min, v_current_max, v_speed, v_min, v_max, format, format_max, @bitCast(flags));
 }
@@ -2969,12 +3659,30 @@ pub fn dragScalarN(label: [*c]const u8, data_type: DataType, p_data: ?*anyopaque
 pub fn sliderFloat(label: [*c]const u8, v: [*c]f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igSliderFloat
     return c.igSliderFloat(label, v, v_min, v_max, format, @bitCast(flags));
 }
+pub fn sliderFloat2(label: [*c]const u8, v: [*c]f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igSliderFloat2
+    return c.igSliderFloat2(label, v, v_min, v_max, format, @bitCast(flags));
+}
+pub fn sliderFloat3(label: [*c]const u8, v: [*c]f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igSliderFloat3
+    return c.igSliderFloat3(label, v, v_min, v_max, format, @bitCast(flags));
+}
+pub fn sliderFloat4(label: [*c]const u8, v: [*c]f32, v_min: f32, v_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igSliderFloat4
+    return c.igSliderFloat4(label, v, v_min, v_max, format, @bitCast(flags));
+}
 pub fn sliderAngle(label: [*c]const u8, v_rad: [*c]f32, v_degrees_min: f32, v_degrees_max: f32, format: [*c]const u8, flags: SliderFlags) bool { //igSliderAngle
     return c.igSliderAngle(label, v_rad, v_degrees_min, v_degrees_max, format, @bitCast(flags));
 }
 pub fn sliderInt(label: [*c]const u8, v: [*c]c_int, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igSliderInt
     return c.igSliderInt(label, v, v_min, v_max, format, @bitCast(flags));
 }
+pub fn sliderInt2(label: [*c]const u8, v: [*c]c_int, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igSliderInt2
+    return c.igSliderInt2(label, v, v_min, v_max, format, @bitCast(flags));
+}
+pub fn sliderInt3(label: [*c]const u8, v: [*c]c_int, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igSliderInt3
+    return c.igSliderInt3(label, v, v_min, v_max, format, @bitCast(flags));
+}
+pub fn sliderInt4(label: [*c]const u8, v: [*c]c_int, v_min: c_int, v_max: c_int, format: [*c]const u8, flags: SliderFlags) bool { //igSliderInt4
+    return c.igSliderInt4(label, v, v_min, v_max, format, @bitCast(flags));
+}
 pub fn sliderScalar(label: [*c]const u8, data_type: DataType, p_data: ?*anyopaque, p_min: [*c]const void, p_max: [*c]const void, format: [*c]const u8, flags: SliderFlags) bool { //igSliderScalar
     return c.igSliderScalar(label, @intFromEnum(data_type), p_data, p_min, p_max, format, @bitCast(flags));
 }
@@ -3002,10 +3710,27 @@ pub fn inputTextWithHint(label: [*c]const u8, hint: [*c]const u8, buf: [*c]u8, b
 pub fn inputFloat(label: [*c]const u8, v: [*c]f32, step: f32, step_fast: f32, format: [*c]const u8, flags: InputTextFlags) bool { //igInputFloat
     return c.igInputFloat(label, v, step, step_fast, format, @bitCast(flags));
 }
+pub fn inputFloat2(label: [*c]const u8, v: [*c]f32, format: [*c]const u8, flags: InputTextFlags) bool { //igInputFloat2
+    return c.igInputFloat2(label, v, format, @bitCast(flags));
+}
+pub fn inputFloat3(label: [*c]const u8, v: [*c]f32, format: [*c]const u8, flags: InputTextFlags) bool { //igInputFloat3
+    return c.igInputFloat3(label, v, format, @bitCast(flags));
+}
+pub fn inputFloat4(label: [*c]const u8, v: [*c]f32, format: [*c]const u8, flags: InputTextFlags) bool { //igInputFloat4
+    return c.igInputFloat4(label, v, format, @bitCast(flags));
+}
 pub fn inputInt(label: [*c]const u8, v: [*c]c_int, step: c_int, step_fast: c_int, flags: InputTextFlags) bool { //igInputInt
     return c.igInputInt(label, v, step, step_fast, @bitCast(flags));
 }
-
+pub fn inputInt2(label: [*c]const u8, v: [*c]c_int, flags: InputTextFlags) bool { //igInputInt2
+    return c.igInputInt2(label, v, @bitCast(flags));
+}
+pub fn inputInt3(label: [*c]const u8, v: [*c]c_int, flags: InputTextFlags) bool { //igInputInt3
+    return c.igInputInt3(label, v, @bitCast(flags));
+}
+pub fn inputInt4(label: [*c]const u8, v: [*c]c_int, flags: InputTextFlags) bool { //igInputInt4
+    return c.igInputInt4(label, v, @bitCast(flags));
+}
 pub fn inputDouble(label: [*c]const u8, v: [*c]f64, step: f64, step_fast: f64, format: [*c]const u8, flags: InputTextFlags) bool { //igInputDouble
     return c.igInputDouble(label, v, step, step_fast, format, @bitCast(flags));
 }
@@ -3015,6 +3740,18 @@ pub fn inputScalar(label: [*c]const u8, data_type: DataType, p_data: ?*anyopaque
 pub fn inputScalarN(label: [*c]const u8, data_type: DataType, p_data: ?*anyopaque, components: c_int, p_step: [*c]const void, p_step_fast: [*c]const void, format: [*c]const u8, flags: InputTextFlags) bool { //igInputScalarN
     return c.igInputScalarN(label, @intFromEnum(data_type), p_data, components, p_step, p_step_fast, format, @bitCast(flags));
 }
+pub fn colorEdit3(label: [*c]const u8, col: [*c]f32, flags: ColorEditFlags) bool { //igColorEdit3
+    return c.igColorEdit3(label, col, @bitCast(flags));
+}
+pub fn colorEdit4(label: [*c]const u8, col: [*c]f32, flags: ColorEditFlags) bool { //igColorEdit4
+    return c.igColorEdit4(label, col, @bitCast(flags));
+}
+pub fn colorPicker3(label: [*c]const u8, col: [*c]f32, flags: ColorEditFlags) bool { //igColorPicker3
+    return c.igColorPicker3(label, col, @bitCast(flags));
+}
+pub fn colorPicker4(label: [*c]const u8, col: [*c]f32, flags: ColorEditFlags, ref_col: [*c]const f32) bool { //igColorPicker4
+    return c.igColorPicker4(label, col, @bitCast(flags), ref_col);
+}
 pub fn colorButton(desc_id: [*c]const u8, col: Vec4, flags: ColorEditFlags, size: Vec2) bool { //igColorButton
     return c.igColorButton(desc_id, @bitCast(col), @bitCast(flags), @bitCast(size));
 }
@@ -3024,9 +3761,21 @@ pub fn setColorEditOptions(flags: ColorEditFlags) void { //igSetColorEditOptions
 pub fn treeNode_Str(label: [*c]const u8) bool { //igTreeNode_Str
     return c.igTreeNode_Str(label);
 }
+pub fn treeNode_StrStr(str_id: [*c]const u8, str: []const u8) bool { //igTreeNode_StrStr
+    return c.igTreeNode_StrStr(str_id, "%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
+pub fn treeNode_Ptr(ptr_id: [*c]const void, str: []const u8) bool { //igTreeNode_Ptr
+    return c.igTreeNode_Ptr(ptr_id, "%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
 pub fn treeNodeEx_Str(label: [*c]const u8, flags: TreeNodeFlags) bool { //igTreeNodeEx_Str
     return c.igTreeNodeEx_Str(label, @bitCast(flags));
 }
+pub fn treeNodeEx_StrStr(str_id: [*c]const u8, flags: TreeNodeFlags, str: []const u8) bool { //igTreeNodeEx_StrStr
+    return c.igTreeNodeEx_StrStr(str_id, @bitCast(flags), "%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
+pub fn treeNodeEx_Ptr(ptr_id: [*c]const void, flags: TreeNodeFlags, str: []const u8) bool { //igTreeNodeEx_Ptr
+    return c.igTreeNodeEx_Ptr(ptr_id, @bitCast(flags), "%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
 pub fn treePush_Str(str_id: [*c]const u8) void { //igTreePush_Str
     c.igTreePush_Str(str_id);
 }
@@ -3108,6 +3857,9 @@ pub fn beginTooltip() void { //igBeginTooltip
 pub fn endTooltip() void { //igEndTooltip
     c.igEndTooltip();
 }
+pub fn setTooltip(str: []const u8) void { //igSetTooltip
+    c.igSetTooltip("%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
 pub fn beginPopup(str_id: [*c]const u8, flags: WindowFlags) bool { //igBeginPopup
     return c.igBeginPopup(str_id, @bitCast(flags));
 }
@@ -3168,6 +3920,9 @@ pub fn tableHeadersRow() void { //igTableHeadersRow
 pub fn tableHeader(label: [*c]const u8) void { //igTableHeader
     c.igTableHeader(label);
 }
+pub fn tableGetSortSpecs() [*c]TableSortSpecs { //igTableGetSortSpecs
+    return @ptrCast(c.igTableGetSortSpecs());
+}
 pub fn tableGetColumnCount() c_int { //igTableGetColumnCount
     return c.igTableGetColumnCount();
 }
@@ -3267,8 +4022,8 @@ pub fn logButtons() void { //igLogButtons
 pub fn beginDragDropSource(flags: DragDropFlags) bool { //igBeginDragDropSource
     return c.igBeginDragDropSource(@bitCast(flags));
 }
-pub fn setDragDropPayload(t: [*c]const u8, data: [*c]const void, sz: usize, cond: Cond) bool { //igSetDragDropPayload
-    return c.igSetDragDropPayload(t, data, sz, @bitCast(cond));
+pub fn setDragDropPayload(type_: [*c]const u8, data: [*c]const void, sz: usize, cond: Cond) bool { //igSetDragDropPayload
+    return c.igSetDragDropPayload(type_, data, sz, @bitCast(cond));
 }
 pub fn endDragDropSource() void { //igEndDragDropSource
     c.igEndDragDropSource();
@@ -3276,8 +4031,8 @@ pub fn endDragDropSource() void { //igEndDragDropSource
 pub fn beginDragDropTarget() bool { //igBeginDragDropTarget
     return c.igBeginDragDropTarget();
 }
-pub fn acceptDragDropPayload(t: [*c]const u8, flags: DragDropFlags) [*c]const Payload { //igAcceptDragDropPayload
-    return c.igAcceptDragDropPayload(t, @bitCast(flags));
+pub fn acceptDragDropPayload(type_: [*c]const u8, flags: DragDropFlags) [*c]const Payload { //igAcceptDragDropPayload
+    return c.igAcceptDragDropPayload(type_, @bitCast(flags));
 }
 pub fn endDragDropTarget() void { //igEndDragDropTarget
     c.igEndDragDropTarget();
@@ -3385,7 +4140,7 @@ pub fn getDrawListSharedData() [*c]DrawListSharedData { //igGetDrawListSharedDat
     return c.igGetDrawListSharedData();
 }
 pub fn getStyleColorName(idx: StyleColor) [*c]const u8 { //igGetStyleColorName
-    return c.igGetStyleColorName(idx);
+    return c.igGetStyleColorName(@intFromEnum(idx));
 }
 pub fn setStateStorage(storage: [*c]Storage) void { //igSetStateStorage
     c.igSetStateStorage(storage);
@@ -3399,8 +4154,11 @@ pub fn beginChildFrame(id: ID, size: Vec2, flags: WindowFlags) bool { //igBeginC
 pub fn endChildFrame() void { //igEndChildFrame
     c.igEndChildFrame();
 }
-pub fn calcTextSize(pout: [*c]Vec2, text: [*c]const u8, text_end: [*c]const u8, hide_text_after_double_hash: bool, wrap_width: f32) void { //igCalcTextSize
-    c.igCalcTextSize(pout, text, text_end, hide_text_after_double_hash, wrap_width);
+pub fn calcTextSize(pout: [*c]Vec2, text_: [*c]const u8, text_end: [*c]const u8, hide_text_after_double_hash: bool, wrap_width: f32) void { //igCalcTextSize
+    c.igCalcTextSize(pout, text_, text_end, hide_text_after_double_hash, wrap_width);
+}
+pub fn calcTextSizeSlice(pout: [*c]Vec2, text_: []const u8, hide_text_after_double_hash: bool, wrap_width: f32) void { //igCalcTextSize
+    c.igCalcTextSize(pout, text_.ptr, text_.ptr + text_.len, hide_text_after_double_hash, wrap_width);
 }
 pub fn colorConvertU32ToFloat4(pout: [*c]Vec4, in: U32) void { //igColorConvertU32ToFloat4
     c.igColorConvertU32ToFloat4(pout, in);
@@ -3432,20 +4190,20 @@ pub fn getKeyName(key: Key) [*c]const u8 { //igGetKeyName
 pub fn setNextFrameWantCaptureKeyboard(want_capture_keyboard: bool) void { //igSetNextFrameWantCaptureKeyboard
     c.igSetNextFrameWantCaptureKeyboard(want_capture_keyboard);
 }
-pub fn isMouseDown(btn: MouseButton) bool { //igIsMouseDown
-    return c.igIsMouseDown(@intFromEnum(btn));
+pub fn isMouseDown(button_: MouseButton) bool { //igIsMouseDown
+    return c.igIsMouseDown(@intFromEnum(button_));
 }
-pub fn isMouseClicked(btn: MouseButton, repeat: bool) bool { //igIsMouseClicked
-    return c.igIsMouseClicked(@intFromEnum(btn), repeat);
+pub fn isMouseClicked(button_: MouseButton, repeat: bool) bool { //igIsMouseClicked
+    return c.igIsMouseClicked(@intFromEnum(button_), repeat);
 }
-pub fn isMouseReleased(btn: MouseButton) bool { //igIsMouseReleased
-    return c.igIsMouseReleased(@intFromEnum(btn));
+pub fn isMouseReleased(button_: MouseButton) bool { //igIsMouseReleased
+    return c.igIsMouseReleased(@intFromEnum(button_));
 }
-pub fn isMouseDoubleClicked(btn: MouseButton) bool { //igIsMouseDoubleClicked
-    return c.igIsMouseDoubleClicked(@intFromEnum(btn));
+pub fn isMouseDoubleClicked(button_: MouseButton) bool { //igIsMouseDoubleClicked
+    return c.igIsMouseDoubleClicked(@intFromEnum(button_));
 }
-pub fn getMouseClickedCount(btn: MouseButton) c_int { //igGetMouseClickedCount
-    return c.igGetMouseClickedCount(@intFromEnum(btn));
+pub fn getMouseClickedCount(button_: MouseButton) c_int { //igGetMouseClickedCount
+    return c.igGetMouseClickedCount(@intFromEnum(button_));
 }
 pub fn isMouseHoveringRect(r_min: Vec2, r_max: Vec2, clip: bool) bool { //igIsMouseHoveringRect
     return c.igIsMouseHoveringRect(@bitCast(r_min), @bitCast(r_max), clip);
@@ -3462,14 +4220,14 @@ pub fn getMousePos(pout: [*c]Vec2) void { //igGetMousePos
 pub fn getMousePosOnOpeningCurrentPopup(pout: [*c]Vec2) void { //igGetMousePosOnOpeningCurrentPopup
     c.igGetMousePosOnOpeningCurrentPopup(pout);
 }
-pub fn isMouseDragging(btn: MouseButton, lock_threshold: f32) bool { //igIsMouseDragging
-    return c.igIsMouseDragging(@intFromEnum(btn), lock_threshold);
+pub fn isMouseDragging(button_: MouseButton, lock_threshold: f32) bool { //igIsMouseDragging
+    return c.igIsMouseDragging(@intFromEnum(button_), lock_threshold);
 }
-pub fn getMouseDragDelta(pout: [*c]Vec2, btn: MouseButton, lock_threshold: f32) void { //igGetMouseDragDelta
-    c.igGetMouseDragDelta(pout, @intFromEnum(btn), lock_threshold);
+pub fn getMouseDragDelta(pout: [*c]Vec2, button_: MouseButton, lock_threshold: f32) void { //igGetMouseDragDelta
+    c.igGetMouseDragDelta(pout, @intFromEnum(button_), lock_threshold);
 }
-pub fn resetMouseDragDelta(btn: MouseButton) void { //igResetMouseDragDelta
-    c.igResetMouseDragDelta(@intFromEnum(btn));
+pub fn resetMouseDragDelta(button_: MouseButton) void { //igResetMouseDragDelta
+    c.igResetMouseDragDelta(@intFromEnum(button_));
 }
 pub fn getMouseCursor() MouseCursor { //igGetMouseCursor
     return c.igGetMouseCursor();
@@ -3483,8 +4241,8 @@ pub fn setNextFrameWantCaptureMouse(want_capture_mouse: bool) void { //igSetNext
 pub fn getClipboardText() [*c]const u8 { //igGetClipboardText
     return c.igGetClipboardText();
 }
-pub fn setClipboardText(text: [*c]const u8) void { //igSetClipboardText
-    c.igSetClipboardText(text);
+pub fn setClipboardText(text_: [*c]const u8) void { //igSetClipboardText
+    c.igSetClipboardText(text_);
 }
 pub fn loadIniSettingsFromDisk(ini_filename: [*c]const u8) void { //igLoadIniSettingsFromDisk
     c.igLoadIniSettingsFromDisk(ini_filename);
@@ -3498,8 +4256,8 @@ pub fn saveIniSettingsToDisk(ini_filename: [*c]const u8) void { //igSaveIniSetti
 pub fn saveIniSettingsToMemory(out_ini_size: [*c]usize) [*c]const u8 { //igSaveIniSettingsToMemory
     return c.igSaveIniSettingsToMemory(out_ini_size);
 }
-pub fn debugTextEncoding(text: [*c]const u8) void { //igDebugTextEncoding
-    c.igDebugTextEncoding(text);
+pub fn debugTextEncoding(text_: [*c]const u8) void { //igDebugTextEncoding
+    c.igDebugTextEncoding(text_);
 }
 pub fn debugCheckVersionAndDataLayout(version_str: [*c]const u8, sz_io: usize, sz_style: usize, sz_vec2: usize, sz_vec4: usize, sz_drawvert: usize, sz_drawidx: usize) bool { //igDebugCheckVersionAndDataLayout
     return c.igDebugCheckVersionAndDataLayout(version_str, sz_io, sz_style, sz_vec2, sz_vec4, sz_drawvert, sz_drawidx);
@@ -3507,9 +4265,6 @@ pub fn debugCheckVersionAndDataLayout(version_str: [*c]const u8, sz_io: usize, s
 pub fn setAllocatorFunctions(alloc_func: MemAllocFunc, free_func: MemFreeFunc, user_data: ?*anyopaque) void { //igSetAllocatorFunctions
     c.igSetAllocatorFunctions(alloc_func, free_func, user_data);
 }
-pub fn getAllocatorFunctions(p_alloc_func: [*c]MemAllocFunc, p_free_func: [*c]MemFreeFunc, p_user_data: [*c]void) void { //igGetAllocatorFunctions
-    c.igGetAllocatorFunctions(p_alloc_func, p_free_func, p_user_data);
-}
 pub fn memAlloc(size: usize) ?*anyopaque { //igMemAlloc
     return c.igMemAlloc(size);
 }
@@ -3543,9 +4298,6 @@ pub fn imHashData(data: [*c]const void, data_size: usize, seed: U32) ID { //igIm
 pub fn imHashStr(data: [*c]const u8, data_size: usize, seed: U32) ID { //igImHashStr
     return c.igImHashStr(data, data_size, seed);
 }
-pub fn imQsort(base: ?*anyopaque, count: usize, size_of_element: usize) void { //igImQsort
-    c.igImQsort(base, count, size_of_element);
-}
 pub fn imAlphaBlendColors(col_a: U32, col_b: U32) U32 { //igImAlphaBlendColors
     return c.igImAlphaBlendColors(col_a, col_b);
 }
@@ -3573,8 +4325,11 @@ pub fn imStrdup(str: [*c]const u8) [*c]u8 { //igImStrdup
 pub fn imStrdupcpy(dst: [*c]u8, p_dst_size: [*c]usize, str: [*c]const u8) [*c]u8 { //igImStrdupcpy
     return c.igImStrdupcpy(dst, p_dst_size, str);
 }
-pub fn imStrchrRange(str_begin: [*c]const u8, str_end: [*c]const u8, ch: u8) [*c]const u8 { //igImStrchrRange
-    return c.igImStrchrRange(str_begin, str_end, ch);
+pub fn imStrchrRange(str_begin: [*c]const u8, str_end: [*c]const u8, c_: u8) [*c]const u8 { //igImStrchrRange
+    return c.igImStrchrRange(str_begin, str_end, c_);
+}
+pub fn imStrchrRangeSlice(str: []const u8, c_: u8) [*c]const u8 { //igImStrchrRange
+    return c.igImStrchrRange(str.ptr, str.ptr + str.len, c_);
 }
 pub fn imStrlenW(str: [*c]const Wchar) c_int { //igImStrlenW
     return c.igImStrlenW(str);
@@ -3582,23 +4337,32 @@ pub fn imStrlenW(str: [*c]const Wchar) c_int { //igImStrlenW
 pub fn imStreolRange(str: [*c]const u8, str_end: [*c]const u8) [*c]const u8 { //igImStreolRange
     return c.igImStreolRange(str, str_end);
 }
+pub fn imStreolRangeSlice(str: []const u8) [*c]const u8 { //igImStreolRange
+    return c.igImStreolRange(str.ptr, str.ptr + str.len);
+}
 pub fn imStrbolW(buf_mid_line: [*c]const Wchar, buf_begin: [*c]const Wchar) [*c]const Wchar { //igImStrbolW
     return c.igImStrbolW(buf_mid_line, buf_begin);
 }
 pub fn imStristr(haystack: [*c]const u8, haystack_end: [*c]const u8, needle: [*c]const u8, needle_end: [*c]const u8) [*c]const u8 { //igImStristr
     return c.igImStristr(haystack, haystack_end, needle, needle_end);
 }
+pub fn imStristrSlice(haystack: []const u8, needle: []const u8) [*c]const u8 { //igImStristr
+    return c.igImStristr(haystack.ptr, haystack.ptr + haystack.len, needle.ptr, needle.ptr + needle.len);
+}
 pub fn imStrTrimBlanks(str: [*c]u8) void { //igImStrTrimBlanks
     c.igImStrTrimBlanks(str);
 }
 pub fn imStrSkipBlank(str: [*c]const u8) [*c]const u8 { //igImStrSkipBlank
     return c.igImStrSkipBlank(str);
 }
-pub fn imCharIsBlankA(ch: u8) bool { //igImCharIsBlankA
-    return c.igImCharIsBlankA(ch);
+pub fn imCharIsBlankA(c_: u8) bool { //igImCharIsBlankA
+    return c.igImCharIsBlankA(c_);
 }
-pub fn imCharIsBlankW(ch: c_uint) bool { //igImCharIsBlankW
-    return c.igImCharIsBlankW(ch);
+pub fn imCharIsBlankW(c_: c_uint) bool { //igImCharIsBlankW
+    return c.igImCharIsBlankW(c_);
+}
+pub fn imFormatString(buf: [*c]u8, buf_size: usize, str: []const u8) c_int { //igImFormatString
+    return c.igImFormatString(buf, buf_size, "%.*s", @as(c_int, @intCast(str.len)), str.ptr);
 }
 pub fn imParseFormatFindStart(format: [*c]const u8) [*c]const u8 { //igImParseFormatFindStart
     return c.igImParseFormatFindStart(format);
@@ -3618,24 +4382,39 @@ pub fn imParseFormatSanitizeForScanning(fmt_in: [*c]const u8, fmt_out: [*c]u8, f
 pub fn imParseFormatPrecision(format: [*c]const u8, default_value: c_int) c_int { //igImParseFormatPrecision
     return c.igImParseFormatPrecision(format, default_value);
 }
+pub fn imTextCharToUtf8(out_buf: [*c]u8, c_: c_uint) [*c]const u8 { //igImTextCharToUtf8
+    return c.igImTextCharToUtf8(out_buf, c_);
+}
 pub fn imTextStrToUtf8(out_buf: [*c]u8, out_buf_size: c_int, in_text: [*c]const Wchar, in_text_end: [*c]const Wchar) c_int { //igImTextStrToUtf8
     return c.igImTextStrToUtf8(out_buf, out_buf_size, in_text, in_text_end);
 }
+pub fn imTextStrToUtf8Slice(out_buf: [*c]u8, out_buf_size: c_int, in_text: []const Wchar) c_int { //igImTextStrToUtf8
+    return c.igImTextStrToUtf8(out_buf, out_buf_size, in_text.ptr, in_text.ptr + in_text.len);
+}
 pub fn imTextCharFromUtf8(out_char: [*c]c_uint, in_text: [*c]const u8, in_text_end: [*c]const u8) c_int { //igImTextCharFromUtf8
     return c.igImTextCharFromUtf8(out_char, in_text, in_text_end);
 }
-pub fn imTextStrFromUtf8(out_buf: [*c]Wchar, out_buf_size: c_int, in_text: [*c]const u8, in_text_end: [*c]const u8, in_remaining: [*c]const u8) c_int { //igImTextStrFromUtf8
-    return c.igImTextStrFromUtf8(out_buf, out_buf_size, in_text, in_text_end, in_remaining);
+pub fn imTextCharFromUtf8Slice(out_char: [*c]c_uint, in_text: []const u8) c_int { //igImTextCharFromUtf8
+    return c.igImTextCharFromUtf8(out_char, in_text.ptr, in_text.ptr + in_text.len);
 }
 pub fn imTextCountCharsFromUtf8(in_text: [*c]const u8, in_text_end: [*c]const u8) c_int { //igImTextCountCharsFromUtf8
     return c.igImTextCountCharsFromUtf8(in_text, in_text_end);
 }
+pub fn imTextCountCharsFromUtf8Slice(in_text: []const u8) c_int { //igImTextCountCharsFromUtf8
+    return c.igImTextCountCharsFromUtf8(in_text.ptr, in_text.ptr + in_text.len);
+}
 pub fn imTextCountUtf8BytesFromChar(in_text: [*c]const u8, in_text_end: [*c]const u8) c_int { //igImTextCountUtf8BytesFromChar
     return c.igImTextCountUtf8BytesFromChar(in_text, in_text_end);
 }
+pub fn imTextCountUtf8BytesFromCharSlice(in_text: []const u8) c_int { //igImTextCountUtf8BytesFromChar
+    return c.igImTextCountUtf8BytesFromChar(in_text.ptr, in_text.ptr + in_text.len);
+}
 pub fn imTextCountUtf8BytesFromStr(in_text: [*c]const Wchar, in_text_end: [*c]const Wchar) c_int { //igImTextCountUtf8BytesFromStr
     return c.igImTextCountUtf8BytesFromStr(in_text, in_text_end);
 }
+pub fn imTextCountUtf8BytesFromStrSlice(in_text: []const Wchar) c_int { //igImTextCountUtf8BytesFromStr
+    return c.igImTextCountUtf8BytesFromStr(in_text.ptr, in_text.ptr + in_text.len);
+}
 pub fn imFileOpen(filename: [*c]const u8, mode: [*c]const u8) FileHandle { //igImFileOpen
     return c.igImFileOpen(filename, mode);
 }
@@ -3762,17 +4541,17 @@ pub fn imBezierQuadraticCalc(pout: [*c]Vec2, p1: Vec2, p2: Vec2, p3: Vec2, t: f3
 pub fn imLineClosestPoint(pout: [*c]Vec2, a: Vec2, b: Vec2, p: Vec2) void { //igImLineClosestPoint
     c.igImLineClosestPoint(pout, @bitCast(a), @bitCast(b), @bitCast(p));
 }
-pub fn imTriangleContainsPoint(a: Vec2, b: Vec2, _c: Vec2, p: Vec2) bool { //igImTriangleContainsPoint
-    return c.igImTriangleContainsPoint(@bitCast(a), @bitCast(b), @bitCast(_c), @bitCast(p));
+pub fn imTriangleContainsPoint(a: Vec2, b: Vec2, c_: Vec2, p: Vec2) bool { //igImTriangleContainsPoint
+    return c.igImTriangleContainsPoint(@bitCast(a), @bitCast(b), @bitCast(c_), @bitCast(p));
 }
-pub fn imTriangleClosestPoint(pout: [*c]Vec2, a: Vec2, b: Vec2, _c: Vec2, p: Vec2) void { //igImTriangleClosestPoint
-    c.igImTriangleClosestPoint(pout, @bitCast(a), @bitCast(b), @bitCast(_c), @bitCast(p));
+pub fn imTriangleClosestPoint(pout: [*c]Vec2, a: Vec2, b: Vec2, c_: Vec2, p: Vec2) void { //igImTriangleClosestPoint
+    c.igImTriangleClosestPoint(pout, @bitCast(a), @bitCast(b), @bitCast(c_), @bitCast(p));
 }
-pub fn imTriangleBarycentricCoords(a: Vec2, b: Vec2, _c: Vec2, p: Vec2, out_u: [*c]f32, out_v: [*c]f32, out_w: [*c]f32) void { //igImTriangleBarycentricCoords
-    c.igImTriangleBarycentricCoords(@bitCast(a), @bitCast(b), @bitCast(_c), @bitCast(p), out_u, out_v, out_w);
+pub fn imTriangleBarycentricCoords(a: Vec2, b: Vec2, c_: Vec2, p: Vec2, out_u: [*c]f32, out_v: [*c]f32, out_w: [*c]f32) void { //igImTriangleBarycentricCoords
+    c.igImTriangleBarycentricCoords(@bitCast(a), @bitCast(b), @bitCast(c_), @bitCast(p), out_u, out_v, out_w);
 }
-pub fn imTriangleArea(a: Vec2, b: Vec2, _c: Vec2) f32 { //igImTriangleArea
-    return c.igImTriangleArea(@bitCast(a), @bitCast(b), @bitCast(_c));
+pub fn imTriangleArea(a: Vec2, b: Vec2, c_: Vec2) f32 { //igImTriangleArea
+    return c.igImTriangleArea(@bitCast(a), @bitCast(b), @bitCast(c_));
 }
 pub fn imGetDirQuadrantFromDelta(dx: f32, dy: f32) Dir { //igImGetDirQuadrantFromDelta
     return c.igImGetDirQuadrantFromDelta(dx, dy);
@@ -3900,8 +4679,8 @@ pub fn addContextHook(context: [*c]Context, hook: [*c]const ContextHook) ID { //
 pub fn removeContextHook(context: [*c]Context, hook_to_remove: ID) void { //igRemoveContextHook
     c.igRemoveContextHook(context, hook_to_remove);
 }
-pub fn callContextHooks(context: [*c]Context, t: ContextHookType) void { //igCallContextHooks
-    c.igCallContextHooks(context, @intFromEnum(t));
+pub fn callContextHooks(context: [*c]Context, type_: ContextHookType) void { //igCallContextHooks
+    c.igCallContextHooks(context, @intFromEnum(type_));
 }
 pub fn translateWindowsInViewport(viewport: [*c]ViewportP, old_pos: Vec2, new_pos: Vec2) void { //igTranslateWindowsInViewport
     c.igTranslateWindowsInViewport(viewport, @bitCast(old_pos), @bitCast(new_pos));
@@ -4020,6 +4799,9 @@ pub fn pushOverrideID(id: ID) void { //igPushOverrideID
 pub fn getIDWithSeed(str_id_begin: [*c]const u8, str_id_end: [*c]const u8, seed: ID) ID { //igGetIDWithSeed
     return c.igGetIDWithSeed(str_id_begin, str_id_end, seed);
 }
+pub fn getIDWithSeedSlice(str_id: []const u8, seed: ID) ID { //igGetIDWithSeed
+    return c.igGetIDWithSeed(str_id.ptr, str_id.ptr + str_id.len, seed);
+}
 pub fn itemSize_Vec2(size: Vec2, text_baseline_y: f32) void { //igItemSize_Vec2
     c.igItemSize_Vec2(@bitCast(size), text_baseline_y);
 }
@@ -4062,14 +4844,17 @@ pub fn pushItemFlag(option: ItemFlags, enabled: bool) void { //igPushItemFlag
 pub fn popItemFlag() void { //igPopItemFlag
     c.igPopItemFlag();
 }
-pub fn logBegin(t: LogType, auto_open_depth: c_int) void { //igLogBegin
-    c.igLogBegin(@intFromEnum(t), auto_open_depth);
+pub fn logBegin(type_: LogType, auto_open_depth: c_int) void { //igLogBegin
+    c.igLogBegin(@intFromEnum(type_), auto_open_depth);
 }
 pub fn logToBuffer(auto_open_depth: c_int) void { //igLogToBuffer
     c.igLogToBuffer(auto_open_depth);
 }
-pub fn logRenderedText(ref_pos: [*c]const Vec2, text: [*c]const u8, text_end: [*c]const u8) void { //igLogRenderedText
-    c.igLogRenderedText(ref_pos, text, text_end);
+pub fn logRenderedText(ref_pos: [*c]const Vec2, text_: [*c]const u8, text_end: [*c]const u8) void { //igLogRenderedText
+    c.igLogRenderedText(ref_pos, text_, text_end);
+}
+pub fn logRenderedTextSlice(ref_pos: [*c]const Vec2, text_: []const u8) void { //igLogRenderedText
+    c.igLogRenderedText(ref_pos, text_.ptr, text_.ptr + text_.len);
 }
 pub fn logSetNextTextDecoration(prefix: [*c]const u8, suffix: [*c]const u8) void { //igLogSetNextTextDecoration
     c.igLogSetNextTextDecoration(prefix, suffix);
@@ -4221,8 +5006,8 @@ pub fn isActiveIdUsingKey(key: Key) bool { //igIsActiveIdUsingKey
 pub fn setActiveIdUsingKey(key: Key) void { //igSetActiveIdUsingKey
     c.igSetActiveIdUsingKey(@intFromEnum(key));
 }
-pub fn isMouseDragPastThreshold(btn: MouseButton, lock_threshold: f32) bool { //igIsMouseDragPastThreshold
-    return c.igIsMouseDragPastThreshold(@intFromEnum(btn), lock_threshold);
+pub fn isMouseDragPastThreshold(button_: MouseButton, lock_threshold: f32) bool { //igIsMouseDragPastThreshold
+    return c.igIsMouseDragPastThreshold(@intFromEnum(button_), lock_threshold);
 }
 pub fn isNavInputDown(n: NavInput) bool { //igIsNavInputDown
     return c.igIsNavInputDown(@intFromEnum(n));
@@ -4338,7 +5123,7 @@ pub fn dockBuilderSetNodeSize(node_id: ID, size: Vec2) void { //igDockBuilderSet
 pub fn dockBuilderSplitNode(node_id: ID, split_dir: Dir, size_ratio_for_node_at_dir: f32, out_id_at_dir: [*c]ID, out_id_at_opposite_dir: [*c]ID) ID { //igDockBuilderSplitNode
     return c.igDockBuilderSplitNode(node_id, @intFromEnum(split_dir), size_ratio_for_node_at_dir, out_id_at_dir, out_id_at_opposite_dir);
 }
-pub fn dockBuilderCopyDockSpace(src_dockspace_id: ID, dst_dockspace_id: ID, in_window_remap_pairs: [*c]CharVector) void { //igDockBuilderCopyDockSpace
+pub fn dockBuilderCopyDockSpace(src_dockspace_id: ID, dst_dockspace_id: ID, in_window_remap_pairs: [*c]ConstCharPtrVector) void { //igDockBuilderCopyDockSpace
     c.igDockBuilderCopyDockSpace(src_dockspace_id, dst_dockspace_id, in_window_remap_pairs);
 }
 pub fn dockBuilderCopyNode(src_node_id: ID, dst_node_id: ID, out_node_remap_pairs: [*c]IDVector) void { //igDockBuilderCopyNode
@@ -4383,11 +5168,14 @@ pub fn popColumnsBackground() void { //igPopColumnsBackground
 pub fn getColumnsID(str_id: [*c]const u8, count: c_int) ID { //igGetColumnsID
     return c.igGetColumnsID(str_id, count);
 }
-pub fn getColumnOffsetFromNorm(col: [*c]const OldColumns, offset_norm: f32) f32 { //igGetColumnOffsetFromNorm
-    return c.igGetColumnOffsetFromNorm(col, offset_norm);
+pub fn findOrCreateColumns(window: [*c]Window, id: ID) [*c]OldColumns { //igFindOrCreateColumns
+    return c.igFindOrCreateColumns(window, id);
+}
+pub fn getColumnOffsetFromNorm(columns_: [*c]const OldColumns, offset_norm: f32) f32 { //igGetColumnOffsetFromNorm
+    return c.igGetColumnOffsetFromNorm(columns_, offset_norm);
 }
-pub fn getColumnNormFromOffset(col: [*c]const OldColumns, offset: f32) f32 { //igGetColumnNormFromOffset
-    return c.igGetColumnNormFromOffset(col, offset);
+pub fn getColumnNormFromOffset(columns_: [*c]const OldColumns, offset: f32) f32 { //igGetColumnNormFromOffset
+    return c.igGetColumnNormFromOffset(columns_, offset);
 }
 pub fn tableOpenContextMenu(column_n: c_int) void { //igTableOpenContextMenu
     c.igTableOpenContextMenu(column_n);
@@ -4563,14 +5351,38 @@ pub fn tabItemCalcSize(pout: [*c]Vec2, label: [*c]const u8, has_close_button: bo
 pub fn tabItemBackground(draw_list: [*c]DrawList, bb: Rect, flags: TabItemFlags, col: U32) void { //igTabItemBackground
     c.igTabItemBackground(draw_list, @bitCast(bb), @bitCast(flags), col);
 }
-pub fn renderText(pos: Vec2, text: [*c]const u8, text_end: [*c]const u8, hide_text_after_hash: bool) void { //igRenderText
-    c.igRenderText(@bitCast(pos), text, text_end, hide_text_after_hash);
+pub fn tabItemLabelAndCloseButton(draw_list: [*c]DrawList, bb: Rect, flags: TabItemFlags, frame_padding: Vec2, label: [*c]const u8, tab_id: ID, close_button_id: ID, is_contents_visible: bool, out_just_closed: [*c]bool, out_text_clipped: [*c]bool) void { //igTabItemLabelAndCloseButton
+    c.igTabItemLabelAndCloseButton(draw_list, @bitCast(bb), @bitCast(flags), @bitCast(frame_padding), label, tab_id, close_button_id, is_contents_visible, out_just_closed, out_text_clipped);
+}
+pub fn renderText(pos: Vec2, text_: [*c]const u8, text_end: [*c]const u8, hide_text_after_hash: bool) void { //igRenderText
+    c.igRenderText(@bitCast(pos), text_, text_end, hide_text_after_hash);
+}
+pub fn renderTextSlice(pos: Vec2, text_: []const u8, hide_text_after_hash: bool) void { //igRenderText
+    c.igRenderText(@bitCast(pos), text_.ptr, text_.ptr + text_.len, hide_text_after_hash);
+}
+pub fn renderTextWrapped(pos: Vec2, text_: [*c]const u8, text_end: [*c]const u8, wrap_width: f32) void { //igRenderTextWrapped
+    c.igRenderTextWrapped(@bitCast(pos), text_, text_end, wrap_width);
+}
+pub fn renderTextWrappedSlice(pos: Vec2, text_: []const u8, wrap_width: f32) void { //igRenderTextWrapped
+    c.igRenderTextWrapped(@bitCast(pos), text_.ptr, text_.ptr + text_.len, wrap_width);
+}
+pub fn renderTextClipped(pos_min: Vec2, pos_max: Vec2, text_: [*c]const u8, text_end: [*c]const u8, text_size_if_known: [*c]const Vec2, align_: Vec2, clip_rect: [*c]const Rect) void { //igRenderTextClipped
+    c.igRenderTextClipped(@bitCast(pos_min), @bitCast(pos_max), text_, text_end, text_size_if_known, @bitCast(align_), clip_rect);
+}
+pub fn renderTextClippedSlice(pos_min: Vec2, pos_max: Vec2, text_: []const u8, text_size_if_known: [*c]const Vec2, align_: Vec2, clip_rect: [*c]const Rect) void { //igRenderTextClipped
+    c.igRenderTextClipped(@bitCast(pos_min), @bitCast(pos_max), text_.ptr, text_.ptr + text_.len, text_size_if_known, @bitCast(align_), clip_rect);
 }
-pub fn renderTextWrapped(pos: Vec2, text: [*c]const u8, text_end: [*c]const u8, wrap_width: f32) void { //igRenderTextWrapped
-    c.igRenderTextWrapped(@bitCast(pos), text, text_end, wrap_width);
+pub fn renderTextClippedEx(draw_list: [*c]DrawList, pos_min: Vec2, pos_max: Vec2, text_: [*c]const u8, text_end: [*c]const u8, text_size_if_known: [*c]const Vec2, align_: Vec2, clip_rect: [*c]const Rect) void { //igRenderTextClippedEx
+    c.igRenderTextClippedEx(draw_list, @bitCast(pos_min), @bitCast(pos_max), text_, text_end, text_size_if_known, @bitCast(align_), clip_rect);
 }
-pub fn renderTextEllipsis(draw_list: [*c]DrawList, pos_min: Vec2, pos_max: Vec2, clip_max_x: f32, ellipsis_max_x: f32, text: [*c]const u8, text_end: [*c]const u8, text_size_if_known: [*c]const Vec2) void { //igRenderTextEllipsis
-    c.igRenderTextEllipsis(draw_list, @bitCast(pos_min), @bitCast(pos_max), clip_max_x, ellipsis_max_x, text, text_end, text_size_if_known);
+pub fn renderTextClippedExSlice(draw_list: [*c]DrawList, pos_min: Vec2, pos_max: Vec2, text_: []const u8, text_size_if_known: [*c]const Vec2, align_: Vec2, clip_rect: [*c]const Rect) void { //igRenderTextClippedEx
+    c.igRenderTextClippedEx(draw_list, @bitCast(pos_min), @bitCast(pos_max), text_.ptr, text_.ptr + text_.len, text_size_if_known, @bitCast(align_), clip_rect);
+}
+pub fn renderTextEllipsis(draw_list: [*c]DrawList, pos_min: Vec2, pos_max: Vec2, clip_max_x: f32, ellipsis_max_x: f32, text_: [*c]const u8, text_end: [*c]const u8, text_size_if_known: [*c]const Vec2) void { //igRenderTextEllipsis
+    c.igRenderTextEllipsis(draw_list, @bitCast(pos_min), @bitCast(pos_max), clip_max_x, ellipsis_max_x, text_, text_end, text_size_if_known);
+}
+pub fn renderTextEllipsisSlice(draw_list: [*c]DrawList, pos_min: Vec2, pos_max: Vec2, clip_max_x: f32, ellipsis_max_x: f32, text_: []const u8, text_size_if_known: [*c]const Vec2) void { //igRenderTextEllipsis
+    c.igRenderTextEllipsis(draw_list, @bitCast(pos_min), @bitCast(pos_max), clip_max_x, ellipsis_max_x, text_.ptr, text_.ptr + text_.len, text_size_if_known);
 }
 pub fn renderFrame(p_min: Vec2, p_max: Vec2, fill_col: U32, border: bool, rounding: f32) void { //igRenderFrame
     c.igRenderFrame(@bitCast(p_min), @bitCast(p_max), fill_col, border, rounding);
@@ -4584,8 +5396,11 @@ pub fn renderColorRectWithAlphaCheckerboard(draw_list: [*c]DrawList, p_min: Vec2
 pub fn renderNavHighlight(bb: Rect, id: ID, flags: NavHighlightFlags) void { //igRenderNavHighlight
     c.igRenderNavHighlight(@bitCast(bb), id, @bitCast(flags));
 }
-pub fn findRenderedTextEnd(text: [*c]const u8, text_end: [*c]const u8) [*c]const u8 { //igFindRenderedTextEnd
-    return c.igFindRenderedTextEnd(text, text_end);
+pub fn findRenderedTextEnd(text_: [*c]const u8, text_end: [*c]const u8) [*c]const u8 { //igFindRenderedTextEnd
+    return c.igFindRenderedTextEnd(text_, text_end);
+}
+pub fn findRenderedTextEndSlice(text_: []const u8) [*c]const u8 { //igFindRenderedTextEnd
+    return c.igFindRenderedTextEnd(text_.ptr, text_.ptr + text_.len);
 }
 pub fn renderMouseCursor(pos: Vec2, scale: f32, mouse_cursor: MouseCursor, col_fill: U32, col_border: U32, col_shadow: U32) void { //igRenderMouseCursor
     c.igRenderMouseCursor(@bitCast(pos), scale, @intFromEnum(mouse_cursor), col_fill, col_border, col_shadow);
@@ -4614,8 +5429,11 @@ pub fn renderRectFilledWithHole(draw_list: [*c]DrawList, outer: Rect, inner: Rec
 pub fn calcRoundingFlagsForRectInRect(r_in: Rect, r_outer: Rect, threshold: f32) DrawFlags { //igCalcRoundingFlagsForRectInRect
     return c.igCalcRoundingFlagsForRectInRect(@bitCast(r_in), @bitCast(r_outer), threshold);
 }
-pub fn textEx(text: [*c]const u8, text_end: [*c]const u8, flags: TextFlags) void { //igTextEx
-    c.igTextEx(text, text_end, @bitCast(flags));
+pub fn textEx(text_: [*c]const u8, text_end: [*c]const u8, flags: TextFlags) void { //igTextEx
+    c.igTextEx(text_, text_end, @bitCast(flags));
+}
+pub fn textExSlice(text_: []const u8, flags: TextFlags) void { //igTextEx
+    c.igTextEx(text_.ptr, text_.ptr + text_.len, @bitCast(flags));
 }
 pub fn buttonEx(label: [*c]const u8, size_arg: Vec2, flags: ButtonFlags) bool { //igButtonEx
     return c.igButtonEx(label, @bitCast(size_arg), flags);
@@ -4674,6 +5492,9 @@ pub fn splitterBehavior(bb: Rect, id: ID, axis: Axis, size1: [*c]f32, size2: [*c
 pub fn treeNodeBehavior(id: ID, flags: TreeNodeFlags, label: [*c]const u8, label_end: [*c]const u8) bool { //igTreeNodeBehavior
     return c.igTreeNodeBehavior(id, @bitCast(flags), label, label_end);
 }
+pub fn treeNodeBehaviorSlice(id: ID, flags: TreeNodeFlags, label: []const u8) bool { //igTreeNodeBehavior
+    return c.igTreeNodeBehavior(id, @bitCast(flags), label.ptr, label.ptr + label.len);
+}
 pub fn treeNodeBehaviorIsOpen(id: ID, flags: TreeNodeFlags) bool { //igTreeNodeBehaviorIsOpen
     return c.igTreeNodeBehaviorIsOpen(id, @bitCast(flags));
 }
@@ -4713,8 +5534,8 @@ pub fn tempInputIsActive(id: ID) bool { //igTempInputIsActive
 pub fn getInputTextState(id: ID) [*c]InputTextState { //igGetInputTextState
     return c.igGetInputTextState(id);
 }
-pub fn colorTooltip(text: [*c]const u8, col: [*c]const f32, flags: ColorEditFlags) void { //igColorTooltip
-    c.igColorTooltip(text, col, @bitCast(flags));
+pub fn colorTooltip(text_: [*c]const u8, col: [*c]const f32, flags: ColorEditFlags) void { //igColorTooltip
+    c.igColorTooltip(text_, col, @bitCast(flags));
 }
 pub fn colorEditOptionsPopup(col: [*c]const f32, flags: ColorEditFlags) void { //igColorEditOptionsPopup
     c.igColorEditOptionsPopup(col, @bitCast(flags));
@@ -4737,6 +5558,9 @@ pub fn gcCompactTransientWindowBuffers(window: [*c]Window) void { //igGcCompactT
 pub fn gcAwakeTransientWindowBuffers(window: [*c]Window) void { //igGcAwakeTransientWindowBuffers
     c.igGcAwakeTransientWindowBuffers(window);
 }
+pub fn debugLog(str: []const u8) void { //igDebugLog
+    c.igDebugLog("%.*s", @as(c_int, @intCast(str.len)), str.ptr);
+}
 pub fn errorCheckEndFrameRecover(log_callback: ErrorLogCallback, user_data: ?*anyopaque) void { //igErrorCheckEndFrameRecover
     c.igErrorCheckEndFrameRecover(log_callback, user_data);
 }
@@ -4755,8 +5579,8 @@ pub fn showFontAtlas(atlas: [*c]FontAtlas) void { //igShowFontAtlas
 pub fn debugHookIdInfo(id: ID, data_type: DataType, data_id: [*c]const void, data_id_end: [*c]const void) void { //igDebugHookIdInfo
     c.igDebugHookIdInfo(id, @intFromEnum(data_type), data_id, data_id_end);
 }
-pub fn debugNodeColumns(cols: [*c]OldColumns) void { //igDebugNodeColumns
-    c.igDebugNodeColumns(cols);
+pub fn debugNodeColumns(columns_: [*c]OldColumns) void { //igDebugNodeColumns
+    c.igDebugNodeColumns(columns_);
 }
 pub fn debugNodeDockNode(node: [*c]DockNode, label: [*c]const u8) void { //igDebugNodeDockNode
     c.igDebugNodeDockNode(node, label);
@@ -4797,9 +5621,6 @@ pub fn debugNodeWindowSettings(settings: [*c]WindowSettings) void { //igDebugNod
 pub fn debugNodeWindowsList(windows: [*c]WindowPtrVector, label: [*c]const u8) void { //igDebugNodeWindowsList
     c.igDebugNodeWindowsList(windows, label);
 }
-pub fn debugNodeWindowsListByBeginStackParent(windows: [*c]Window, windows_size: c_int, parent_in_begin_stack: [*c]Window) void { //igDebugNodeWindowsListByBeginStackParent
-    c.igDebugNodeWindowsListByBeginStackParent(windows, windows_size, parent_in_begin_stack);
-}
 pub fn debugNodeViewport(viewport: [*c]ViewportP) void { //igDebugNodeViewport
     c.igDebugNodeViewport(viewport);
 }
@@ -4827,6 +5648,7 @@ pub fn imFontAtlasBuildRender8bppRectFromString(atlas: [*c]FontAtlas, x: c_int,
 pub fn imFontAtlasBuildRender32bppRectFromString(atlas: [*c]FontAtlas, x: c_int, y: c_int, w: c_int, h: c_int, in_str: [*c]const u8, in_marker_char: u8, in_marker_pixel_value: c_uint) void { //igImFontAtlasBuildRender32bppRectFromString
     c.igImFontAtlasBuildRender32bppRectFromString(atlas, x, y, w, h, in_str, in_marker_char, in_marker_pixel_value);
 }
+// @generated functions end
 
 // TODO structs with bitfields...
 // for the time being this shall be just an opaque pointer
@@ -4842,6 +5664,12 @@ pub const FontGlyph = opaque {};
 pub const DockNodeSettings = opaque {};
 pub const StoragePair = opaque {};
 
+pub const TableSortSpecs = extern struct { // struct ImGuiTableSortSpecs
+    specs: ?*const TableColumnSortSpecs,
+    specs_count: c_int,
+    specs_dirty: bool,
+};
+
 pub const ErrorLogCallback = *const fn (?*anyopaque, [*c]const u8) callconv(.C) void;
 pub const DrawCallback = *const fn ([*c]const DrawList, [*c]const DrawCmd) callconv(.C) void;
 
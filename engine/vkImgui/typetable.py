@@ -0,0 +1,58 @@
+# memoized C type -> zig type translation.
+#
+# the same few hundred C spellings repeat across thousands of arguments, so
+# every spelling is converted (and classified for casting) once and then
+# served from a dict. Entries can be preloaded from a json file to override
+# what the converter would produce, e.g. {"ImGuiCol": ["StyleColor", "enum"]}.
+
+import json
+
+
+class TypeTable:
+    def __init__(self, convert, classify=None):
+        self.convert = convert
+        self.classify = classify
+        # spelling -> (zigType, castKind)
+        self.table = {}
+        # preloaded spellings not looked up yet
+        self.preloaded = set()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, spelling):
+        entry = self.table.get(spelling)
+        if entry is None:
+            self.misses += 1
+            zigType = self.convert(spelling)
+            castKind = self.classify(zigType) if self.classify is not None else None
+            entry = (zigType, castKind)
+            self.table[spelling] = entry
+        else:
+            self.hits += 1
+            if spelling in self.preloaded:
+                # the json decides the cast, but the rules matching the type
+                # still count as used for --report-casts
+                self.preloaded.discard(spelling)
+                if self.classify is not None:
+                    self.classify(entry[0])
+        return entry
+
+    def zigType(self, spelling):
+        return self.lookup(spelling)[0]
+
+    def castKind(self, spelling):
+        return self.lookup(spelling)[1]
+
+    def preload(self, path):
+        with open(path) as f:
+            data = json.load(f)
+        for spelling, entry in data.items():
+            if isinstance(entry, str):
+                entry = [entry, None]
+            self.table[spelling] = (entry[0], entry[1])
+            self.preloaded.add(spelling)
+
+    def dump(self, path):
+        with open(path, 'w') as f:
+            json.dump({k: list(v) for k, v in sorted(self.table.items())}, f, indent=4)
+            f.write('\n')
@@ -0,0 +1,76 @@
+# finds which cimgui bindings the engine actually uses.
+#
+# scans zig sources for references through the bindings module: `api.x`
+# directly, or through any alias of it such as
+# `const imgui = neonwood.vkImgui.api;` or `const api = @import("cimgui.zig");`.
+
+import os
+import re
+
+here = os.path.dirname(os.path.abspath(__file__))
+repoRoot = os.path.normpath(os.path.join(here, '..', '..'))
+
+defaultRoots = [
+    os.path.join(repoRoot, 'engine', 'ui'),
+    os.path.join(repoRoot, 'engine', 'vkImgui', 'src'),
+    os.path.join(repoRoot, 'projects'),
+]
+
+lineComment = re.compile(r'//[^\n]*')
+aliasDecl = re.compile(r'\bconst\s+(\w+)\s*=\s*(?:[\w.]*\.)?api\s*;|\bconst\s+(\w+)\s*=\s*@import\("cimgui\.zig"\)\s*;')
+
+# generated files, they'd count every binding as used
+skipFiles = re.compile(r'^cimgui(_\w+)?\.zig$')
+
+
+def zigSources(roots):
+    for root in roots:
+        if os.path.isfile(root):
+            yield root
+            continue
+        for directory, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if d not in ('zig-cache', '.zig-cache', 'zig-out'))
+            for name in sorted(files):
+                if name.endswith('.zig') and not skipFiles.match(name):
+                    yield os.path.join(directory, name)
+
+
+def references(text):
+    # every binding name referenced in text, once per reference
+    text = lineComment.sub('', text)
+    aliases = {'api'}
+    for m in aliasDecl.finditer(text):
+        aliases.add(m.group(1) or m.group(2))
+    ref = re.compile(r'(?<![\w.])(?:[\w.]*\.)?(?:' + '|'.join(sorted(aliases)) + r')\.([A-Za-z_]\w*)')
+    return [m.group(1) for m in ref.finditer(text)]
+
+
+def scanText(text):
+    return set(references(text))
+
+
+def scanUsage(roots=None):
+    # returns {name: [files referencing it]}
+    used = {}
+    for path in zigSources(roots or defaultRoots):
+        with open(path, encoding='utf-8', errors='replace') as f:
+            names = scanText(f.read())
+        for name in names:
+            used.setdefault(name, []).append(path)
+    return used
+
+
+def countReferences(roots=None):
+    # returns {name: number of references}, i.e. call sites
+    counts = {}
+    for path in zigSources(roots or defaultRoots):
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for name in references(f.read()):
+                counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def declaredNames(path):
+    # top level pub declarations of a zig file
+    with open(path, encoding='utf-8') as f:
+        return set(re.findall(r'^pub\s+(?:inline\s+)?(?:const|var|fn)\s+(\w+)', f.read(), re.M))
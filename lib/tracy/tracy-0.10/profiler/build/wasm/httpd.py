@@ -1,17 +1,748 @@
+import argparse
+import collections
+import datetime
+import email.utils
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from http import server
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# what's worth compressing, the emscripten output plus the preloaded trace
+compressible = (".wasm", ".js", ".html", ".htm", ".css", ".json", ".svg", ".ttf", ".otf", ".data", ".txt", ".map")
+
+
+# more ranges than this in one request get the whole file instead
+max_ranges = 16
+
+
+def parse_ranges(header, size):
+    # "bytes=0-99, 200-, -50" as inclusive (first, last) pairs clamped to
+    # size. Unsatisfiable ranges are dropped, None when the header is
+    # malformed or not in bytes and should be ignored.
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = (value.strip() for value in part.partition("-"))
+        if not sep or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+            return None
+        if not first:
+            # the last n bytes
+            if int(last) > 0 and size > 0:
+                ranges.append((max(size - int(last), 0), size - 1))
+            continue
+        if last and int(last) < int(first):
+            return None
+        if int(first) < size:
+            ranges.append((int(first), min(int(last), size - 1) if last else size - 1))
+    return ranges
+
+
+def accepted_encodings(header):
+    # Accept-Encoding as {coding: q}
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding.strip():
+            accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def default_cache_dir():
+    # per user, a shared directory in /tmp would let anyone plant the copies
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "tracy-httpd")
+
+
+def make_etag(st, encoding=None):
+    # strong: changes with the file, and differs per content coding since
+    # those are different bytes
+    tag = f"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"
+    if encoding is not None:
+        tag += "-" + encoding
+    return f'"{tag}"'
+
+
+class FileCache:
+    # small files kept in memory, least recently used dropped first once the
+    # total goes over max_size. Entries are checked against the device,
+    # inode, mtime and size of the opened file, so a replaced or rewritten
+    # file is read again.
+    def __init__(self, max_size, max_entry=None):
+        self.max_size = max_size
+        self.max_entry = max_entry if max_entry is not None else max_size // 4
+        self.entries = collections.OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def open(self, path):
+        # (file, size), the file being a BytesIO on a hit
+        f = open(path, "rb")
+        st = os.fstat(f.fileno())
+        key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == key:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                f.close()
+                return io.BytesIO(entry[1]), st.st_size
+            self.misses += 1
+        if st.st_size > self.max_entry:
+            return f, st.st_size
+        try:
+            data = f.read()
+        finally:
+            f.close()
+        if len(data) == st.st_size:
+            self.insert(path, key, data)
+        return io.BytesIO(data), len(data)
+
+    def insert(self, path, key, data):
+        with self.lock:
+            old = self.entries.pop(path, None)
+            if old is not None:
+                self.size -= len(old[1])
+            self.entries[path] = (key, data)
+            self.size += len(data)
+            while self.size > self.max_size:
+                _, (_, dropped) = self.entries.popitem(last=False)
+                self.size -= len(dropped)
+
+
+class Histogram:
+    # request counts per upper bound in milliseconds, the last bucket
+    # catches everything slower
+    bounds = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        i = 0
+        while i < len(self.bounds) and ms > self.bounds[i]:
+            i += 1
+        self.counts[i] += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, p):
+        # upper bound of the bucket the p-th percentile falls in
+        count = sum(self.counts)
+        if count == 0:
+            return None
+        seen = 0
+        for bound, n in zip(self.bounds + (self.max,), self.counts):
+            seen += n
+            if seen >= count * p:
+                return min(bound, self.max)
+        return self.max
+
+    def to_json(self):
+        count = sum(self.counts)
+        return {
+            "count": count,
+            "mean_ms": self.total / count if count else None,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": [{"le_ms": bound, "count": n} for bound, n in zip(self.bounds + ("inf",), self.counts)],
+        }
+
+
+class Stats:
+    # per request timing, aggregated over the server's lifetime: time to
+    # first byte (the headers going out), total duration and body bytes
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.in_flight = 0
+        self.bytes = 0
+        self.status = collections.Counter()
+        self.ttfb = Histogram()
+        self.duration = Histogram()
+        # by file extension, to tell the wasm apart from the trace and the rest
+        self.types = {}
+
+    def begin(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def end(self, path, status, nbytes, ttfb, duration):
+        ext = os.path.splitext(path.split("?", 1)[0])[1].lower() or "(none)"
+        with self.lock:
+            self.in_flight -= 1
+            self.requests += 1
+            self.bytes += nbytes
+            self.status[str(status)] += 1
+            if ttfb is not None:
+                self.ttfb.add(ttfb * 1000)
+            self.duration.add(duration * 1000)
+            t = self.types.setdefault(ext, {"requests": 0, "bytes": 0, "total_ms": 0.0, "max_ms": 0.0})
+            t["requests"] += 1
+            t["bytes"] += nbytes
+            t["total_ms"] += duration * 1000
+            t["max_ms"] = max(t["max_ms"], duration * 1000)
+
+    def to_json(self, server=None):
+        with self.lock:
+            uptime = time.time() - self.started
+            report = {
+                "uptime_s": uptime,
+                "requests": self.requests,
+                "in_flight": self.in_flight,
+                "bytes": self.bytes,
+                "requests_per_s": self.requests / uptime if uptime > 0 else None,
+                "bytes_per_s": self.bytes / uptime if uptime > 0 else None,
+                "status": dict(self.status),
+                "ttfb": self.ttfb.to_json(),
+                "duration": self.duration.to_json(),
+                "types": {ext: dict(t) for ext, t in sorted(self.types.items())},
+            }
+        file_cache = getattr(server, "file_cache", None)
+        if file_cache is not None:
+            report["file_cache"] = {"hits": file_cache.hits, "misses": file_cache.misses, "bytes": file_cache.size, "files": len(file_cache.entries)}
+        return report
+
+    def summary(self):
+        report = self.to_json()
+        ttfb, duration = report["ttfb"], report["duration"]
+        ms = lambda value: "-" if value is None else f"{value:.0f}ms"
+        return (f"{report['requests']} requests, {report['in_flight']} in flight, {report['bytes'] / 1024 / 1024:.1f}MiB sent, "
+                f"ttfb p50 {ms(ttfb['p50_ms'])} p95 {ms(ttfb['p95_ms'])}, duration p50 {ms(duration['p50_ms'])} "
+                f"p95 {ms(duration['p95_ms'])} max {ms(duration['max_ms'])}")
+
+    def report_every(self, interval):
+        # prints a summary every interval seconds from a daemon thread
+        def run():
+            while True:
+                time.sleep(interval)
+                print(self.summary(), flush=True)
+        threading.Thread(target=run, name="httpd-stats", daemon=True).start()
+
+
+class CompressedCache:
+    # compressed copies of the served files, made once per file version and
+    # kept on disk under a name derived from the path, mtime and size. A
+    # foo.wasm.br / foo.wasm.gz next to the file is used as is when it's
+    # at least as new as the file.
+    suffixes = {"br": ".br", "gzip": ".gz"}
+    # bigger files, e.g. the trace, are compressed in the background and
+    # served as is until their copy is ready, and past best_size with a
+    # quicker level since brotli's best takes minutes on a large capture
+    inline_size = 256 * 1024
+    best_size = 4 * 1024 * 1024
+    chunk_size = 1024 * 1024
+
+    def __init__(self, directory, min_size=1024, background=2):
+        self.directory = directory
+        self.min_size = min_size
+        self.encodings = (["br"] if brotli is not None else []) + ["gzip"]
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.background = threading.BoundedSemaphore(background)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid"):
+            st = os.stat(directory)
+            if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                raise PermissionError(f"{directory} must be owned by the current user and not writable by others")
+
+    def wants(self, path, st):
+        return st.st_size >= self.min_size and path.lower().endswith(compressible)
+
+    def choose(self, accept):
+        # best encoding the client takes, ties go to our order (br first)
+        accepted = accepted_encodings(accept)
+        best, best_q = None, 0.0
+        for encoding in self.encodings:
+            q = accepted.get(encoding, accepted.get("*", 0.0))
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def entry(self, path, st, encoding):
+        stem = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+        return os.path.join(self.directory, f"{stem}-{st.st_mtime_ns}-{st.st_size}{self.suffixes[encoding]}"), stem
+
+    def get(self, path, st, encoding, wait=None):
+        # path of the compressed copy, compressing it now if needed. None
+        # while a big file's copy is still being made, unless waiting for it
+        if wait is None:
+            wait = st.st_size <= self.inline_size
+        sibling = path + self.suffixes[encoding]
+        try:
+            if os.stat(sibling).st_mtime_ns >= st.st_mtime_ns:
+                return sibling
+        except OSError:
+            pass
+
+        entry, stem = self.entry(path, st, encoding)
+        if os.path.exists(entry):
+            return entry
+        # one thread compresses, the others asking for the same file wait for
+        # it, or are served the file as is while it's done in the background
+        with self.lock:
+            done = self.pending.get(entry)
+            owner = done is None
+            if owner:
+                done = self.pending[entry] = threading.Event()
+        if not owner:
+            if not wait:
+                return None
+            done.wait()
+            return entry if os.path.exists(entry) else None
+        if not wait:
+            threading.Thread(target=self.build, args=(path, st, entry, stem, encoding, done, True), daemon=True).start()
+            return None
+        self.build(path, st, entry, stem, encoding, done)
+        return entry
+
+    def build(self, path, st, entry, stem, encoding, done, background=False):
+        try:
+            if background:
+                with self.background:
+                    self.compress(path, st, entry, encoding)
+            else:
+                self.compress(path, st, entry, encoding)
+            self.prune(stem, entry)
+        except OSError:
+            # nobody waits on a background copy, the file is served as is
+            if not background:
+                raise
+        finally:
+            with self.lock:
+                del self.pending[entry]
+            done.set()
+
+    def compress(self, path, st, entry, encoding):
+        # streamed in chunks, the whole trace never has to fit in memory
+        best = st.st_size <= self.best_size
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with open(path, "rb") as src, open(fd, "wb") as f:
+                if encoding == "br":
+                    compressor = brotli.Compressor(quality=11 if best else 5)
+                    for chunk in iter(partial(src.read, self.chunk_size), b""):
+                        f.write(compressor.process(chunk))
+                    f.write(compressor.finish())
+                else:
+                    with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=9 if best else 6, mtime=0) as out:
+                        shutil.copyfileobj(src, out, self.chunk_size)
+            os.replace(tmp, entry)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def prune(self, stem, keep):
+        # copies of older versions of the same file are never served again
+        suffix = os.path.splitext(keep)[1]
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(stem + "-") and name.endswith(suffix) and path != keep:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def precompress(self, root, workers):
+        # compress everything up front so not even the first load waits
+        jobs = []
+        for directory, _, files in os.walk(root):
+            for name in files:
+                path = os.path.join(directory, name)
+                st = os.stat(path)
+                if self.wants(path, st):
+                    jobs.extend((path, st, encoding) for encoding in self.encodings)
+        with ThreadPoolExecutor(max(workers, 1)) as pool:
+            list(pool.map(lambda job: self.get(*job, wait=True), jobs))
+        return len(jobs)
+
+
 class MyHTTPRequestHandler(server.SimpleHTTPRequestHandler):
+    # keep-alive, so the browser fetches index.html, tracy.js, tracy.wasm
+    # and the trace over one connection instead of reconnecting for each
+    protocol_version = "HTTP/1.1"
+    # idle keep-alive connections give their worker back after this long
+    timeout = 15
+
+    # set per request by send_head
+    ranges = None
+    accept_ranges = False
+
+    # served from memory instead of the directory
+    stats_path = "/__stats"
+
+    # per request timing, see Stats
+    request_start = None
+    first_byte = None
+    status = None
+    body_bytes = 0
+
+    extensions_map = {
+        **server.SimpleHTTPRequestHandler.extensions_map,
+        ".wasm": "application/wasm",
+    }
+
     def end_headers(self):
         self.send_my_headers()
         server.SimpleHTTPRequestHandler.end_headers(self)
+        if self.request_start is not None and self.first_byte is None:
+            self.first_byte = time.perf_counter()
+
+    def parse_request(self):
+        # the clock starts once the request line is in, not while an idle
+        # keep-alive connection waits for the next request
+        self.request_start = time.perf_counter()
+        self.first_byte = None
+        self.status = None
+        self.body_bytes = 0
+        stats = getattr(self.server, "stats", None)
+        if stats is not None:
+            stats.begin()
+        return server.SimpleHTTPRequestHandler.parse_request(self)
+
+    def handle_one_request(self):
+        try:
+            server.SimpleHTTPRequestHandler.handle_one_request(self)
+        finally:
+            stats = getattr(self.server, "stats", None)
+            if self.request_start is not None and stats is not None:
+                # a failed parse has no self.path
+                path = getattr(self, "path", "")
+                ttfb = self.first_byte - self.request_start if self.first_byte is not None else None
+                stats.end(path, self.status, self.body_bytes, ttfb, time.perf_counter() - self.request_start)
+            self.request_start = None
+
+    def log_request(self, code="-", size="-"):
+        self.status = int(code) if isinstance(code, int) else code
+        server.SimpleHTTPRequestHandler.log_request(self, code, size)
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] == self.stats_path and getattr(self.server, "stats", None) is not None:
+            self.send_stats()
+            return
+        server.SimpleHTTPRequestHandler.do_GET(self)
+
+    def send_stats(self):
+        body = json.dumps(self.server.stats.to_json(self.server), indent=4).encode()
+        self.send_response(server.HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.body_bytes += len(body)
+
+    def send_head(self):
+        self.ranges = None
+        self.accept_ranges = False
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.split("?", 1)[0].split("#", 1)[0].endswith("/"):
+            path = os.path.join(path, "index.html")
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            return server.SimpleHTTPRequestHandler.send_head(self)
+
+        source, encoding = path, None
+        compressed = getattr(self.server, "compressed", None)
+        if "Range" not in self.headers and compressed is not None and compressed.wants(path, st):
+            encoding = compressed.choose(self.headers.get("Accept-Encoding", ""))
+            try:
+                entry = compressed.get(path, st, encoding) if encoding is not None else None
+                # a copy that isn't smaller, e.g. of already compressed data, isn't worth it
+                if entry is not None and os.stat(entry).st_size >= st.st_size:
+                    entry = None
+            except OSError:
+                entry = None
+            if entry is not None:
+                source = entry
+            else:
+                encoding = None
+        # ranges are always served from the file itself, so an encoded
+        # response mustn't invite a client to resume it by offset
+        self.accept_ranges = encoding is None
+
+        etag = None
+        if getattr(self.server, "caching", False):
+            etag = make_etag(st, encoding)
+            if self.not_modified(st, etag):
+                self.send_response(server.HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+                self.end_headers()
+                return None
+
+        if "Range" in self.headers:
+            ranges = self.requested_ranges(path, st, etag)
+            if ranges is not None:
+                return self.send_range_head(path, st, ranges, etag)
+        return self.send_file_head(source, path, st, encoding, etag)
+
+    def not_modified(self, st, etag):
+        # If-None-Match takes precedence, it compares weakly
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is not None:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=datetime.timezone.utc)
+            return int(st.st_mtime) <= since.timestamp()
+        return False
+
+    def open_file(self, path):
+        # (file, size), from the memory cache when it has the file
+        file_cache = getattr(self.server, "file_cache", None)
+        if file_cache is not None:
+            return file_cache.open(path)
+        f = open(path, "rb")
+        return f, os.fstat(f.fileno()).st_size
+
+    def send_file_head(self, source, path, st, encoding, etag):
+        try:
+            f, size = self.open_file(source)
+        except OSError:
+            self.send_error(server.HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        try:
+            self.send_response(server.HTTPStatus.OK)
+            self.send_header("Content-Type", self.guess_type(path))
+            if encoding is not None:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(size))
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            if etag is not None:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def requested_ranges(self, path, st, etag=None):
+        # the byte ranges to send, None to ignore the Range header and send
+        # the whole file. A date can't tell an encoded copy from the file,
+        # so for compressible files only the ETag validates an If-Range
+        if_range = self.headers.get("If-Range")
+        compressed = getattr(self.server, "compressed", None)
+        dated = compressed is None or not compressed.wants(path, st)
+        if if_range is not None and if_range != etag and not (dated and if_range == self.date_time_string(st.st_mtime)):
+            return None
+        ranges = parse_ranges(self.headers["Range"], st.st_size)
+        if ranges is not None and len(ranges) > max_ranges:
+            return None
+        return ranges
+
+    def send_range_head(self, path, st, ranges, etag=None):
+        if not ranges:
+            self.send_response(server.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header("Content-Range", f"bytes */{st.st_size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return None
+        try:
+            f, _ = self.open_file(path)
+        except OSError:
+            self.send_error(server.HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        try:
+            ctype = self.guess_type(path)
+            self.send_response(server.HTTPStatus.PARTIAL_CONTENT)
+            if len(ranges) == 1:
+                first, last = ranges[0]
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Range", f"bytes {first}-{last}/{st.st_size}")
+                self.send_header("Content-Length", str(last - first + 1))
+                self.ranges = [(first, last, b"")]
+                self.range_trailer = b""
+            else:
+                boundary = uuid.uuid4().hex
+                self.ranges = [(first, last, (f"\r\n--{boundary}\r\nContent-Type: {ctype}\r\n"
+                                              f"Content-Range: bytes {first}-{last}/{st.st_size}\r\n\r\n").encode())
+                               for first, last in ranges]
+                self.range_trailer = f"\r\n--{boundary}--\r\n".encode()
+                length = sum(len(part) + last - first + 1 for first, last, part in self.ranges) + len(self.range_trailer)
+                self.send_header("Content-Type", f"multipart/byteranges; boundary={boundary}")
+                self.send_header("Content-Length", str(length))
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            if etag is not None:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        if self.ranges is None:
+            self.send_file(source, 0, None, outputfile)
+            return
+        for first, last, part in self.ranges:
+            outputfile.write(part)
+            self.body_bytes += len(part)
+            self.send_file(source, first, last - first + 1, outputfile)
+        outputfile.write(self.range_trailer)
+        self.body_bytes += len(self.range_trailer)
+
+    def send_file(self, source, offset, count, outputfile):
+        # straight from the page cache to the socket through os.sendfile,
+        # socket.sendfile falls back to plain sends where that's missing
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            # directory listings and memory cached files
+            source.seek(offset)
+            if count is None:
+                shutil.copyfileobj(source, outputfile)
+            else:
+                outputfile.write(source.read(count))
+            self.body_bytes += source.tell() - offset
+            return
+        self.body_bytes += self.connection.sendfile(source, offset, count)
 
     def send_my_headers(self):
-        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
-        self.send_header("Pragma", "no-cache")
-        self.send_header("Expires", "0")
+        if getattr(self.server, "caching", False):
+            # browsers keep the files but check back on every load, which
+            # is a 304 without a body while nothing changed
+            self.send_header("Cache-Control", "no-cache")
+        else:
+            self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+            self.send_header("Pragma", "no-cache")
+            self.send_header("Expires", "0")
         self.send_header("Cross-Origin-Embedder-Policy", "require-corp");
         self.send_header("Cross-Origin-Opener-Policy", "same-origin");
+        if self.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if getattr(self.server, "compressed", None) is not None:
+            self.send_header("Vary", "Accept-Encoding")
+
+
+class PoolHTTPServer(socketserver.ThreadingMixIn, server.HTTPServer):
+    # connections are served by a fixed pool of worker threads, one thread
+    # per connection when workers is 0
+    daemon_threads = True
+    # CompressedCache when serving precompressed files
+    compressed = None
+    # ETags, conditional requests and browser caching, see --cache
+    caching = False
+    # FileCache holding hot files in memory
+    file_cache = None
+    # Stats, reported at MyHTTPRequestHandler.stats_path
+    stats = None
+
+    def __init__(self, address, handler, workers=0, family=socket.AF_INET):
+        self.address_family = family
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="httpd") if workers > 0 else None
+        server.HTTPServer.__init__(self, address, handler)
+
+    def server_bind(self):
+        # serve ipv4 too when bound to an ipv6 address, like http.server does
+        if self.address_family == socket.AF_INET6:
+            try:
+                self.socket.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+            except (AttributeError, OSError):
+                pass
+        server.HTTPServer.server_bind(self)
+
+    def process_request(self, request, client_address):
+        if self.pool is None:
+            return socketserver.ThreadingMixIn.process_request(self, request, client_address)
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        server.HTTPServer.server_close(self)
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def make_server(bind, port, handler, workers):
+    infos = socket.getaddrinfo(bind or None, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE)
+    if not bind:
+        # the ipv6 wildcard takes ipv4 connections as well
+        infos.sort(key=lambda info: info[0] != socket.AF_INET6)
+    family, _, _, _, address = infos[0]
+    return PoolHTTPServer(address[:2], handler, workers, family)
 
 
 if __name__ == '__main__':
-    server.test(HandlerClass=MyHTTPRequestHandler)
+    parser = argparse.ArgumentParser(description="serves the tracy wasm build with cross-origin isolation enabled")
+    parser.add_argument("port", nargs="?", type=int, default=8000)
+    parser.add_argument("--bind", "-b", default="", help="address to listen on, all interfaces by default")
+    parser.add_argument("--workers", "-w", type=int, default=32, help="worker threads serving connections, 0 for one thread per connection")
+    parser.add_argument("--directory", "-d", default=os.getcwd(), help="directory to serve, the current one by default")
+    parser.add_argument("--compress", action="store_true", help="serve gzip/brotli compressed copies of the wasm, js and data files to clients accepting them")
+    parser.add_argument("--precompress", action="store_true", help="with --compress, compress every file at startup instead of on first request")
+    parser.add_argument("--cache", action="store_true", help="let browsers cache files and revalidate them with ETag/Last-Modified instead of sending no-store")
+    parser.add_argument("--cache-size", type=int, default=256, help="with --cache, MiB of small files to keep in memory, 0 to always read from disk")
+    parser.add_argument("--stats-interval", type=float, default=0, help="print a timing summary every this many seconds, 0 to only serve it as json at /__stats")
+    parser.add_argument("--compress-cache", default=default_cache_dir(), help="where compressed copies are kept between runs, ~/.cache/tracy-httpd by default")
+    args = parser.parse_args()
+
+    handler = partial(MyHTTPRequestHandler, directory=args.directory)
+    with make_server(args.bind, args.port, handler, args.workers) as httpd:
+        httpd.stats = Stats()
+        if args.stats_interval > 0:
+            httpd.stats.report_every(args.stats_interval)
+        if args.cache:
+            httpd.caching = True
+            if args.cache_size > 0:
+                httpd.file_cache = FileCache(args.cache_size * 1024 * 1024)
+        if args.compress or args.precompress:
+            httpd.compressed = CompressedCache(args.compress_cache)
+            if brotli is None:
+                print("brotli module not found, serving gzip only")
+            if args.precompress:
+                count = httpd.compressed.precompress(args.directory, args.workers or os.cpu_count())
+                print(f"Compressed {count} files into {args.compress_cache}")
+        host, port = httpd.socket.getsockname()[:2]
+        url_host = f"[{host}]" if ":" in host else host
+        print(f"Serving HTTP on {host} port {port} (http://{url_host}:{port}/) with {args.workers or 'a thread per connection'} workers ...")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\nKeyboard interrupt received, exiting.")
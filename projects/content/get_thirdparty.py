@@ -1,6 +1,686 @@
-import os
-import os 
-orig_dir = os.path.dirname(__file__)
-os.chdir(orig_dir)
-
-os.system("git clone https://github.com/MissLav/LibreQuake")
+# syncs the third party assets listed in thirdparty.json into this directory.
+#
+# a source is a git repo, an archive (url or path, zip or tar) or a local
+# directory. thirdparty.lock.json pins every source to a git commit or
+# archive hash and records the sha256, mode and size of each file it
+# provides; it's written on the first sync and by --update, commit it.
+# git revisions in thirdparty.json should be commits as well, a branch only
+# gets pinned by the lock. Without a lock entry a failed fetch, or
+# --offline, falls back to the revision the cache fetched last.
+#
+# content goes through a cache shared by all workspaces on the machine,
+# $NEONWOOD_THIRDPARTY_CACHE or ~/.cache/neonwood/thirdparty by default:
+#   git/<name>.git      shallow bare mirror of each git source
+#   archives/<sha256>   downloaded archives
+#   objects/xx/xxxx...  file contents, named by their sha256
+# workspaces get reflinks or hardlinks into objects/. Each synced directory
+# has a .thirdparty.json remembering what was placed there, a file whose
+# size, mtime and inode still match is trusted, anything else is hashed
+# and only replaced when the hash is off. When everything matches nothing
+# is fetched at all. Sources that do need fetching are fetched in
+# parallel.
+#
+#   python get_thirdparty.py
+#   python get_thirdparty.py --mirror /srv/mirrors     (holding LibreQuake.git)
+#   python get_thirdparty.py --offline --verify
+#   python get_thirdparty.py --update LibreQuake
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import tarfile
+import threading
+import urllib.parse
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+defaultManifest = os.path.join(here, 'thirdparty.json')
+
+sourceTypes = ['git', 'archive', 'path']
+
+# manifest keys that decide what a source provides, the lock entry is only
+# reused while these are unchanged
+sourceKeys = ['type', 'url', 'path', 'revision', 'sha256', 'paths', 'strip']
+
+linkModes = ['auto', 'reflink', 'hardlink', 'copy']
+
+# linux FICLONE, a copy on write clone on btrfs, xfs and friends
+FICLONE = 0x40049409
+
+stampName = '.thirdparty.json'
+
+symlinkMode = '120000'
+executableMode = '100755'
+fileMode = '100644'
+
+
+class FetchError(Exception):
+    pass
+
+
+def defaultCacheDir():
+    if os.environ.get('NEONWOOD_THIRDPARTY_CACHE'):
+        return os.environ['NEONWOOD_THIRDPARTY_CACHE']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'neonwood', 'thirdparty')
+
+
+def readJson(path, default):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except ValueError as e:
+        raise FetchError(f'{path}: {e}')
+
+
+def writeJson(path, data):
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, path)
+
+
+def hashBytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hashFile(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def matchesPaths(path, paths):
+    return not paths or any(path == p.rstrip('/') or path.startswith(p.rstrip('/') + '/') for p in paths)
+
+
+# content store
+
+def objectPath(cacheDir, digest, mode):
+    # executables get their own copy, the store is shared through hardlinks
+    suffix = '.x' if mode == executableMode else ''
+    return os.path.join(cacheDir, 'objects', digest[:2], digest[2:] + suffix)
+
+
+def storeBytes(cacheDir, data, mode):
+    # returns the sha256 of data, writing it to the store unless it's there
+    digest = hashBytes(data)
+    path = objectPath(cacheDir, digest, mode)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        # shared with every workspace through hardlinks, keep it intact
+        os.chmod(tmp, 0o555 if mode == executableMode else 0o444)
+        os.replace(tmp, path)
+    return digest
+
+
+def inStore(cacheDir, digest, mode, verify=False):
+    path = objectPath(cacheDir, digest, mode)
+    if not os.path.exists(path):
+        return False
+    if verify and hashFile(path) != digest:
+        # damaged, e.g. written to through a hardlink, fetch it again
+        os.unlink(path)
+        return False
+    return True
+
+
+# git sources
+
+def git(*args, cwd=None):
+    result = subprocess.run(['git', *args], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise FetchError(f'git {" ".join(args)}: {result.stderr.decode(errors="replace").strip()}')
+    return result.stdout
+
+
+def mirrorDir(cacheDir, name):
+    path = os.path.join(cacheDir, 'git', name + '.git')
+    if not os.path.isdir(path):
+        os.makedirs(path)
+        git('init', '--quiet', '--bare', path)
+    return path
+
+
+def cachedRef(name):
+    return 'refs/thirdparty/' + name
+
+
+def isCommitId(revision):
+    return re.fullmatch(r'[0-9a-f]{40}', revision) is not None
+
+
+def cachedCommit(mirror, name, revision):
+    # what the last fetch left behind, when it can stand in for revision
+    if isCommitId(revision):
+        return revision if hasCommit(mirror, revision) else None
+    try:
+        return git('rev-parse', '--verify', '--quiet', cachedRef(name) + '^{commit}', cwd=mirror).decode().strip()
+    except FetchError:
+        return None
+
+
+def hasCommit(mirror, commit):
+    try:
+        git('cat-file', '-e', commit + '^{commit}', cwd=mirror)
+        return True
+    except FetchError:
+        return False
+
+
+def gitFetch(mirror, name, source, revision):
+    # only the wanted revision, without history
+    if os.path.isdir(source):
+        # plain paths skip the shallow negotiation, file:// doesn't
+        source = 'file://' + os.path.abspath(source)
+    git('fetch', '--quiet', '--no-tags', '--depth', '1', source, f'+{revision}:{cachedRef(name)}', cwd=mirror)
+    return git('rev-parse', '--verify', cachedRef(name) + '^{commit}', cwd=mirror).decode().strip()
+
+
+def listTree(mirror, commit, paths):
+    # [(mode, blob id, path)] of the files under paths
+    out = git('ls-tree', '-r', '-z', '--full-tree', commit, '--', *paths, cwd=mirror)
+    entries = []
+    for record in out.split(b'\0'):
+        if not record:
+            continue
+        meta, path = record.split(b'\t', 1)
+        mode, kind, blob = meta.decode().split()
+        # submodules have no content here
+        if kind == 'blob':
+            entries.append((mode, blob, path.decode()))
+    return entries
+
+
+def readBlobs(mirror, blobs):
+    # yields (blob id, content) through one git cat-file
+    proc = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=mirror, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def request():
+        # from a thread, git blocks writing blobs while nobody reads them
+        try:
+            with proc.stdin:
+                proc.stdin.write(''.join(blob + '\n' for blob in blobs).encode())
+        except BrokenPipeError:
+            pass
+
+    writer = threading.Thread(target=request)
+    writer.start()
+    done = False
+    try:
+        for blob in blobs:
+            header = proc.stdout.readline().split()
+            if len(header) != 3 or header[0].decode() != blob:
+                raise FetchError(f'{blob} is missing from {mirror}')
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)
+            yield blob, data
+        done = True
+    finally:
+        if not done:
+            proc.kill()
+        writer.join()
+        proc.stdout.close()
+        proc.wait()
+
+
+def fetchGit(cacheDir, name, source, pinned, options):
+    # returns (commit, {path: [sha256, mode, size]}) with every file stored
+    mirror = mirrorDir(cacheDir, name)
+    upstream = options.mirrorFor(name, source['url'])
+    # a pin from the lock has to be that exact commit, a manifest revision
+    # falls back to whatever was fetched for it last
+    cached = None if pinned is not None else cachedCommit(mirror, name, source['revision'])
+    if pinned is not None and hasCommit(mirror, pinned):
+        commit = pinned
+    elif options.offline:
+        if cached is None:
+            raise FetchError(f'{pinned or source["revision"]} is not in the cache at {cacheDir}, run once online or pass --mirror')
+        commit = cached
+    else:
+        try:
+            commit = gitFetch(mirror, name, upstream, pinned or source['revision'])
+        except FetchError as e:
+            if cached is None:
+                raise
+            print(f'{name}: fetch failed, using the cached revision ({e})', file=sys.stderr)
+            commit = cached
+    if pinned is None and not isCommitId(source['revision']):
+        print(f'{name}: revision {source["revision"]} is not pinned, set it to {commit} in thirdparty.json', file=sys.stderr)
+
+    # git blob id -> sha256, so a blob is only hashed once
+    indexPath = os.path.join(cacheDir, 'git', name + '.index.json')
+    index = readJson(indexPath, {})
+    entries = listTree(mirror, commit, source['paths'])
+    missing = [blob for mode, blob, _ in entries if blob not in index or not inStore(cacheDir, index[blob][0], mode, options.verify)]
+    modes = {}
+    for mode, blob, _ in entries:
+        modes.setdefault(blob, set()).add(mode)
+    if missing:
+        for blob, data in readBlobs(mirror, sorted(set(missing))):
+            for mode in modes[blob]:
+                digest = storeBytes(cacheDir, data, mode)
+            index[blob] = [digest, len(data)]
+        writeJson(indexPath, index)
+    files = {path: [index[blob][0], mode, index[blob][1]] for mode, blob, path in entries}
+    return commit, files
+
+
+# archive sources
+
+def archiveName(url):
+    return os.path.basename(urllib.parse.urlparse(url).path) or 'archive'
+
+
+def fetchArchive(cacheDir, name, source, pinned, options):
+    # returns (archive sha256, files)
+    location = source.get('url') or os.path.join(here, source['path'])
+    expected = pinned or source.get('sha256')
+    archives = os.path.join(cacheDir, 'archives')
+    os.makedirs(archives, exist_ok=True)
+    cached = os.path.join(archives, expected) if expected else None
+    if cached is None or not os.path.exists(cached):
+        location = options.mirrorFor(archiveName(location), location)
+        if options.offline and '://' in location and not location.startswith('file://'):
+            raise FetchError(f'{archiveName(location)} is not in the cache at {cacheDir}, run once online or pass --mirror')
+        tmp = os.path.join(archives, f'.{name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        if '://' in location:
+            with urllib.request.urlopen(location) as response, open(tmp, 'wb') as f:
+                shutil.copyfileobj(response, f)
+        else:
+            shutil.copyfile(location, tmp)
+        digest = hashFile(tmp)
+        if expected and digest != expected:
+            os.unlink(tmp)
+            raise FetchError(f'{location} has sha256 {digest}, expected {expected}')
+        cached = os.path.join(archives, digest)
+        os.replace(tmp, cached)
+        expected = digest
+
+    strip = source.get('strip', 0)
+    files = {}
+
+    def add(member, data, mode):
+        parts = member.strip('/').split('/')[strip:]
+        path = '/'.join(parts)
+        if parts and '..' not in parts and matchesPaths(path, source['paths']):
+            files[path] = [storeBytes(cacheDir, data, mode), mode, len(data)]
+
+    if zipfile.is_zipfile(cached):
+        with zipfile.ZipFile(cached) as z:
+            for info in z.infolist():
+                if not info.is_dir():
+                    executable = (info.external_attr >> 16) & 0o111
+                    add(info.filename, z.read(info), executableMode if executable else fileMode)
+    else:
+        with tarfile.open(cached) as t:
+            for info in t:
+                if info.issym():
+                    add(info.name, info.linkname.encode(), symlinkMode)
+                elif info.isfile():
+                    add(info.name, t.extractfile(info).read(), executableMode if info.mode & 0o111 else fileMode)
+    return expected, files
+
+
+# local directory sources
+
+def fetchPath(cacheDir, name, source, pinned, options):
+    # returns (None, files), only files changed since the last run are hashed
+    root = os.path.join(here, source['path'])
+    if not os.path.isdir(root):
+        raise FetchError(f'{root} is not a directory')
+    indexPath = os.path.join(cacheDir, 'paths', name + '.json')
+    index = readJson(indexPath, {})
+    files = {}
+    seen = {}
+    for directory, dirs, names in os.walk(root):
+        dirs.sort()
+        for fileName in sorted(names):
+            full = os.path.join(directory, fileName)
+            path = os.path.relpath(full, root).replace(os.sep, '/')
+            if not matchesPaths(path, source['paths']):
+                continue
+            st = os.lstat(full)
+            if stat.S_ISLNK(st.st_mode):
+                mode = symlinkMode
+            elif not stat.S_ISREG(st.st_mode):
+                continue
+            else:
+                mode = executableMode if st.st_mode & 0o111 else fileMode
+            key = [st.st_size, st.st_mtime_ns, mode]
+            known = index.get(path)
+            if known is not None and known[1:] == key and not options.verify and inStore(cacheDir, known[0], mode):
+                digest = known[0]
+            elif mode == symlinkMode:
+                digest = storeBytes(cacheDir, os.readlink(full).encode(), mode)
+            else:
+                with open(full, 'rb') as f:
+                    digest = storeBytes(cacheDir, f.read(), mode)
+            seen[path] = [digest, *key]
+            files[path] = [digest, mode, st.st_size]
+    if seen != index:
+        os.makedirs(os.path.dirname(indexPath), exist_ok=True)
+        writeJson(indexPath, seen)
+    return None, files
+
+
+fetchers = {
+    'git': fetchGit,
+    'archive': fetchArchive,
+    'path': fetchPath,
+}
+
+
+# workspace
+
+def reflink(src, dst):
+    if fcntl is None:
+        raise OSError('reflinks need fcntl')
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.unlink(dst)
+            raise
+    shutil.copymode(src, dst)
+
+
+def placeFile(src, dst, how):
+    # returns how the file got there
+    if how in ('auto', 'reflink'):
+        try:
+            reflink(src, dst)
+            return 'reflink'
+        except OSError:
+            if how == 'reflink':
+                raise
+    if how in ('auto', 'hardlink'):
+        try:
+            os.link(src, dst)
+            return 'hardlink'
+        except OSError:
+            if how == 'hardlink':
+                raise
+    shutil.copy(src, dst)
+    return 'copy'
+
+
+def removeFile(path, root):
+    os.unlink(path)
+    directory = os.path.dirname(path)
+    while directory != root:
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+        directory = os.path.dirname(directory)
+
+
+def workspacePath(dest, path):
+    # dest/path, refusing anything that would write outside dest: odd
+    # components, or a directory on the way that is a symlink
+    parts = path.split('/')
+    if any(part in ('', '.', '..') for part in parts) or '\\' in path or ':' in parts[0]:
+        raise FetchError(f'refusing to place {path!r} outside {dest}')
+    directory = dest
+    for part in parts[:-1]:
+        directory = os.path.join(directory, part)
+        if os.path.islink(directory):
+            raise FetchError(f'refusing to place {path} through the symlink {directory}')
+    return os.path.join(dest, *parts)
+
+
+def checkLinkTarget(dest, path, linkTarget):
+    # symlinks have to stay inside dest, both as written and once resolved
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(path), linkTarget))
+    if posixpath.isabs(linkTarget) or '\\' in linkTarget or resolved == '..' or resolved.startswith('../'):
+        raise FetchError(f'refusing the symlink {path} -> {linkTarget}, it leaves {dest}')
+
+
+def fileState(st):
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def isCurrent(target, want, recorded, verify):
+    # want is [sha256, mode, size], recorded the stamp entry from last time
+    try:
+        st = os.lstat(target)
+    except FileNotFoundError:
+        return False
+    digest, mode, size = want
+    if mode == symlinkMode:
+        return stat.S_ISLNK(st.st_mode) and hashBytes(os.readlink(target).encode()) == digest
+    if not stat.S_ISREG(st.st_mode) or st.st_size != size:
+        return False
+    if not verify and recorded == [digest] + fileState(st):
+        return True
+    return hashFile(target) == digest
+
+
+def outdated(dest, files, stamp, verify):
+    # paths of files that need placing, the rest is checked and current
+    recorded = stamp.get('files', {})
+    return [path for path, want in sorted(files.items())
+            if not isCurrent(os.path.join(dest, *path.split('/')), want, recorded.get(path), verify)]
+
+
+def checkout(cacheDir, dest, files, stamp, todo, how):
+    # places todo, removes files no longer provided and rewrites the stamp.
+    # returns {placement: count}
+    recorded = stamp.get('files', {})
+    counts = {}
+    os.makedirs(dest, exist_ok=True)
+    links = []
+    for path in todo:
+        digest, mode, _ = files[path]
+        target = workspacePath(dest, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.lexists(target):
+            os.unlink(target)
+        src = objectPath(cacheDir, digest, mode)
+        if mode == symlinkMode:
+            with open(src) as f:
+                linkTarget = f.read()
+            checkLinkTarget(dest, path, linkTarget)
+            os.symlink(linkTarget, target)
+            links.append(target)
+            placed = 'symlink'
+        else:
+            placed = placeFile(src, target, how)
+        counts[placed] = counts.get(placed, 0) + 1
+
+    # links through other links can still climb out, e.g. a -> . and b -> a/..
+    root = os.path.realpath(dest)
+    for target in links:
+        resolved = os.path.realpath(target)
+        if os.path.commonpath([root, resolved]) != root:
+            os.unlink(target)
+            raise FetchError(f'refusing the symlink {target}, it resolves to {resolved} outside {dest}')
+
+    for path in recorded:
+        if path not in files:
+            target = workspacePath(dest, path)
+            if os.path.lexists(target):
+                removeFile(target, dest)
+            counts['removed'] = counts.get('removed', 0) + 1
+
+    entries = {}
+    for path, (digest, mode, _) in files.items():
+        target = os.path.join(dest, *path.split('/'))
+        entries[path] = [digest] + fileState(os.lstat(target))
+    writeJson(os.path.join(dest, stampName), {'files': entries})
+    return counts
+
+
+# sync
+
+class Options:
+    def __init__(self, cacheDir, mirror=None, offline=False, update=False, verify=False, how='auto'):
+        self.cacheDir = cacheDir
+        self.mirror = mirror
+        self.offline = offline
+        self.update = update
+        self.verify = verify
+        self.how = how
+
+    def mirrorFor(self, name, location):
+        # --mirror is a directory holding <name>.git repos and archives by
+        # their file name, whatever it lacks comes from upstream
+        if self.mirror is not None:
+            for candidate in (os.path.join(self.mirror, name + '.git'), os.path.join(self.mirror, name)):
+                if os.path.exists(candidate):
+                    return candidate
+        return location
+
+
+def normalizeSource(entry):
+    source = dict(entry)
+    if source.get('type') not in sourceTypes:
+        raise FetchError(f'{source.get("name")}: type must be one of {", ".join(sourceTypes)}')
+    if source['type'] == 'git' and not source.get('url'):
+        raise FetchError(f'{source["name"]}: git sources need a url')
+    if source['type'] != 'git' and not (source.get('url') or source.get('path')):
+        raise FetchError(f'{source["name"]}: {source["type"]} sources need a url or path')
+    source.setdefault('revision', 'HEAD')
+    source.setdefault('paths', [])
+    source.setdefault('dest', source['name'])
+    return source
+
+
+def sourceKey(source):
+    return {key: source[key] for key in sourceKeys if key in source}
+
+
+def syncSource(source, locked, options):
+    # returns (lock entry, summary line)
+    name = source['name']
+    dest = os.path.join(here, source['dest'])
+    if os.path.isdir(os.path.join(dest, '.git')):
+        return locked, f'{name}: is a git clone, leaving it alone. Delete it to use the shared cache instead'
+
+    fetcher = fetchers[source['type']]
+    stamp = readJson(os.path.join(dest, stampName), {})
+    reuse = (locked is not None and locked.get('source') == sourceKey(source)
+             and not options.update and source['type'] != 'path')
+    fetched = False
+    if reuse:
+        files = locked['files']
+        todo = outdated(dest, files, stamp, options.verify)
+        stale = [path for path in stamp.get('files', {}) if path not in files]
+        if not todo and not stale:
+            return locked, f'{name}: {len(files)} files up to date'
+        revision = locked['revision']
+    else:
+        revision, files = fetcher(options.cacheDir, name, source, None, options)
+        fetched = True
+        for wanted in source['paths']:
+            if not any(matchesPaths(path, [wanted]) for path in files):
+                raise FetchError(f'nothing at {wanted} in {revision or source.get("path")}')
+        todo = outdated(dest, files, stamp, options.verify)
+        stale = [path for path in stamp.get('files', {}) if path not in files]
+        if not todo and not stale and locked is not None and locked.get('files') == files:
+            return locked, f'{name}: {len(files)} files up to date'
+
+    # only go to the source for content the store lacks. A workspace file
+    # that fails its hash may have been written to through a hardlink, so
+    # its store object is rehashed and dropped when it's damaged as well
+    missing = [path for path in todo if not inStore(options.cacheDir, files[path][0], files[path][1],
+                                                    options.verify or os.path.lexists(os.path.join(dest, *path.split('/'))))]
+    if missing:
+        pinned, fetchedFiles = fetcher(options.cacheDir, name, source, revision, options)
+        if fetchedFiles != files:
+            raise FetchError(f'{revision} no longer matches thirdparty.lock.json, rerun with --update')
+        fetched = True
+
+    counts = checkout(options.cacheDir, dest, files, stamp, todo, options.how)
+    entry = {'source': sourceKey(source), 'revision': revision, 'files': files}
+    summary = ', '.join(f'{n} {kind}' for kind, n in sorted(counts.items())) or 'nothing to do'
+    at = f' at {revision[:12]}' if revision else ''
+    return entry, f'{name}: {len(files)} files{at}, {"fetched" if fetched else "from cache"} ({summary})'
+
+
+def sync(manifestPath, lockPath, options, only=None, jobs=None):
+    # returns False when a source failed
+    manifest = readJson(manifestPath, None)
+    if manifest is None:
+        raise FetchError(f'{manifestPath} not found')
+    sources = [normalizeSource(entry) for entry in manifest.get('sources', [])]
+    names = [source['name'] for source in sources]
+    for name in only or []:
+        if name not in names:
+            raise FetchError(f'{name} is not in {manifestPath}')
+    lock = readJson(lockPath, {})
+    newLock = {name: entry for name, entry in lock.items() if name in names}
+
+    ok = True
+    selected = [source for source in sources if not only or source['name'] in only]
+    with ThreadPoolExecutor(jobs or min(8, len(selected) or 1)) as pool:
+        futures = {pool.submit(syncSource, source, lock.get(source['name']), options): source['name'] for source in selected}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                entry, summary = future.result()
+            except (FetchError, OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+                print(f'{name}: {e}', file=sys.stderr)
+                ok = False
+                continue
+            print(summary)
+            if entry is not None:
+                newLock[name] = entry
+    if newLock != lock:
+        writeJson(lockPath, newLock)
+        print(f'wrote {os.path.basename(lockPath)}, commit it so every checkout gets the same files')
+    return ok
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='syncs the third party assets in thirdparty.json through a cache shared by all workspaces')
+    parser.add_argument('only', nargs='*', help='only sync these sources')
+    parser.add_argument('--manifest', default=defaultManifest, help='source list, thirdparty.json next to this script by default')
+    parser.add_argument('--lock', help='pinned revisions and file hashes, <manifest>.lock.json by default')
+    parser.add_argument('--cache', default=defaultCacheDir(), help='cache directory, defaults to $NEONWOOD_THIRDPARTY_CACHE or ~/.cache/neonwood/thirdparty')
+    parser.add_argument('--mirror', help='directory of <name>.git mirrors and archives to fetch from instead of upstream')
+    parser.add_argument('--offline', action='store_true', help='never fetch, fail for content the cache lacks')
+    parser.add_argument('--update', action='store_true', help='fetch the manifest revisions again and rewrite their pins')
+    parser.add_argument('--verify', action='store_true', help='hash every file instead of trusting size, mtime and inode')
+    parser.add_argument('--link', choices=linkModes, default='auto', help='how files get from the cache into the workspace, auto tries reflink, hardlink, copy')
+    parser.add_argument('--jobs', '-j', type=int, help='sources synced at once, up to 8 by default')
+    args = parser.parse_args(argv[1:])
+
+    lockPath = args.lock or os.path.splitext(args.manifest)[0] + '.lock.json'
+    options = Options(args.cache, args.mirror, args.offline, args.update, args.verify, args.link)
+    try:
+        ok = sync(args.manifest, lockPath, options, args.only, args.jobs)
+    except FetchError as e:
+        print(e, file=sys.stderr)
+        ok = False
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(sys.argv)